@@ -137,6 +137,8 @@ def embeddings_rebuild_vss(
     import os
     import sqlite3
 
+    from bartholomew.kernel.vector_store import iter_vss_rows
+
     console.print(f"\n[bold]Rebuilding VSS for {db}[/bold]\n")
 
     if not os.path.exists(db):
@@ -183,7 +185,7 @@ def embeddings_rebuild_vss(
                 """
                 CREATE TRIGGER trg_mememb_insert
                 AFTER INSERT ON memory_embeddings
-                WHEN NEW.dim = 384
+                WHEN NEW.dim = 384 AND length(NEW.vec) = NEW.dim * 4
                 BEGIN
                     INSERT INTO memory_embeddings_vss(rowid, vec)
                     VALUES (NEW.embedding_id, NEW.vec);
@@ -202,7 +204,7 @@ def embeddings_rebuild_vss(
 
                     INSERT INTO memory_embeddings_vss(rowid, vec)
                     SELECT NEW.embedding_id, NEW.vec
-                    WHERE NEW.dim = 384;
+                    WHERE NEW.dim = 384 AND length(NEW.vec) = NEW.dim * 4;
                 END
             """,
             )
@@ -222,17 +224,21 @@ def embeddings_rebuild_vss(
 
             # Populate with existing 384-dim vectors
             console.print("Populating VSS table...")
-            cursor = conn.execute(
-                """
-                INSERT INTO memory_embeddings_vss(rowid, vec)
-                SELECT embedding_id, vec
-                FROM memory_embeddings
-                WHERE dim = 384
-            """,
+            rows = list(iter_vss_rows(conn, 384))
+            conn.executemany(
+                "INSERT INTO memory_embeddings_vss(rowid, vec) VALUES (?, ?)",
+                rows,
             )
-            count = cursor.rowcount
             conn.commit()
-            console.print(f"✓ Inserted {count} vectors")
+            console.print(f"✓ Inserted {len(rows)} vectors")
+            (total,) = conn.execute(
+                "SELECT COUNT(*) FROM memory_embeddings WHERE dim = 384",
+            ).fetchone()
+            if total > len(rows):
+                console.print(
+                    f"[yellow]Skipped {total - len(rows)} vectors with an "
+                    "unexpected byte length[/yellow]",
+                )
 
             console.print("\n[green]VSS rebuild complete![/green]\n")
     except Exception as e:
@@ -57,6 +57,7 @@ class KernelDaemon:
             experience_kernel=self.experience,
             workspace=self.workspace,
             db_path=db_path,
+            switch_log_async=True,
         )
 
         # Task handles for lifecycle management
@@ -99,6 +100,7 @@ class KernelDaemon:
         )
 
         # Start background tasks
+        self.mem.start_periodic_checkpoint()
         self._tick_task = asyncio.create_task(self._system_tick())
         self._consumer_task = asyncio.create_task(self._system_consumer())
         self._dream_task = asyncio.create_task(self._dream_loop())
@@ -184,6 +186,16 @@ class KernelDaemon:
                 except (asyncio.TimeoutError, asyncio.CancelledError):
                     pass
 
+        # Stage 3: Stop narrating, then commit any write-behind episodes
+        try:
+            self.narrator.unsubscribe_all()
+            self.narrator.close()
+        except Exception as e:
+            print(f"[Kernel] Failed to flush narrator episodes: {e}")
+
+        # Release persona switch-log connections
+        self.persona_manager.close()
+
         # Close memory store (checkpoint WAL)
         await self.mem.close()
 
@@ -25,6 +25,7 @@ class EmbeddingConfig:
     provider: str  # 'local-sbert', 'openai', etc.
     model: str  # Model identifier
     dim: int  # Embedding dimension
+    storage_dtype: str = "float32"  # On-disk vector encoding: 'float32' or 'float16'
 
 
 class EmbeddingProvider:
@@ -355,6 +356,7 @@ class EmbeddingEngineFactory:
         provider = "local-sbert"
         model = "BAAI/bge-small-en-v1.5"
         dim = 384
+        storage_dtype = "float32"
 
         if not self._config_path:
             return EmbeddingConfig(provider=provider, model=model, dim=dim)
@@ -369,10 +371,16 @@ class EmbeddingEngineFactory:
             provider = emb.get("default_provider", provider)
             model = emb.get("default_model", model)
             dim = emb.get("default_dim", dim)
+            storage_dtype = emb.get("storage_dtype", storage_dtype)
         except Exception as e:
             logger.warning(f"Failed to load embeddings.yaml: {e}, using defaults")
 
-        return EmbeddingConfig(provider=provider, model=model, dim=dim)
+        return EmbeddingConfig(
+            provider=provider,
+            model=model,
+            dim=dim,
+            storage_dtype=storage_dtype,
+        )
 
     def _show_banner_once(self) -> None:
         """Show startup banner exactly once when env gate is ON"""
@@ -14,8 +14,17 @@ SENSITIVE_KEYWORDS = [
 ]
 
 
+# Frozen copy for the hot path; substring checks on one lowered string
+# beat a combined regex alternation under CPython's backtracking re
+_KEYWORDS = tuple(SENSITIVE_KEYWORDS)
+
+
 def is_sensitive(text: str) -> bool:
-    return any(keyword in text.lower() for keyword in SENSITIVE_KEYWORDS)
+    lowered = text.lower()
+    for keyword in _KEYWORDS:
+        if keyword in lowered:
+            return True
+    return False
 
 
 async def request_permission_to_store(text: str) -> bool:
@@ -1,16 +1,32 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import functools
 import json
 import logging
+import os
+import sqlite3
+import time
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
 
 import aiosqlite
 import numpy as np
+import yaml
+
+
+try:
+    import orjson  # Optional: faster JSON for nudge/reflection columns
+except ImportError:  # pragma: no cover
+    orjson = None
 
 from bartholomew.kernel import encryption_engine as _encryption_module
 from bartholomew.kernel.chunking_engine import get_chunking_engine
+from bartholomew.kernel.db_ctx import wal_checkpoint_truncate
+from bartholomew.kernel.embedding_engine import get_embedding_engine
+from bartholomew.kernel.fts_client import FTSClient
 from bartholomew.kernel.memory.privacy_guard import (
     is_sensitive,
     request_permission_to_store,
@@ -19,27 +35,47 @@ from bartholomew.kernel.memory_rules import _rules_engine
 from bartholomew.kernel.policy import can_index
 from bartholomew.kernel.redaction_engine import apply_redaction
 from bartholomew.kernel.summarization_engine import _summarization_engine
+from bartholomew.kernel.vector_store import VectorStore
 
 
 logger = logging.getLogger(__name__)
 
+# Prefer libyaml's C loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Repository-level kernel config, resolved once at import
+_KERNEL_CONFIG_PATH = Path(__file__).resolve().parent.parent.parent / "config" / "kernel.yaml"
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize to a JSON string, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _json_loads(data: str | bytes) -> Any:
+    """Parse a JSON string, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
+
+@functools.lru_cache(maxsize=1)
 def _load_fts_index_mode() -> str:
     """
     Load FTS index mode from kernel.yaml configuration.
 
+    The result is cached for the lifetime of the process; call
+    ``_load_fts_index_mode.cache_clear()`` after editing kernel.yaml.
+
     Returns:
         Index mode: 'summary_preferred' (default) or 'redacted_only'
     """
-    import os
-
-    import yaml
-
     try:
-        config_path = os.path.join(os.path.dirname(__file__), "..", "..", "config", "kernel.yaml")
-        if os.path.exists(config_path):
-            with open(config_path) as f:
-                config = yaml.safe_load(f)
+        if _KERNEL_CONFIG_PATH.is_file():
+            with _KERNEL_CONFIG_PATH.open("rb") as f:
+                config = yaml.load(f, Loader=_YAML_LOADER)
                 if config and "fts" in config:
                     return config["fts"].get("index_mode", "summary_preferred")
     except Exception as e:
@@ -48,7 +84,7 @@ def _load_fts_index_mode() -> str:
     return "summary_preferred"
 
 
-@dataclass
+@dataclass(slots=True)
 class StoreResult:
     """Result of a memory storage operation"""
 
@@ -58,11 +94,121 @@ class StoreResult:
     created_or_updated: str = "created"  # "created" or "updated"
 
 
+@dataclass(slots=True)
+class _PreparedPayload:
+    """Values derived from a memory before it is written to the database"""
+
+    evaluated: dict[str, Any]
+    redacted_value: str
+    summary: str | None
+    index_text: str
+    value_to_store: str
+    sensitive: bool
+    # Pre-encryption text reused as embedding input
+    plain_value: str
+    plain_summary: str | None
+
+
+def _prepare_payload(kind: str, key: str, value: str, ts: str) -> _PreparedPayload | None:
+    """
+    Run the synchronous rule/redaction/summary/encryption pipeline.
+
+    Intended to be called via ``asyncio.to_thread`` so the CPU-bound work
+    does not block the event loop.
+
+    Returns:
+        The prepared payload, or None if governance rules block storage
+    """
+    # Rule evaluation: check governance rules first
+    memory_dict = {
+        "kind": kind,
+        "key": key,
+        "value": value,
+        "ts": ts,
+    }
+    evaluated = _rules_engine.evaluate(memory_dict)
+
+    if not _rules_engine.should_store(evaluated):
+        return None
+
+    # Apply redaction if required by rules (Phase 2a)
+    redacted_value = value
+    if evaluated.get("redact_strategy"):
+        redacted_value = apply_redaction(value, evaluated)
+
+    # Phase 2c: Generate summary if required (before encryption)
+    summary = None
+    summary_mode = evaluated.get("summary_mode", "summary_also")
+
+    # Keep pre-encryption text so embeddings don't redo this work
+    plain_value = redacted_value
+    plain_summary = None
+
+    if _summarization_engine.should_summarize(evaluated, redacted_value, kind):
+        summary = _summarization_engine.summarize(redacted_value)
+        plain_summary = summary
+
+        # Handle summary_only mode: replace value with summary
+        if summary_mode == "summary_only":
+            redacted_value = summary
+            summary = None  # Don't store separate summary
+
+    # Phase 2e: Compute FTS index text (before encryption)
+    # NEVER index raw/unredacted/blocked content
+    # Use summary if available and preferred, otherwise use redacted value
+    # Only fall back to kernel.yaml when the rule does not set a mode
+    fts_index_mode = evaluated.get("fts_index_mode") or _load_fts_index_mode()
+    index_text = summary if summary and fts_index_mode == "summary_preferred" else redacted_value
+
+    # Apply encryption if required by rules (Phase 2b)
+    # Start with redacted_value, replace with encrypted if needed
+    value_to_store = redacted_value
+    cipher = _encryption_module._encryption_engine.encrypt_for_policy(
+        redacted_value,
+        evaluated,
+        {"kind": kind, "key": key, "ts": ts},
+    )
+    if cipher is not None:
+        value_to_store = cipher
+
+    # Encrypt summary if present and encryption is enabled
+    if summary is not None:
+        cipher_summary = _encryption_module._encryption_engine.encrypt_for_policy(
+            summary,
+            evaluated,
+            {"kind": kind, "key": key + "::summary", "ts": ts},
+        )
+        if cipher_summary is not None:
+            summary = cipher_summary
+
+    return _PreparedPayload(
+        evaluated=evaluated,
+        redacted_value=redacted_value,
+        summary=summary,
+        index_text=index_text,
+        value_to_store=value_to_store,
+        sensitive=is_sensitive(value),
+        plain_value=plain_value,
+        plain_summary=plain_summary,
+    )
+
+
+def _prepare_payloads(items: list[dict[str, str]]) -> list[_PreparedPayload | None]:
+    """Run ``_prepare_payload`` over a batch of memory dicts."""
+    return [_prepare_payload(it["kind"], it["key"], it["value"], it["ts"]) for it in items]
+
+
 # Phase 2d: Lazy imports for embeddings (optional feature)
 _embedding_engine = None
 _vector_store = None
 _summary_fallback_warned = False  # Global flag to warn once
 
+# Maximum embedding jobs a single MemoryStore runs at once
+EMBED_CONCURRENCY = 4
+
+# Seconds between passive WAL checkpoints (see start_periodic_checkpoint)
+WAL_CHECKPOINT_INTERVAL = 300.0
+
 
 def _get_embedding_components(db_path: str):
     """
@@ -78,15 +224,10 @@ def _get_embedding_components(db_path: str):
     global _embedding_engine, _vector_store
 
     # Check if embeddings are enabled
-    import os
-
     if not os.getenv("BARTHO_EMBED_ENABLED"):
         return None, None
 
     try:
-        from bartholomew.kernel.embedding_engine import get_embedding_engine
-        from bartholomew.kernel.vector_store import VectorStore
-
         if _embedding_engine is None:
             _embedding_engine = get_embedding_engine()
 
@@ -141,7 +282,14 @@ CREATE TABLE IF NOT EXISTS nudges (
   created_ts TEXT NOT NULL,
   acted_ts TEXT
 );
-CREATE INDEX IF NOT EXISTS idx_nudges_status_ts ON nudges(status, created_ts);
+-- Index-only scan for list_pending_nudges; replaces idx_nudges_status_ts,
+-- which the planner would otherwise prefer for status='pending'
+DROP INDEX IF EXISTS idx_nudges_status_ts;
+CREATE INDEX IF NOT EXISTS idx_nudges_pending_cover
+  ON nudges(created_ts DESC, id, kind, message, actions, reason, status)
+  WHERE status='pending';
+-- Covers nudges_sent_today_count and last_nudge_ts
+CREATE INDEX IF NOT EXISTS idx_nudges_kind_ts ON nudges(kind, created_ts);
 
 CREATE TABLE IF NOT EXISTS reflections (
   id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -155,11 +303,12 @@ CREATE INDEX IF NOT EXISTS idx_reflections_kind_ts
   ON reflections(kind, ts);
 
 CREATE TABLE IF NOT EXISTS memory_consent (
-  memory_id INTEGER PRIMARY KEY,
+  memory_id INTEGER NOT NULL,
   consent_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
   source TEXT,
+  PRIMARY KEY(memory_id),
   FOREIGN KEY(memory_id) REFERENCES memories(id) ON DELETE CASCADE
-);
+) WITHOUT ROWID;
 
 CREATE TABLE IF NOT EXISTS system_flags (
   key TEXT PRIMARY KEY,
@@ -168,29 +317,87 @@ CREATE TABLE IF NOT EXISTS system_flags (
 );
 """
 
+# Hot-path SQL kept as module constants so every call hands sqlite3 the
+# identical statement text and hits its per-connection statement cache
+STATEMENT_CACHE_SIZE = 256
+
+_UPSERT_MEMORY_SQL = (
+    "INSERT INTO memories(kind,key,value,summary,ts) "
+    "VALUES(?,?,?,?,?) "
+    "ON CONFLICT(kind,key) DO UPDATE SET "
+    "value=excluded.value, summary=excluded.summary, "
+    "ts=excluded.ts"
+)
+_UPSERT_MEMORY_RETURNING_SQL = _UPSERT_MEMORY_SQL + " RETURNING id"
+_SELECT_MEMORY_ID_SQL = "SELECT id FROM memories WHERE kind=? AND key=?"
+_DELETE_MEMORY_RETURNING_SQL = "DELETE FROM memories WHERE kind=? AND key=? RETURNING id"
+_FTS_MAP_INSERT_SQL = "INSERT OR IGNORE INTO memory_fts_map(memory_id) VALUES (?)"
+_FTS_MAP_DELETE_SQL = "DELETE FROM memory_fts_map WHERE memory_id = ?"
+_FTS_DELETE_SQL = (
+    "INSERT INTO memory_fts(memory_fts, rowid, value, summary) VALUES ('delete', ?, '', '')"
+)
+_FTS_INSERT_SQL = "INSERT INTO memory_fts(rowid, value, summary) VALUES (?, ?, NULL)"
+
+# Bump when adding a migration step to MemoryStore._migrate_schema
+SCHEMA_VERSION = 2
+
 
 class MemoryStore:
     def __init__(self, db_path: str) -> None:
         self.db_path = db_path
+        # Caps concurrent embedding jobs across overlapping upserts
+        self._embed_semaphore = asyncio.Semaphore(EMBED_CONCURRENCY)
+        self._checkpoint_task: asyncio.Task | None = None
+
+    async def _migrate_schema(self, db: aiosqlite.Connection, from_version: int) -> None:
+        """Run schema migrations from ``from_version`` up to SCHEMA_VERSION."""
+        for v in range(from_version + 1, SCHEMA_VERSION + 1):
+            if v == 1:
+                # Phase 2c: Add summary column (fresh databases already have it)
+                cursor = await db.execute("PRAGMA table_info(memories)")
+                column_names = [col[1] for col in await cursor.fetchall()]
+                if "summary" not in column_names:
+                    await db.execute("ALTER TABLE memories ADD COLUMN summary TEXT")
+                    logger.info("Migrated memories table: added summary column")
+            elif v == 2:
+                # Rebuild memory_consent as a WITHOUT ROWID table
+                cursor = await db.execute(
+                    "SELECT sql FROM sqlite_master WHERE type='table' AND name='memory_consent'",
+                )
+                row = await cursor.fetchone()
+                if row and "WITHOUT ROWID" not in row[0].upper():
+                    await db.executescript(
+                        """
+                        CREATE TABLE memory_consent_new (
+                          memory_id INTEGER NOT NULL,
+                          consent_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                          source TEXT,
+                          PRIMARY KEY(memory_id),
+                          FOREIGN KEY(memory_id) REFERENCES memories(id) ON DELETE CASCADE
+                        ) WITHOUT ROWID;
+                        INSERT INTO memory_consent_new(memory_id, consent_at, source)
+                          SELECT memory_id, consent_at, source FROM memory_consent;
+                        DROP TABLE memory_consent;
+                        ALTER TABLE memory_consent_new RENAME TO memory_consent;
+                        """,
+                    )
+                    logger.info("Migrated memory_consent to WITHOUT ROWID")
+        await db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
 
     async def init(self) -> None:
         async with aiosqlite.connect(self.db_path) as db:
             await db.executescript(SCHEMA)
 
-            # Phase 2c: Migrate existing databases to add summary column
-            cursor = await db.execute("PRAGMA table_info(memories)")
-            columns = await cursor.fetchall()
-            column_names = [col[1] for col in columns]
-
-            if "summary" not in column_names:
-                await db.execute("ALTER TABLE memories ADD COLUMN summary TEXT")
-                logger.info("Migrated memories table: added summary column")
+            # Schema migrations are gated on PRAGMA user_version so that
+            # already-migrated databases skip straight past them.
+            cursor = await db.execute("PRAGMA user_version")
+            version = (await cursor.fetchone())[0] or 0
+            if version < SCHEMA_VERSION:
+                await self._migrate_schema(db, version)
 
             # Seed parking_brake flag if not exists
             cursor = await db.execute("SELECT 1 FROM system_flags WHERE key = 'parking_brake'")
             if not await cursor.fetchone():
-                import time
-
                 await db.execute(
                     "INSERT INTO system_flags(key, value, updated_at) VALUES (?, ?, ?)",
                     (
@@ -205,8 +412,6 @@ class MemoryStore:
 
         # Phase 2e: Initialize FTS5 tables and triggers
         try:
-            from bartholomew.kernel.fts_client import FTSClient
-
             fts = FTSClient(self.db_path)
             fts.init_schema()
             logger.info("FTS5 schema initialized")
@@ -220,78 +425,20 @@ class MemoryStore:
             logger.warning(f"Failed to initialize FTS5 schema: {e}")
 
     async def upsert_memory(self, kind: str, key: str, value: str, ts: str) -> StoreResult:
-        # Rule evaluation: check governance rules first
-        memory_dict = {
-            "kind": kind,
-            "key": key,
-            "value": value,
-            "ts": ts,
-        }
-        evaluated = _rules_engine.evaluate(memory_dict)
+        # Rules, redaction, summarization and encryption are CPU-bound;
+        # run them in one worker-thread hop so the event loop stays free
+        payload = await asyncio.to_thread(_prepare_payload, kind, key, value, ts)
 
         # Check if storage is blocked by rules
-        if not _rules_engine.should_store(evaluated):
+        if payload is None:
             print(f"[Bartholomew] Memory blocked by governance rules: {kind}/{key}")
             return StoreResult(stored=False)
 
-        # Apply redaction if required by rules (Phase 2a)
-        redacted_value = value
-        if evaluated.get("redact_strategy"):
-            redacted_value = apply_redaction(value, evaluated)
-
-        # Phase 2c: Generate summary if required (before encryption)
-        summary = None
-        summary_mode = evaluated.get("summary_mode", "summary_also")
-
-        if _summarization_engine.should_summarize(evaluated, redacted_value, kind):
-            summary = _summarization_engine.summarize(redacted_value)
-
-            # Handle summary_only mode: replace value with summary
-            if summary_mode == "summary_only":
-                redacted_value = summary
-                summary = None  # Don't store separate summary
-
-        # Phase 2e: Compute FTS index text (before encryption)
-        # NEVER index raw/unredacted/blocked content
-        # Use summary if available and preferred, otherwise use redacted value
-        fts_index_mode = evaluated.get("fts_index_mode", _load_fts_index_mode())
-        index_text = (
-            summary if summary and fts_index_mode == "summary_preferred" else redacted_value
-        )
-
-        # Apply encryption if required by rules (Phase 2b)
-        # Start with redacted_value, replace with encrypted if needed
-        value_to_store = redacted_value
-        cipher = _encryption_module._encryption_engine.encrypt_for_policy(
-            redacted_value,
-            evaluated,
-            {"kind": kind, "key": key, "ts": ts},
-        )
-        if cipher is not None:
-            value_to_store = cipher
-
-        # Encrypt summary if present and encryption is enabled
-        cipher_summary = None
-        if summary is not None:
-            cipher_summary = _encryption_module._encryption_engine.encrypt_for_policy(
-                summary,
-                evaluated,
-                {"kind": kind, "key": key + "::summary", "ts": ts},
-            )
-            if cipher_summary is not None:
-                summary = cipher_summary
-
         # Privacy guard fallback: check for sensitive content
-        if is_sensitive(value):
-            try:
-                allowed = asyncio.run(request_permission_to_store(value))
-            except RuntimeError:
-                # Handles "event loop is already running" errors
-                import nest_asyncio
-
-                nest_asyncio.apply()
-                allowed = asyncio.run(request_permission_to_store(value))
-
+        # upsert_memory already runs on the event loop, so await the
+        # consent prompt directly rather than spinning up a nested loop.
+        if payload.sensitive:
+            allowed = await request_permission_to_store(value)
             if not allowed:
                 print("[Bartholomew] OK, I won't store that kernel memory.")
                 return StoreResult(stored=False)
@@ -299,18 +446,60 @@ class MemoryStore:
         # Prepare result object
         result = StoreResult()
 
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                "INSERT INTO memories(kind,key,value,summary,ts) "
-                "VALUES(?,?,?,?,?) "
-                "ON CONFLICT(kind,key) DO UPDATE SET "
-                "value=excluded.value, summary=excluded.summary, "
-                "ts=excluded.ts",
-                (kind, key, value_to_store, summary, ts),
-            )
+        # Phase 2d: Plan embeddings up front so the model runs on a worker
+        # thread while the row is written and committed
+        embed_engine, vec_store = _get_embedding_components(self.db_path)
+        plan = None
+        if embed_engine and vec_store:
+            plan = self._plan_embeddings(payload, kind, f"{kind}/{key}")
+
+        _, vecs = await asyncio.gather(
+            self._write_memory(result, kind, key, ts, payload),
+            self._embed_in_thread(embed_engine, plan[0] if plan else []),
+        )
+
+        # Phase 2f: Handle chunking OUTSIDE async context (after main Tx)
+        # This creates chunks for long content and indexes them in FTS
+        await self._handle_chunking(
+            result=result,
+            redacted_value=payload.redacted_value,
+            kind=kind,
+            evaluated=payload.evaluated,
+        )
 
-            # Get memory_id for result
-            cursor = await db.execute("SELECT id FROM memories WHERE kind=? AND key=?", (kind, key))
+        # Phase 2d: Persist embeddings OUTSIDE async context
+        # This avoids database locking issues on Windows when VectorStore
+        # uses synchronous sqlite3 while aiosqlite connection was open.
+        if plan and vecs is not None and result.memory_id:
+            _, sources, embed_store = plan
+            try:
+                await self._store_embeddings(
+                    [(result, sources, vecs, embed_store)],
+                    embed_engine,
+                    vec_store,
+                )
+            except Exception as e:
+                logger.error(f"Failed to generate/persist embeddings: {e}")
+
+        return result
+
+    async def _write_memory(
+        self,
+        result: StoreResult,
+        kind: str,
+        key: str,
+        ts: str,
+        payload: _PreparedPayload,
+    ) -> None:
+        """Write one prepared memory and its FTS entry in a single transaction."""
+        evaluated = payload.evaluated
+
+        async with aiosqlite.connect(self.db_path, cached_statements=STATEMENT_CACHE_SIZE) as db:
+            cursor = await db.execute(
+                _UPSERT_MEMORY_RETURNING_SQL,
+                (kind, key, payload.value_to_store, payload.summary, ts),
+            )
+            # Get memory_id for result from the upsert itself
             row = await cursor.fetchone()
             if row:
                 result.memory_id = row[0]
@@ -328,32 +517,30 @@ class MemoryStore:
                 if fts_allowed:
                     # Ensure entry in map table
                     await db.execute(
-                        "INSERT OR IGNORE INTO memory_fts_map(memory_id) VALUES (?)",
+                        _FTS_MAP_INSERT_SQL,
                         (result.memory_id,),
                     )
 
                     # Delete prior FTS content for this rowid
                     await db.execute(
-                        "INSERT INTO memory_fts(memory_fts, rowid, value, "
-                        "summary) VALUES ('delete', ?, '', '')",
+                        _FTS_DELETE_SQL,
                         (result.memory_id,),
                     )
 
                     # Insert sanitized index_text (never raw/unredacted)
                     await db.execute(
-                        "INSERT INTO memory_fts(rowid, value, summary) VALUES (?, ?, NULL)",
-                        (result.memory_id, index_text),
+                        _FTS_INSERT_SQL,
+                        (result.memory_id, payload.index_text),
                     )
                     logger.debug(f"FTS index updated in-Tx for memory {result.memory_id}")
                 else:
                     # Policy denies indexing: remove from FTS in same Tx
                     await db.execute(
-                        "INSERT INTO memory_fts(memory_fts, rowid, value, "
-                        "summary) VALUES ('delete', ?, '', '')",
+                        _FTS_DELETE_SQL,
                         (result.memory_id,),
                     )
                     await db.execute(
-                        "DELETE FROM memory_fts_map WHERE memory_id = ?",
+                        _FTS_MAP_DELETE_SQL,
                         (result.memory_id,),
                     )
                     logger.debug(
@@ -363,56 +550,185 @@ class MemoryStore:
             # Commit transaction (includes base row + FTS changes)
             await db.commit()
 
-        # Phase 2f: Handle chunking OUTSIDE async context (after main Tx)
-        # This creates chunks for long content and indexes them in FTS
-        await self._handle_chunking(
-            result=result,
-            redacted_value=redacted_value,
-            kind=kind,
-            evaluated=evaluated,
-        )
+    async def upsert_memories(self, items: list[dict[str, str]]) -> list[StoreResult]:
+        """
+        Store many memories in a single transaction.
 
-        # Phase 2d: Generate and persist embeddings OUTSIDE async context
-        # This avoids database locking issues on Windows when VectorStore
-        # uses synchronous sqlite3 while aiosqlite connection was open.
-        await self._handle_embeddings(
-            result=result,
-            memory_dict=memory_dict,
-            evaluated=evaluated,
-            kind=kind,
+        Each item is a dict with ``kind``, ``key``, ``value`` and ``ts`` and
+        goes through the same rules, redaction, summarization, encryption
+        and privacy checks as ``upsert_memory``. All accepted rows and their
+        FTS updates are committed together, and embeddings for the whole
+        batch are computed with one ``embed_texts`` call.
+
+        Args:
+            items: Memory dicts to store
+
+        Returns:
+            One StoreResult per item, in input order
+        """
+        payloads = await asyncio.to_thread(_prepare_payloads, items)
+        results = [StoreResult() for _ in items]
+
+        accepted = []
+        for i, (item, payload) in enumerate(zip(items, payloads, strict=True)):
+            if payload is None:
+                print(
+                    "[Bartholomew] Memory blocked by governance rules: "
+                    f"{item['kind']}/{item['key']}",
+                )
+                continue
+            if payload.sensitive:
+                allowed = await request_permission_to_store(item["value"])
+                if not allowed:
+                    print("[Bartholomew] OK, I won't store that kernel memory.")
+                    continue
+            accepted.append(i)
+
+        if not accepted:
+            return results
+
+        # Phase 2d: Plan the whole batch so one embed_texts call can run
+        # on a worker thread while the rows are written
+        embed_engine, vec_store = _get_embedding_components(self.db_path)
+        plans = []
+        if embed_engine and vec_store:
+            for i in accepted:
+                plan = self._plan_embeddings(
+                    payloads[i],
+                    items[i]["kind"],
+                    f"{items[i]['kind']}/{items[i]['key']}",
+                )
+                if plan is not None:
+                    plans.append((i, *plan))
+
+        _, all_vecs = await asyncio.gather(
+            self._write_memories(results, items, payloads, accepted),
+            self._embed_in_thread(
+                embed_engine,
+                [text for _, texts, _, _ in plans for text in texts],
+            ),
         )
 
-        return result
+        # Phase 2f: Handle chunking OUTSIDE async context (after main Tx)
+        for i in accepted:
+            await self._handle_chunking(
+                result=results[i],
+                redacted_value=payloads[i].redacted_value,
+                kind=items[i]["kind"],
+                evaluated=payloads[i].evaluated,
+            )
+
+        if all_vecs is None:
+            return results
+
+        entries = []
+        offset = 0
+        for i, texts, sources, embed_store in plans:
+            vecs = all_vecs[offset : offset + len(texts)]
+            offset += len(texts)
+            if results[i].memory_id:
+                entries.append((results[i], sources, vecs, embed_store))
+
+        try:
+            await self._store_embeddings(entries, embed_engine, vec_store)
+        except Exception as e:
+            logger.error(f"Failed to generate/persist embeddings: {e}")
 
-    async def _handle_embeddings(
+        return results
+
+    async def _write_memories(
         self,
-        result: StoreResult,
-        memory_dict: dict,
-        evaluated: dict,
-        kind: str,
+        results: list[StoreResult],
+        items: list[dict[str, str]],
+        payloads: list[_PreparedPayload | None],
+        accepted: list[int],
     ) -> None:
+        """Write a batch of prepared memories and FTS entries in one transaction."""
+        async with aiosqlite.connect(self.db_path, cached_statements=STATEMENT_CACHE_SIZE) as db:
+            await db.execute("BEGIN IMMEDIATE")
+            await db.executemany(
+                _UPSERT_MEMORY_SQL,
+                [
+                    (
+                        items[i]["kind"],
+                        items[i]["key"],
+                        payloads[i].value_to_store,
+                        payloads[i].summary,
+                        items[i]["ts"],
+                    )
+                    for i in accepted
+                ],
+            )
+
+            # Resolve ids; a repeated (kind, key) keeps its last payload for FTS
+            fts_rows: dict[int, _PreparedPayload] = {}
+            for i in accepted:
+                cursor = await db.execute(
+                    _SELECT_MEMORY_ID_SQL,
+                    (items[i]["kind"], items[i]["key"]),
+                )
+                row = await cursor.fetchone()
+                if row:
+                    results[i].memory_id = row[0]
+                    results[i].stored = True
+                    fts_rows[row[0]] = payloads[i]
+
+            # Phase 2e: Update FTS index in same transaction
+            indexed = []
+            denied = []
+            for memory_id, payload in fts_rows.items():
+                fts_allowed = payload.evaluated.get("fts_index", True)
+                if fts_allowed and not can_index(payload.evaluated):
+                    fts_allowed = False
+                    logger.info(f"FTS indexing blocked by policy for memory {memory_id}")
+                if fts_allowed:
+                    indexed.append((memory_id, payload.index_text))
+                else:
+                    denied.append((memory_id,))
+
+            await db.executemany(
+                _FTS_MAP_INSERT_SQL,
+                [(memory_id,) for memory_id, _ in indexed],
+            )
+            await db.executemany(
+                _FTS_DELETE_SQL,
+                [(memory_id,) for memory_id in fts_rows],
+            )
+            await db.executemany(
+                _FTS_INSERT_SQL,
+                indexed,
+            )
+            await db.executemany(
+                _FTS_MAP_DELETE_SQL,
+                denied,
+            )
+
+            await db.commit()
+
+    def _plan_embeddings(
+        self,
+        payload: _PreparedPayload,
+        kind: str,
+        label: str,
+    ) -> tuple[list[str], list[str], bool] | None:
         """
-        Handle embedding generation and persistence OUTSIDE async context.
+        Decide which texts to embed for a memory.
 
-        This method is called after the main database transaction is committed
-        to avoid database locking issues on Windows when VectorStore uses
-        synchronous sqlite3 connections.
+        Uses the pre-encryption value and summary already computed by
+        ``_prepare_payload`` rather than summarizing a second time.
 
         Args:
-            result: StoreResult object to populate with embeddings
-            memory_dict: Original memory data (for embedding source text)
-            evaluated: Evaluated rules metadata
+            payload: Prepared memory payload
             kind: Memory kind
+            label: Identifier used in log messages
+
+        Returns:
+            Tuple of (texts_to_embed, sources, embed_store), or None if
+            nothing should be embedded
         """
         global _summary_fallback_warned
 
-        if not result.memory_id:
-            return
-
-        # Get embedding components (this may create VectorStore schema)
-        embed_engine, vec_store = _get_embedding_components(self.db_path)
-        if not embed_engine or not vec_store:
-            return
+        evaluated = payload.evaluated
 
         # Check if rule allows embedding
         embed_mode = evaluated.get("embed", "summary")
@@ -427,26 +743,18 @@ class MemoryStore:
         # Apply policy-based indexing guard for embeddings
         if embed_mode != "none" and not can_index(evaluated):
             embed_mode = "none"
-            logger.info(
-                f"Vector embedding blocked by policy for memory {result.memory_id}",
-            )
+            logger.info(f"Vector embedding blocked by policy for memory {label}")
 
         if embed_mode == "none":
-            return
+            return None
 
         # Determine what to embed
         texts_to_embed = []
         sources = []
 
         # Use ORIGINAL values before encryption for embedding
-        orig_value = memory_dict["value"]
-        if evaluated.get("redact_strategy"):
-            orig_value = apply_redaction(orig_value, evaluated)
-
-        # Check if we have summary
-        orig_summary = None
-        if _summarization_engine.should_summarize(evaluated, orig_value, kind):
-            orig_summary = _summarization_engine.summarize(orig_value)
+        orig_value = payload.plain_value
+        orig_summary = payload.plain_summary
 
         # Build texts list with fallback for missing summary
         if embed_mode in ("summary", "both"):
@@ -471,12 +779,44 @@ class MemoryStore:
             sources.append("full")
 
         if not texts_to_embed:
-            return
+            return None
+
+        return texts_to_embed, sources, embed_store
+
+    async def _embed_in_thread(self, embed_engine: Any, texts: list[str]) -> Any | None:
+        """
+        Run ``embed_texts`` on a worker thread, bounded by the store's semaphore.
+
+        Returns:
+            Array of vectors, or None if there was nothing to embed or
+            embedding failed
+        """
+        if not texts:
+            return None
 
         try:
-            # Embed texts
-            vecs = embed_engine.embed_texts(texts_to_embed)
+            async with self._embed_semaphore:
+                return await asyncio.to_thread(embed_engine.embed_texts, texts)
+        except Exception as e:
+            logger.error(f"Failed to generate/persist embeddings: {e}")
+            return None
 
+    async def _store_embeddings(
+        self,
+        entries: list[tuple[StoreResult, list[str], Any, bool]],
+        embed_engine: Any,
+        vec_store: Any,
+    ) -> None:
+        """
+        Persist (or return as ephemeral) already-computed embeddings.
+
+        Args:
+            entries: (result, sources, vecs, embed_store) per memory
+            embed_engine: EmbeddingEngine that produced the vectors
+            vec_store: VectorStore to persist into
+        """
+        to_persist = []
+        for result, sources, vecs, embed_store in entries:
             if not embed_store:
                 # Compute-only: return as ephemeral (don't persist)
                 for src, vec in zip(sources, vecs, strict=False):
@@ -484,23 +824,33 @@ class MemoryStore:
                 logger.debug(
                     f"Computed {len(vecs)} ephemeral embedding(s) (not persisted)",
                 )
-                return
+            else:
+                to_persist.append((result, sources, vecs))
 
-            # Record consent for embeddings
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute(
-                    "INSERT OR IGNORE INTO memory_consent (memory_id, source) VALUES (?, ?)",
-                    (result.memory_id, "upsert_memory"),
-                )
-                await db.commit()
+        if not to_persist:
+            return
 
-            # Persist embeddings (using synchronous VectorStore)
-            cfg = embed_engine.config
+        # Record consent for embeddings
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.executemany(
+                "INSERT OR IGNORE INTO memory_consent (memory_id, source) VALUES (?, ?)",
+                [(result.memory_id, "upsert_memory") for result, _, _ in to_persist],
+            )
+            await db.commit()
+
+        # Persist embeddings (using synchronous VectorStore)
+        cfg = embed_engine.config
+        for result, sources, vecs in to_persist:
             for src, vec in zip(sources, vecs, strict=False):
-                vec_store.upsert(result.memory_id, vec, src, cfg.provider, cfg.model)
+                vec_store.upsert(
+                    result.memory_id,
+                    vec,
+                    src,
+                    cfg.provider,
+                    cfg.model,
+                    dtype=cfg.storage_dtype,
+                )
             logger.debug(f"Stored {len(vecs)} embedding(s) for memory {result.memory_id}")
-        except Exception as e:
-            logger.error(f"Failed to generate/persist embeddings: {e}")
 
     async def _handle_chunking(
         self,
@@ -552,8 +902,6 @@ class MemoryStore:
             return
 
         # Store chunks (synchronously to avoid Windows locking issues)
-        import sqlite3
-
         conn = None
         try:
             conn = sqlite3.connect(self.db_path)
@@ -601,9 +949,10 @@ class MemoryStore:
         Returns:
             True if deleted, False if not found
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            # Look up memory_id
-            cursor = await db.execute("SELECT id FROM memories WHERE kind=? AND key=?", (kind, key))
+        async with aiosqlite.connect(self.db_path, cached_statements=STATEMENT_CACHE_SIZE) as db:
+            # Delete base row and learn its id in one statement
+            # (triggers will also fire for cleanup)
+            cursor = await db.execute(_DELETE_MEMORY_RETURNING_SQL, (kind, key))
             row = await cursor.fetchone()
 
             if not row:
@@ -612,15 +961,8 @@ class MemoryStore:
             memory_id = row[0]
 
             # Delete FTS index entry in same transaction
-            await db.execute(
-                "INSERT INTO memory_fts(memory_fts, rowid, value, "
-                "summary) VALUES ('delete', ?, '', '')",
-                (memory_id,),
-            )
-            await db.execute("DELETE FROM memory_fts_map WHERE memory_id = ?", (memory_id,))
-
-            # Delete base row (triggers will also fire for cleanup)
-            await db.execute("DELETE FROM memories WHERE id = ?", (memory_id,))
+            await db.execute(_FTS_DELETE_SQL, (memory_id,))
+            await db.execute(_FTS_MAP_DELETE_SQL, (memory_id,))
 
             await db.commit()
             logger.debug(
@@ -637,7 +979,7 @@ class MemoryStore:
         created_ts: str,
     ) -> int:
         """Create a new nudge and return its ID."""
-        actions_json = json.dumps(actions)
+        actions_json = _json_dumps(actions)
         async with aiosqlite.connect(self.db_path) as db:
             cur = await db.execute(
                 "INSERT INTO nudges(kind, message, actions, reason, "
@@ -661,8 +1003,18 @@ class MemoryStore:
             )
             await db.commit()
 
-    async def list_pending_nudges(self, limit: int = 50) -> list[dict]:
-        """Get pending nudges."""
+    async def list_pending_nudges(self, limit: int = 50, parse_actions: bool = True) -> list[dict]:
+        """
+        Get pending nudges.
+
+        Args:
+            limit: Maximum number of nudges to return
+            parse_actions: If False, ``actions`` is returned as the raw JSON
+                string (or None) for callers that only forward it
+
+        Returns:
+            Pending nudges, newest first
+        """
         async with aiosqlite.connect(self.db_path) as db:
             cur = await db.execute(
                 "SELECT id, kind, message, actions, reason, created_ts "
@@ -671,12 +1023,24 @@ class MemoryStore:
                 (limit,),
             )
             rows = await cur.fetchall()
+            if not parse_actions:
+                return [
+                    {
+                        "id": r[0],
+                        "kind": r[1],
+                        "message": r[2],
+                        "actions": r[3],
+                        "reason": r[4],
+                        "created_ts": r[5],
+                    }
+                    for r in rows
+                ]
             return [
                 {
                     "id": r[0],
                     "kind": r[1],
                     "message": r[2],
-                    "actions": json.loads(r[3]) if r[3] else [],
+                    "actions": _json_loads(r[3]) if r[3] else [],
                     "reason": r[4],
                     "created_ts": r[5],
                 }
@@ -712,7 +1076,7 @@ class MemoryStore:
         pinned: bool = False,
     ) -> int:
         """Insert a reflection entry and return its ID."""
-        meta_json = json.dumps(meta) if meta else None
+        meta_json = _json_dumps(meta) if meta else None
         async with aiosqlite.connect(self.db_path) as db:
             cur = await db.execute(
                 "INSERT INTO reflections(kind, content, meta, ts, pinned) VALUES(?,?,?,?,?)",
@@ -736,7 +1100,7 @@ class MemoryStore:
                 "id": row[0],
                 "kind": row[1],
                 "content": row[2],
-                "meta": json.loads(row[3]) if row[3] else None,
+                "meta": _json_loads(row[3]) if row[3] else None,
                 "ts": row[4],
                 "pinned": bool(row[5]),
             }
@@ -832,8 +1196,11 @@ class MemoryStore:
         if not texts_to_embed:
             return 0
 
+        vecs = await self._embed_in_thread(embed_engine, texts_to_embed)
+        if vecs is None:
+            return 0
+
         try:
-            vecs = embed_engine.embed_texts(texts_to_embed)
             cfg = embed_engine.config
 
             # Phase 2d+: Record consent for embeddings
@@ -844,8 +1211,21 @@ class MemoryStore:
                 )
                 await db.commit()
 
-            for src, vec in zip(sources_to_store, vecs, strict=False):
-                vec_store.upsert(memory_id, vec, src, cfg.provider, cfg.model)
+            def _upsert_vectors() -> None:
+                for src, vec in zip(sources_to_store, vecs, strict=False):
+                    vec_store.upsert(
+                        memory_id,
+                        vec,
+                        src,
+                        cfg.provider,
+                        cfg.model,
+                        dtype=cfg.storage_dtype,
+                    )
+
+            # Blocking sqlite3 writes go to a worker thread: waiting on the
+            # write lock here would stall the loop that has to resume the
+            # concurrent aiosqlite commit holding it (persist_embeddings_batch)
+            await asyncio.to_thread(_upsert_vectors)
 
             logger.info(f"Persisted {len(vecs)} embedding(s) for memory {memory_id}")
             return len(vecs)
@@ -853,6 +1233,34 @@ class MemoryStore:
             logger.error(f"Failed to persist embeddings: {e}")
             return 0
 
+    async def persist_embeddings_batch(
+        self,
+        memory_ids: list[int],
+        max_concurrent: int = 8,
+    ) -> int:
+        """
+        Run ``persist_embeddings_for`` over many memories concurrently
+
+        At most ``max_concurrent`` promotions are in flight at once so a
+        large consent sweep doesn't flood SQLite with writers; embedding
+        work is further capped by the store's embedding semaphore.
+
+        Args:
+            memory_ids: Memory IDs to generate embeddings for
+            max_concurrent: Maximum promotions running at the same time
+
+        Returns:
+            Total number of embeddings created
+        """
+        sem = asyncio.Semaphore(max_concurrent)
+
+        async def _one(memory_id: int) -> int:
+            async with sem:
+                return await self.persist_embeddings_for(memory_id)
+
+        counts = await asyncio.gather(*(_one(mid) for mid in memory_ids))
+        return sum(counts)
+
     async def reembed_memory(self, memory_id: int, sources: list[str] | None = None) -> int:
         """
         Re-generate embeddings for a memory (e.g., after summary change)
@@ -874,19 +1282,16 @@ class MemoryStore:
 
         # Phase 2d+: If sources not specified, default to existing sources
         if sources is None:
-            import sqlite3
-
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("PRAGMA foreign_keys = ON")
-                cursor = conn.execute(
+            async with aiosqlite.connect(self.db_path) as db:
+                cursor = await db.execute(
                     "SELECT DISTINCT source FROM memory_embeddings WHERE memory_id=?",
                     (memory_id,),
                 )
-                rows = cursor.fetchall()
-                if rows:
-                    sources = [row[0] for row in rows]
-                # If no existing embeddings, sources remains None
-                # and persist_embeddings_for will use rule defaults
+                rows = await cursor.fetchall()
+            if rows:
+                sources = [row[0] for row in rows]
+            # If no existing embeddings, sources remains None
+            # and persist_embeddings_for will use rule defaults
 
         # Delete existing embeddings
         vec_store.delete_for_memory(memory_id)
@@ -894,6 +1299,24 @@ class MemoryStore:
         # Re-create embeddings
         return await self.persist_embeddings_for(memory_id, sources)
 
+    def start_periodic_checkpoint(self, interval: float = WAL_CHECKPOINT_INTERVAL) -> None:
+        """
+        Start a background task that runs a PASSIVE WAL checkpoint every
+        ``interval`` seconds, keeping the WAL bounded in long-running
+        processes without blocking writers. Stopped by ``close()``.
+        """
+        if self._checkpoint_task is None or self._checkpoint_task.done():
+            self._checkpoint_task = asyncio.create_task(self._periodic_checkpoint(interval))
+
+    async def _periodic_checkpoint(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                async with aiosqlite.connect(self.db_path) as db:
+                    await db.execute("PRAGMA wal_checkpoint(PASSIVE)")
+            except Exception as e:
+                logger.debug(f"Periodic WAL checkpoint failed: {e}")
+
     async def close(self) -> None:
         """Checkpoint and clean up WAL files and global resources."""
         # Clean up global embedding/vector store instances
@@ -901,35 +1324,23 @@ class MemoryStore:
         _embedding_engine = None
         _vector_store = None
 
-        # Checkpoint WAL files to ensure database is clean
+        checkpoint_task, self._checkpoint_task = self._checkpoint_task, None
+        if checkpoint_task is not None:
+            # Let an in-flight PASSIVE checkpoint unwind before TRUNCATE
+            checkpoint_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await checkpoint_task
+
+        # Nothing to fold back if the WAL is missing or already empty
         try:
-            import sqlite3
+            if os.path.getsize(self.db_path + "-wal") == 0:
+                return
+        except OSError:
+            return
 
-            conn = sqlite3.connect(self.db_path)
-            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
-            conn.close()
+        # Fresh-connection TRUNCATE checkpoint (also releases Windows
+        # handles), run off the event loop
+        try:
+            await asyncio.to_thread(wal_checkpoint_truncate, self.db_path)
         except Exception as e:
             logger.debug(f"WAL checkpoint failed: {e}")
-
-        # Try alternate checkpoint method from API bridge
-        try:
-            import os
-            import sys
-
-            sys.path.insert(
-                0,
-                os.path.join(
-                    os.path.dirname(__file__),
-                    "..",
-                    "..",
-                    "bartholomew_api_bridge_v0_1",
-                    "services",
-                    "api",
-                ),
-            )
-            from db_ctx import wal_checkpoint_truncate
-
-            wal_checkpoint_truncate(self.db_path)
-        except Exception:
-            # Best-effort cleanup
-            pass
@@ -1,9 +1,9 @@
 """
 Prometheus metrics registry with duplicate collector protection.
 
-Provides a singleton registry pattern with thread-safe initialization
-to prevent "Duplicated timeseries in CollectorRegistry" errors when
-modules are reloaded (e.g., by uvicorn's auto-reload).
+Provides a singleton registry, built once at module import, to prevent
+"Duplicated timeseries in CollectorRegistry" errors when modules are
+reloaded (e.g., by uvicorn's auto-reload).
 """
 
 from __future__ import annotations
@@ -14,12 +14,6 @@ import threading
 
 logger = logging.getLogger(__name__)
 
-# Module-level state
-_registry: CollectorRegistry | None = None
-_registry_lock = threading.Lock()
-_initialized = False
-
-
 try:
     from prometheus_client import CollectorRegistry
 
@@ -32,30 +26,31 @@ except ImportError:
         def __init__(self, *args, **kwargs):
             pass
 
+    logger.debug("prometheus_client not available, using stub registry")
+
+
+def _new_registry() -> CollectorRegistry:
+    """Construct a fresh registry (the stub accepts and ignores kwargs)."""
+    return CollectorRegistry(auto_describe=True)
+
+
+# Module-level state. Module import is serialized by the import lock, so
+# the registry is created exactly once and reads need no locking.
+_registry: CollectorRegistry = _new_registry()
+_reset_lock = threading.Lock()
+
 
 def get_metrics_registry() -> CollectorRegistry:
     """
-    Get or create the global metrics registry.
+    Get the global metrics registry.
 
-    Thread-safe singleton pattern ensures only one registry is created
-    even if called from multiple threads or during module reloads.
+    The registry is created at module import, so this is a plain
+    module-global lookup with no locking on the hot path.
 
     Returns:
         CollectorRegistry instance (shared across all callers)
     """
-    global _registry, _initialized
-
-    with _registry_lock:
-        if not _initialized:
-            if _prometheus_available:
-                _registry = CollectorRegistry(auto_describe=True)
-                logger.debug("Created Prometheus metrics registry")
-            else:
-                _registry = CollectorRegistry()
-                logger.debug("prometheus_client not available, using stub registry")
-            _initialized = True
-
-        return _registry
+    return _registry
 
 
 def reset_metrics_registry() -> None:
@@ -65,9 +60,8 @@ def reset_metrics_registry() -> None:
     USE WITH CAUTION: This is primarily for testing. Resetting the
     registry while metrics are being collected can cause issues.
     """
-    global _registry, _initialized
+    global _registry
 
-    with _registry_lock:
-        _registry = None
-        _initialized = False
+    with _reset_lock:
+        _registry = _new_registry()
         logger.debug("Reset metrics registry")
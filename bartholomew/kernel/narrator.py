@@ -9,23 +9,115 @@ Stage 3.4: Narrator Episodic Layer Implementation
 
 from __future__ import annotations
 
+import asyncio
+import bisect
+import functools
+import itertools
 import json
+import logging
+import operator
+import os
+import queue
 import sqlite3
-import uuid
-from dataclasses import dataclass, field
+import string
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta, timezone
 from enum import Enum
-from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import yaml
 
+from bartholomew.kernel.global_workspace import EventType
+
+
+logger = logging.getLogger(__name__)
+
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+try:
+    import orjson  # Optional: C-accelerated JSON for episode columns and exports
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgpack  # Optional: compact binary encoding for opaque episode columns
+except ImportError:  # pragma: no cover
+    msgpack = None
 
 if TYPE_CHECKING:
     from bartholomew.kernel.experience_kernel import AffectState, ExperienceKernel
     from bartholomew.kernel.global_workspace import GlobalWorkspace, WorkspaceEvent
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_epoch_micros(dt: datetime) -> int:
+    """Convert a datetime to integer microseconds since the Unix epoch (naive = UTC)."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH) // _ONE_MICROSECOND
+
+
+def _from_epoch_micros(micros: int) -> datetime:
+    """Convert integer microseconds since the Unix epoch to an aware UTC datetime."""
+    return _EPOCH + timedelta(microseconds=micros)
+
+
+def _iso_to_epoch_micros(value: str | None) -> int | None:
+    """Convert a legacy ISO-8601 timestamp to epoch micros (migration helper)."""
+    if value is None:
+        return None
+    return _to_epoch_micros(datetime.fromisoformat(value))
+
+
+# Episode IDs keep the canonical UUID4 text form, but entropy is drawn from
+# os.urandom in bulk and sliced, avoiding a syscall and a uuid.UUID object
+# per episode.
+_ID_BYTES = 16
+_ID_POOL_SIZE = 4096
+_id_pool = b""
+_id_offset = 0
+_id_lock = threading.Lock()
+
+
+def _next_entry_id() -> str:
+    """Return a fresh random episode ID in UUID4 string form."""
+    global _id_pool, _id_offset
+
+    with _id_lock:
+        if _id_offset >= len(_id_pool):
+            _id_pool = os.urandom(_ID_BYTES * _ID_POOL_SIZE)
+            _id_offset = 0
+        pool, start = _id_pool, _id_offset
+        _id_offset += _ID_BYTES
+
+    raw = bytearray(pool[start : start + _ID_BYTES])
+    raw[6] = (raw[6] & 0x0F) | 0x40  # version 4
+    raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def _reset_id_pool() -> None:
+    """Drop the inherited entropy pool in a forked child."""
+    global _id_pool, _id_offset, _id_lock
+
+    # Otherwise parent and child would slice identical IDs from the same
+    # bytes; the lock is replaced in case another thread held it at fork
+    _id_pool = b""
+    _id_offset = 0
+    _id_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_id_pool)
+
+
 # =============================================================================
 # Episode Types
 # =============================================================================
@@ -89,12 +181,22 @@ class NarrativeTone(Enum):
     """Balanced state"""
 
 
+# Let sqlite3 bind the enums directly (C-level adapter call during binding)
+sqlite3.register_adapter(EpisodeType, operator.attrgetter("value"))
+sqlite3.register_adapter(NarrativeTone, operator.attrgetter("value"))
+
+# ...and map stored values back with a dict lookup (Enum(value) goes through
+# EnumMeta.__call__, which dominates row hydration for long result lists)
+_EPISODE_TYPES = {episode_type.value: episode_type for episode_type in EpisodeType}
+_NARRATIVE_TONES = {tone.value: tone for tone in NarrativeTone}
+
+
 # =============================================================================
 # Episodic Entry
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class EpisodicEntry:
     """
     A single episodic memory entry with narrative content.
@@ -147,7 +249,7 @@ class EpisodicEntry:
     ) -> EpisodicEntry:
         """Factory method to create a new episode with auto-generated ID and timestamp."""
         return cls(
-            entry_id=str(uuid.uuid4()),
+            entry_id=_next_entry_id(),
             timestamp=datetime.now(timezone.utc),
             episode_type=episode_type,
             narrative=narrative,
@@ -174,12 +276,31 @@ class EpisodicEntry:
             "metadata": self.metadata,
         }
 
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize to compact JSON bytes (same shape as ``to_dict``).
+
+        Uses orjson's native dataclass/enum/datetime support when installed,
+        skipping the intermediate dict; falls back to stdlib json.
+        """
+        if orjson is not None:
+            try:
+                return orjson.dumps(self, option=orjson.OPT_NON_STR_KEYS)
+            except TypeError:
+                pass  # e.g. ints wider than 64 bits; stdlib json handles them
+        return json.dumps(self.to_dict(), separators=(",", ":")).encode()
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> EpisodicEntry:
-        """Deserialize from dictionary."""
+        """Deserialize from dictionary (timestamp as ISO string or epoch micros)."""
+        timestamp = data["timestamp"]
         return cls(
             entry_id=data["entry_id"],
-            timestamp=datetime.fromisoformat(data["timestamp"]),
+            timestamp=(
+                _from_epoch_micros(timestamp)
+                if isinstance(timestamp, int)
+                else datetime.fromisoformat(timestamp)
+            ),
             episode_type=EpisodeType(data["episode_type"]),
             narrative=data["narrative"],
             tone=NarrativeTone(data.get("tone", "neutral")),
@@ -191,12 +312,17 @@ class EpisodicEntry:
         )
 
 
+def episodes_to_json_bytes(entries: list[EpisodicEntry]) -> bytes:
+    """Serialize episodes to a JSON array for bulk export."""
+    return b"[" + b",".join([entry.to_json_bytes() for entry in entries]) + b"]"
+
+
 # =============================================================================
 # Narrator Configuration
 # =============================================================================
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NarratorConfig:
     """
     Configuration for the Narrator from Identity.yaml.
@@ -220,36 +346,69 @@ class NarratorConfig:
     auto_subscribe: bool = True
     """Whether to auto-subscribe to workspace channels"""
 
+    write_behind: bool = False
+    """Queue persist_episode() writes and commit them in background batches"""
+
+    write_batch_size: int = 50
+    """Maximum episodes per write-behind transaction"""
+
+    write_flush_interval_ms: int = 100
+    """Maximum time a queued episode waits before its batch is written"""
+
+    async_handlers: bool = False
+    """Register async workspace callbacks that keep SQLite writes off the event loop"""
+
+    event_debounce_ms: int = 0
+    """Coalesce affect/attention events arriving within this window (0 disables)"""
+
     @classmethod
     def from_identity(cls, identity_path: str | None = None) -> NarratorConfig:
-        """Load configuration from Identity.yaml."""
+        """
+        Load configuration from Identity.yaml.
+
+        Parsed settings are memoized per (path, mtime), so repeated calls
+        skip the YAML parse until the file changes on disk.
+        """
         if not identity_path:
             identity_path = "Identity.yaml"
 
-        path = Path(identity_path)
-        if not path.exists():
+        try:
+            mtime_ns = os.stat(identity_path).st_mtime_ns
+        except OSError:
             return cls()
 
-        try:
-            with open(path, encoding="utf-8") as f:
-                identity = yaml.safe_load(f)
+        settings = _load_identity_narrator_settings(identity_path, mtime_ns)
+        if settings is None:
+            return cls()
+        return cls(**settings)
 
-            narrator_config = (
-                identity.get("identity", {})
-                .get("self_model", {})
-                .get("narrator_episodic_layer", {})
-            )
 
-            logs_config = narrator_config.get("logs", {})
+@functools.lru_cache(maxsize=8)
+def _load_identity_narrator_settings(identity_path: str, mtime_ns: int) -> dict[str, Any] | None:
+    """
+    Parse narrator settings from an Identity.yaml file.
 
-            return cls(
-                enabled=narrator_config.get("enabled", True),
-                style=narrator_config.get("style", "supportive friend, precise, non-fluffy"),
-                redact_personal_data=logs_config.get("redact_personal_data", True),
-                exportable=logs_config.get("exportable", True),
-            )
-        except Exception:
-            return cls()
+    ``mtime_ns`` is part of the cache key only, so edits to the file are
+    picked up. Returns None if the file cannot be parsed.
+    """
+    try:
+        with open(identity_path, encoding="utf-8") as f:
+            identity = yaml.load(f, Loader=_YAML_LOADER)
+
+        narrator_config = (
+            identity.get("identity", {}).get("self_model", {}).get("narrator_episodic_layer", {})
+        )
+
+        logs_config = narrator_config.get("logs", {})
+
+        return {
+            "enabled": narrator_config.get("enabled", True),
+            "style": narrator_config.get("style", "supportive friend, precise, non-fluffy"),
+            "redact_personal_data": logs_config.get("redact_personal_data", True),
+            "exportable": logs_config.get("exportable", True),
+        }
+    except Exception:
+        return None
 
 
 # =============================================================================
@@ -259,7 +418,7 @@ class NarratorConfig:
 NARRATOR_SCHEMA = """
 CREATE TABLE IF NOT EXISTS episodic_entries (
     id TEXT PRIMARY KEY,
-    timestamp TEXT NOT NULL,
+    timestamp INTEGER NOT NULL,  -- microseconds since Unix epoch (UTC)
     episode_type TEXT NOT NULL,
     narrative TEXT NOT NULL,
     tone TEXT NOT NULL,
@@ -274,11 +433,83 @@ CREATE TABLE IF NOT EXISTS episodic_entries (
 CREATE INDEX IF NOT EXISTS idx_episodic_entries_timestamp
 ON episodic_entries(timestamp DESC);
 
-CREATE INDEX IF NOT EXISTS idx_episodic_entries_type
-ON episodic_entries(episode_type);
+-- Serves "recent episodes of type X" (filter + ORDER BY) from one B-tree.
+-- Replaces the single-column episode_type index; source_channel is never
+-- filtered on, so its index only added write amplification.
+DROP INDEX IF EXISTS idx_episodic_entries_type;
+DROP INDEX IF EXISTS idx_episodic_entries_source_channel;
+
+CREATE INDEX IF NOT EXISTS idx_episodic_entries_type_ts
+ON episodic_entries(episode_type, timestamp DESC);
+
+-- Same shape for the tone filter used by search_episodes.
+CREATE INDEX IF NOT EXISTS idx_episodic_entries_tone_ts
+ON episodic_entries(tone, timestamp DESC);
+
+-- Normalized tags for indexed lookup (tags_json stays the source of truth).
+-- NOCASE keeps the case-insensitive matching of the old LIKE scan.
+CREATE TABLE IF NOT EXISTS episode_tags (
+    tag TEXT NOT NULL COLLATE NOCASE,
+    episode_id TEXT NOT NULL,
+    PRIMARY KEY (tag, episode_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_episode_tags_episode
+ON episode_tags(episode_id);
+
+CREATE TRIGGER IF NOT EXISTS episode_tags_insert AFTER INSERT ON episodic_entries
+WHEN NEW.tags_json IS NOT NULL
+BEGIN
+    INSERT OR IGNORE INTO episode_tags(tag, episode_id)
+    SELECT value, NEW.id FROM json_each(NEW.tags_json);
+END;
 
-CREATE INDEX IF NOT EXISTS idx_episodic_entries_source_channel
-ON episodic_entries(source_channel);
+CREATE TRIGGER IF NOT EXISTS episode_tags_update AFTER UPDATE OF tags_json ON episodic_entries
+BEGIN
+    DELETE FROM episode_tags WHERE episode_id = OLD.id;
+    INSERT OR IGNORE INTO episode_tags(tag, episode_id)
+    SELECT value, NEW.id FROM json_each(NEW.tags_json) WHERE NEW.tags_json IS NOT NULL;
+END;
+
+CREATE TRIGGER IF NOT EXISTS episode_tags_delete AFTER DELETE ON episodic_entries
+BEGIN
+    DELETE FROM episode_tags WHERE episode_id = OLD.id;
+END;
+
+-- Rendered reflections for ranges that have already closed, keyed by
+-- [start_us, end_us). Any episode written into, moved within or deleted from
+-- a cached range evicts that entry, so late-arriving episodes are picked up.
+CREATE TABLE IF NOT EXISTS reflection_cache (
+    kind TEXT NOT NULL,
+    start_us INTEGER NOT NULL,
+    end_us INTEGER NOT NULL,
+    markdown TEXT NOT NULL,
+    generated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (kind, start_us, end_us)
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS reflection_cache_insert AFTER INSERT ON episodic_entries
+BEGIN
+    DELETE FROM reflection_cache WHERE start_us <= NEW.timestamp AND end_us > NEW.timestamp;
+END;
+
+CREATE TRIGGER IF NOT EXISTS reflection_cache_update
+AFTER UPDATE OF timestamp, episode_type, narrative ON episodic_entries
+BEGIN
+    DELETE FROM reflection_cache
+    WHERE (start_us <= OLD.timestamp AND end_us > OLD.timestamp)
+       OR (start_us <= NEW.timestamp AND end_us > NEW.timestamp);
+END;
+
+CREATE TRIGGER IF NOT EXISTS reflection_cache_delete AFTER DELETE ON episodic_entries
+BEGIN
+    DELETE FROM reflection_cache WHERE start_us <= OLD.timestamp AND end_us > OLD.timestamp;
+END;
+
+-- Backfill databases created before episode_tags existed
+INSERT OR IGNORE INTO episode_tags(tag, episode_id)
+SELECT j.value, e.id FROM episodic_entries e, json_each(e.tags_json) j
+WHERE e.tags_json IS NOT NULL AND NOT EXISTS (SELECT 1 FROM episode_tags);
 """
 
 # =============================================================================
@@ -302,8 +533,12 @@ BEGIN
     VALUES (new.rowid, new.narrative);
 END;
 
--- Trigger to update FTS on episode update
-CREATE TRIGGER IF NOT EXISTS episode_fts_update AFTER UPDATE ON episodic_entries
+-- Trigger to update FTS on episode update. Scoped to the narrative column
+-- so metadata/tag edits don't emit a delete+insert pair into the index.
+-- (contentless_delete=1 would need content='' and SQLite >= 3.43, and a
+-- contentless table cannot be re-synced with the 'rebuild' command.)
+DROP TRIGGER IF EXISTS episode_fts_update;
+CREATE TRIGGER episode_fts_update AFTER UPDATE OF narrative ON episodic_entries
 BEGIN
     INSERT INTO episode_fts(episode_fts, rowid, narrative)
     VALUES ('delete', old.rowid, old.narrative);
@@ -319,6 +554,244 @@ BEGIN
 END;
 """
 
+_EPISODE_FTS_TRIGGERS = ("episode_fts_insert", "episode_fts_update", "episode_fts_delete")
+
+_REBUILD_EPISODE_FTS_SQL = "INSERT INTO episode_fts(episode_fts) VALUES('rebuild')"
+
+
+def _split_sql_script(script: str) -> tuple[str, ...]:
+    """Split a DDL script into statements runnable one at a time with execute()."""
+    statements = []
+    pending = ""
+    for line in script.splitlines(keepends=True):
+        if not pending and (not line.strip() or line.lstrip().startswith("--")):
+            continue
+        pending += line
+        if sqlite3.complete_statement(pending):
+            statements.append(pending.strip())
+            pending = ""
+    return tuple(statements)
+
+
+# EPISODE_FTS_SCHEMA as individual statements, so bulk_ingest_episodes can
+# restore the triggers inside its transaction (executescript would COMMIT).
+_EPISODE_FTS_STATEMENTS = _split_sql_script(EPISODE_FTS_SCHEMA)
+
+_EPISODE_TAG_TRIGGERS = ("episode_tags_insert", "episode_tags_update", "episode_tags_delete")
+
+_REFLECTION_CACHE_TRIGGERS = (
+    "reflection_cache_insert",
+    "reflection_cache_update",
+    "reflection_cache_delete",
+)
+
+_EPISODE_COLUMNS = (
+    "id, timestamp, episode_type, narrative, tone, affect_snapshot_json, "
+    "source_event_id, source_channel, tags_json, metadata_json"
+)
+
+_EPISODE_PLACEHOLDERS = "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+_INSERT_EPISODE_SQL = (
+    f"INSERT INTO episodic_entries ({_EPISODE_COLUMNS}) VALUES {_EPISODE_PLACEHOLDERS}"
+)
+
+# Rows packed into one multi-row INSERT by save_episodes_batch. 50 rows x 10
+# columns stays well under SQLite's historical 999 bound-parameter limit.
+EPISODE_BATCH_ROWS = 50
+
+_INSERT_EPISODE_MULTI_SQL = (
+    f"INSERT INTO episodic_entries ({_EPISODE_COLUMNS}) VALUES "
+    + ", ".join([_EPISODE_PLACEHOLDERS] * EPISODE_BATCH_ROWS)
+)
+
+
+# SQL is kept in module constants so every call passes the identical string
+# and hits sqlite3's per-connection statement cache.
+STATEMENT_CACHE_SIZE = 256
+
+_SELECT_EPISODE_BY_ID_SQL = "SELECT * FROM episodic_entries WHERE id = ?"
+_SELECT_RECENT_SQL = "SELECT * FROM episodic_entries ORDER BY timestamp DESC LIMIT ?"
+_SELECT_RECENT_SINCE_SQL = (
+    "SELECT * FROM episodic_entries WHERE timestamp >= ? ORDER BY timestamp DESC LIMIT ?"
+)
+_SELECT_BY_TYPE_SQL = (
+    "SELECT * FROM episodic_entries WHERE episode_type = ? ORDER BY timestamp DESC LIMIT ?"
+)
+_SELECT_BY_TAG_SQL = (
+    "SELECT e.* FROM episode_tags t JOIN episodic_entries e ON e.id = t.episode_id "
+    "WHERE t.tag = ? ORDER BY e.timestamp DESC LIMIT ?"
+)
+# Daily reflection only renders type + narrative, so skip full row decoding
+_SELECT_RANGE_NARRATIVES_SQL = (
+    "SELECT episode_type, narrative FROM episodic_entries "
+    "WHERE timestamp >= ? AND timestamp < ? ORDER BY timestamp ASC"
+)
+_COUNT_EPISODES_SQL = "SELECT COUNT(*) FROM episodic_entries"
+# Per-type rollup for a time range. Binding episode_type with IN lets the
+# (episode_type, timestamp) index answer COUNT/MIN index-only, one range seek
+# per type; each type's first narrative is then one more index seek, instead
+# of reading every row in the range from the table.
+_TYPE_ROLLUP_RANGE_SQL = (
+    "SELECT g.episode_type, g.n, ("
+    "SELECT e.narrative FROM episodic_entries e "
+    "WHERE e.episode_type = g.episode_type AND e.timestamp = g.first_ts LIMIT 1"
+    ") AS narrative, g.first_ts FROM ("
+    "SELECT episode_type, COUNT(*) AS n, MIN(timestamp) AS first_ts FROM episodic_entries "
+    f"WHERE episode_type IN ({', '.join(repr(t.value) for t in EpisodeType)}) "
+    "AND timestamp >= ? AND timestamp < ? GROUP BY episode_type"
+    ") AS g ORDER BY g.first_ts"
+)
+
+_SELECT_REFLECTION_CACHE_SQL = (
+    "SELECT markdown FROM reflection_cache WHERE kind = ? AND start_us = ? AND end_us = ?"
+)
+_STORE_REFLECTION_CACHE_SQL = (
+    "INSERT OR REPLACE INTO reflection_cache (kind, start_us, end_us, markdown) "
+    "VALUES (?, ?, ?, ?)"
+)
+
+# Per-connection write tuning. journal_mode=WAL is persistent in the DB file,
+# so it is set once in _init_database rather than on every connect.
+_CONNECT_PRAGMAS = (
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -65536",
+    "PRAGMA mmap_size = 268435456",
+)
+
+
+def _apply_connect_pragmas(conn: sqlite3.Connection) -> sqlite3.Connection:
+    """Apply write-optimizing PRAGMAs and the Row factory to a fresh connection."""
+    # Set once here: readers share connections, so none of them mutate it
+    conn.row_factory = sqlite3.Row
+    for pragma in _CONNECT_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def _migrate_timestamps_to_micros(conn: sqlite3.Connection) -> bool:
+    """
+    Rebuild a legacy episodic_entries table whose timestamp column is TEXT.
+
+    Earlier schemas stored ISO-8601 strings; the column is now INTEGER epoch
+    microseconds. TEXT affinity would coerce integers back to strings, so the
+    table is recreated and rows copied across with converted timestamps.
+
+    Returns:
+        True if a migration ran
+    """
+    columns = conn.execute("PRAGMA table_info(episodic_entries)").fetchall()
+    if not any(col[1] == "timestamp" and col[2].upper() == "TEXT" for col in columns):
+        return False
+
+    conn.create_function("iso_to_epoch_micros", 1, _iso_to_epoch_micros, deterministic=True)
+    triggers = "".join(
+        f"DROP TRIGGER IF EXISTS {name};\n"
+        for name in _EPISODE_FTS_TRIGGERS + _EPISODE_TAG_TRIGGERS + _REFLECTION_CACHE_TRIGGERS
+    )
+    select_columns = _EPISODE_COLUMNS.replace(
+        "timestamp,",
+        "iso_to_epoch_micros(timestamp),",
+        1,
+    )
+    conn.executescript(
+        f"""
+        BEGIN;
+        {triggers}
+        ALTER TABLE episodic_entries RENAME TO episodic_entries_legacy;
+        DROP INDEX IF EXISTS idx_episodic_entries_timestamp;
+        DROP INDEX IF EXISTS idx_episodic_entries_type_ts;
+        DROP INDEX IF EXISTS idx_episodic_entries_tone_ts;
+        {NARRATOR_SCHEMA}
+        INSERT INTO episodic_entries ({_EPISODE_COLUMNS}, created_at)
+        SELECT {select_columns}, created_at FROM episodic_entries_legacy;
+        DROP TABLE episodic_entries_legacy;
+        COMMIT;
+        """,
+    )
+    return True
+
+
+def _dumps_json(value: Any) -> str:
+    """Compact JSON text for a column, via orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass  # e.g. ints wider than 64 bits; stdlib json handles them
+    return json.dumps(value, separators=(",", ":"))
+
+
+def _loads_json(data: str | bytes) -> Any:
+    """Parse a JSON column, via orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except ValueError:
+            pass  # e.g. NaN written by stdlib json in older rows
+    return json.loads(data)
+
+
+def _fts5_phrase(text: str) -> str:
+    """Quote free text as a single FTS5 phrase string."""
+    return '"' + text.replace('"', '""') + '"'
+
+
+def _json_keys(value: Any) -> Any:
+    """Stringify non-str dict keys the way JSON would, at any depth."""
+    if isinstance(value, dict):
+        return {
+            key if isinstance(key, str) else json.dumps(key): _json_keys(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [_json_keys(item) for item in value]
+    return value
+
+
+def _pack_column(value: Any) -> str | bytes:
+    """
+    Encode an opaque dict column (affect snapshot, metadata).
+
+    Uses msgpack (stored as a BLOB) when installed, else compact JSON text.
+    Keys are stringified as JSON would, so a column decodes the same way
+    whichever backend wrote it. tags_json is not packed: the episode_tags
+    triggers read it with json_each.
+    """
+    if msgpack is not None:
+        try:
+            return msgpack.packb(_json_keys(value), use_bin_type=True)
+        except (OverflowError, TypeError):
+            pass  # e.g. ints wider than 64 bits; stored as JSON text instead
+    return _dumps_json(value)
+
+
+def _unpack_column(data: str | bytes) -> Any:
+    """Decode a column written by _pack_column (or legacy JSON text)."""
+    if isinstance(data, bytes):
+        if msgpack is None:
+            raise RuntimeError("Episode column is msgpack-encoded but msgpack is not installed")
+        # Rows written before keys were stringified may hold int keys
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+    return _loads_json(data)
+
+
+def _episode_params(episode: EpisodicEntry) -> tuple[Any, ...]:
+    """Flatten an episode into the parameter tuple for _INSERT_EPISODE_SQL."""
+    return (
+        episode.entry_id,
+        _to_epoch_micros(episode.timestamp),
+        episode.episode_type,
+        episode.narrative,
+        episode.tone,
+        _pack_column(episode.affect_snapshot) if episode.affect_snapshot else None,
+        episode.source_event_id,
+        episode.source_channel,
+        _dumps_json(episode.tags),
+        _pack_column(episode.metadata),
+    )
+
 
 # =============================================================================
 # Narrative Templates
@@ -529,6 +1002,408 @@ class NarrativeTemplates:
     }
 
 
+# Precompiled template pools: EpisodeType -> tuple indexed by tone ordinal ->
+# tuple of render callables. The NarrativeTemplates dicts stay the editable
+# source of truth; this parses and flattens them once at import.
+_TONE_ORDINAL = {tone: index for index, tone in enumerate(NarrativeTone)}
+
+_FORMATTER = string.Formatter()
+
+
+def _compile_template(template: str) -> Callable[..., str]:
+    """
+    Pre-parse a ``str.format`` template into a render closure.
+
+    The closure takes the same keyword arguments as ``template.format`` and
+    joins pre-split literal parts with field values, skipping the format
+    parser on every call. Templates using format specs, conversions or
+    attribute/index lookups fall back to ``template.format``.
+    """
+    parts: list[tuple[bool, str]] = []
+    for literal, field_name, spec, conversion in _FORMATTER.parse(template):
+        if literal:
+            parts.append((False, literal))
+        if field_name is None:
+            continue
+        if spec or conversion or not field_name.isidentifier():
+            return template.format
+        parts.append((True, field_name))
+
+    field_names = [text for is_field, text in parts if is_field]
+    if len(field_names) == 1:
+        # Every shipped template has one placeholder: prefix + value + suffix
+        split = next(i for i, (is_field, _) in enumerate(parts) if is_field)
+        prefix = "".join(text for _, text in parts[:split])
+        suffix = "".join(text for _, text in parts[split + 1 :])
+        name = field_names[0]
+
+        def render_one(**fields: Any) -> str:
+            return f"{prefix}{fields[name]}{suffix}"
+
+        return render_one
+
+    frozen = tuple(parts)
+
+    def render(**fields: Any) -> str:
+        return "".join([str(fields[text]) if is_field else text for is_field, text in frozen])
+
+    return render
+
+
+def _build_template_pools() -> dict[EpisodeType, tuple[tuple[Callable[..., str], ...], ...]]:
+    """Flatten NarrativeTemplates into tone-ordinal indexed tuples."""
+    pools = {}
+    for episode_type in (
+        EpisodeType.AFFECT_SHIFT,
+        EpisodeType.ATTENTION_FOCUS,
+        EpisodeType.DRIVE_ACTIVATED,
+        EpisodeType.DRIVE_SATISFIED,
+        EpisodeType.GOAL_ADDED,
+        EpisodeType.GOAL_COMPLETED,
+        EpisodeType.OBSERVATION,
+    ):
+        table = getattr(NarrativeTemplates, episode_type.name)
+        neutral = table[NarrativeTone.NEUTRAL]
+        pools[episode_type] = tuple(
+            tuple(_compile_template(template) for template in table.get(tone, neutral))
+            for tone in NarrativeTone
+        )
+    return pools
+
+
+_TEMPLATE_POOLS = _build_template_pools()
+
+
+# Tone quadrant lookup: the cut points of the rule below split valence into
+# five bands and arousal into three, so the tone is a table lookup on the two
+# band indices. bisect_right(cuts, x) counts cuts <= x, which matches the
+# rule's >= / < comparisons exactly at every boundary.
+_VALENCE_CUTS = (-0.1, 0.0, 0.1, 0.3)
+_AROUSAL_CUTS = (0.4, 0.5)
+
+
+def _tone_for(valence: float, arousal: float) -> NarrativeTone:
+    """Quadrant-based tone rule (used to build ``_TONE_LUT``)."""
+    if valence >= 0.3 and arousal >= 0.5:
+        return NarrativeTone.ENTHUSIASTIC
+    elif valence < -0.1 and arousal >= 0.5:
+        return NarrativeTone.CONCERNED
+    elif valence >= 0.1 and arousal < 0.4:
+        return NarrativeTone.CONTENT
+    elif valence < 0 and arousal < 0.4:
+        return NarrativeTone.SUBDUED
+    else:
+        return NarrativeTone.NEUTRAL
+
+
+def _band_samples(cuts: tuple[float, ...]) -> tuple[float, ...]:
+    """One representative value per band: below the first cut, then each cut."""
+    return (cuts[0] - 1.0, *cuts)
+
+
+_AROUSAL_BANDS = len(_AROUSAL_CUTS) + 1
+
+_TONE_LUT: tuple[NarrativeTone, ...] = tuple(
+    _tone_for(valence, arousal)
+    for valence in _band_samples(_VALENCE_CUTS)
+    for arousal in _band_samples(_AROUSAL_CUTS)
+)
+
+
+# =============================================================================
+# Write-Behind Episode Writer
+# =============================================================================
+
+
+class EpisodeWriter:
+    """
+    Write-behind queue that coalesces episode writes into batches.
+
+    A daemon thread drains up to ``batch_size`` queued episodes, or whatever
+    arrived within ``interval_ms`` of the first, and hands them to
+    ``write_batch`` as one transaction. ``flush()`` blocks until everything
+    enqueued before the call has been written.
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        write_batch: Callable[[list[EpisodicEntry]], Any],
+        batch_size: int = 50,
+        interval_ms: int = 100,
+    ):
+        self._write_batch = write_batch
+        self._batch_size = max(1, batch_size)
+        self._interval = max(0, interval_ms) / 1000.0
+        self._queue: queue.SimpleQueue[Any] = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="episode-writer", daemon=True)
+        self._thread.start()
+
+    def enqueue(self, entry: EpisodicEntry) -> None:
+        """Queue an episode for the next batch."""
+        self._queue.put(entry)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until all previously enqueued episodes are written."""
+        if not self._thread.is_alive():
+            return True
+        marker = threading.Event()
+        self._queue.put(marker)
+        return marker.wait(timeout)
+
+    def close(self, timeout: float | None = None) -> None:
+        """Write pending episodes and stop the writer thread."""
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch: list[EpisodicEntry] = []
+            markers: list[threading.Event] = []
+            item = self._queue.get()
+            deadline = time.monotonic() + self._interval
+            while True:
+                if item is self._STOP:
+                    stopping = True
+                    break
+                if isinstance(item, threading.Event):
+                    markers.append(item)
+                    break
+                batch.append(item)
+                if len(batch) >= self._batch_size:
+                    break
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else None
+                except queue.Empty:
+                    item = None
+                if item is None:
+                    break
+
+            if batch:
+                try:
+                    self._write_batch(batch)
+                except Exception:
+                    logger.exception("Failed to write %d queued episodes", len(batch))
+            for marker in markers:
+                marker.set()
+
+
+# =============================================================================
+# Event Coalescing
+# =============================================================================
+
+
+class EventCoalescer:
+    """
+    Collapse bursts of workspace events into one delivery per window.
+
+    The first event after a quiet period opens a ``window_ms`` window. Events
+    arriving inside it are folded into the pending one with ``merge`` (by
+    default the latest wins), and when the window closes ``deliver`` is
+    called once, from a timer thread. ``flush()`` delivers immediately.
+    """
+
+    def __init__(
+        self,
+        deliver: Callable[[WorkspaceEvent], Any],
+        window_ms: int,
+        merge: Callable[[WorkspaceEvent, WorkspaceEvent], WorkspaceEvent] | None = None,
+    ):
+        self._deliver = deliver
+        self._window = max(0, window_ms) / 1000.0
+        self._merge = merge
+        self._lock = threading.Lock()
+        self._pending: WorkspaceEvent | None = None
+        self._timer: threading.Timer | None = None
+
+    def submit(self, event: WorkspaceEvent) -> None:
+        """Add an event to the current window, opening one if needed."""
+        with self._lock:
+            if self._pending is None:
+                self._pending = event
+                self._timer = threading.Timer(self._window, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+            elif self._merge is not None:
+                self._pending = self._merge(self._pending, event)
+            else:
+                self._pending = event
+
+    def flush(self) -> None:
+        """Deliver the pending event now, if any."""
+        with self._lock:
+            event, self._pending = self._pending, None
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+        if event is not None:
+            self._deliver(event)
+
+
+def _merge_affect_events(pending: WorkspaceEvent, latest: WorkspaceEvent) -> WorkspaceEvent:
+    """
+    Fold an affect event into a pending one.
+
+    Keeps the latest state but the window's original ``previous``, so the
+    significance threshold compares the whole burst rather than its last tick.
+    """
+    payload = dict(latest.payload)
+    if "previous" in pending.payload:
+        payload["previous"] = pending.payload["previous"]
+    else:
+        payload.pop("previous", None)
+    return replace(latest, payload=payload)
+
+
+# Daily reflection sections, in output order, with the episode types each lists
+_DAILY_SECTIONS: tuple[tuple[str, tuple[EpisodeType, ...]], ...] = (
+    ("Emotional Landscape", (EpisodeType.AFFECT_SHIFT,)),
+    ("Focus & Attention", (EpisodeType.ATTENTION_FOCUS,)),
+    ("Motivations & Drives", (EpisodeType.DRIVE_ACTIVATED, EpisodeType.DRIVE_SATISFIED)),
+    ("Goals & Achievements", (EpisodeType.GOAL_ADDED, EpisodeType.GOAL_COMPLETED)),
+    ("Observations", (EpisodeType.OBSERVATION,)),
+)
+
+# Stored episode_type value -> bucket slot, so grouping a day's rows is a str
+# lookup plus a list index rather than hashing Enum members (Enum.__hash__ is
+# implemented in Python)
+_EPISODE_TYPE_LIST = tuple(EpisodeType)
+_EPISODE_TYPE_INDEX = {episode_type.value: i for i, episode_type in enumerate(_EPISODE_TYPE_LIST)}
+# Display labels for the weekly overview, e.g. "Goal Added"
+_EPISODE_TYPE_LABELS = {
+    episode_type: episode_type.value.replace("_", " ").title() for episode_type in EpisodeType
+}
+_DAILY_SECTION_SLOTS = tuple(
+    (
+        f"### {title}",
+        tuple(_EPISODE_TYPE_INDEX[episode_type.value] for episode_type in section_types),
+    )
+    for title, section_types in _DAILY_SECTIONS
+)
+
+
+def _render_daily_reflection(date_str: str, rows: list[sqlite3.Row]) -> str:
+    """Format a day's (episode_type, narrative) rows as the daily reflection markdown."""
+    if not rows:
+        return f"# Daily Reflection - {date_str}\n\nA quiet day. No notable episodes recorded."
+
+    # Build narrative
+    lines = [
+        f"# Daily Reflection - {date_str}",
+        "",
+        "## The Day's Journey",
+        "",
+    ]
+
+    # Group narratives into per-type buckets, noting first-appearance order
+    index = _EPISODE_TYPE_INDEX
+    buckets: list[list[str]] = [[] for _ in _EPISODE_TYPE_LIST]
+    seen: list[int] = []
+    for episode_type, narrative in rows:
+        slot = index[episode_type]
+        bucket = buckets[slot]
+        if not bucket:
+            seen.append(slot)
+        bucket.append(f"- {narrative}")
+
+    # Summarize each type; a section is emitted only if any of its types occurred
+    for heading, slots in _DAILY_SECTION_SLOTS:
+        section = [line for slot in slots for line in buckets[slot]]
+        if section:
+            lines.extend((heading, *section, ""))
+
+    # Summary stats
+    lines.extend(
+        [
+            "## Summary",
+            "",
+            f"- Total episodes: {len(rows)}",
+            f"- Episode types: {', '.join(_EPISODE_TYPE_LIST[slot].value for slot in seen)}",
+        ],
+    )
+
+    return "\n".join(lines)
+
+
+def _type_rollup(rows: list[sqlite3.Row]) -> list[tuple[EpisodeType, int, str]]:
+    """Decode _TYPE_ROLLUP_RANGE_SQL rows into (episode type, count, first narrative)."""
+    return [(_EPISODE_TYPES[row["episode_type"]], row["n"], row["narrative"]) for row in rows]
+
+
+def _render_weekly_reflection(week_start: datetime, rows: list[sqlite3.Row]) -> str:
+    """Format a week's per-type rollup rows as the weekly reflection markdown."""
+    rollup = _type_rollup(rows)
+    total = sum(count for _, count, _ in rollup)
+
+    week_num = week_start.isocalendar()[1]
+    year = week_start.year
+
+    if not rollup:
+        return f"# Weekly Reflection - Week {week_num}, {year}\n\nA quiet week. No notable episodes recorded."
+
+    # Build narrative
+    lines = [
+        f"# Weekly Reflection - Week {week_num}, {year}",
+        "",
+        "## Week Overview",
+        "",
+    ]
+
+    type_counts = {episode_type: count for episode_type, count, _ in rollup}
+
+    lines.append(f"This week saw {total} recorded moments across my experience:")
+    lines.append("")
+    for etype, count in sorted(type_counts.items(), key=lambda item: item[0].value):
+        lines.append(f"- **{_EPISODE_TYPE_LABELS[etype]}**: {count} episodes")
+    lines.append("")
+
+    # Highlight key episodes
+    lines.extend(
+        [
+            "## Highlights",
+            "",
+        ],
+    )
+
+    # Get most significant episodes (first of each type)
+    for _, _, narrative in rollup[:5]:
+        lines.append(f"- {narrative}")
+    lines.append("")
+
+    # Goals summary
+    goals_added = type_counts.get(EpisodeType.GOAL_ADDED, 0)
+    goals_completed = type_counts.get(EpisodeType.GOAL_COMPLETED, 0)
+
+    if goals_added or goals_completed:
+        lines.extend(
+            [
+                "## Goals Progress",
+                "",
+                f"- Goals set: {goals_added}",
+                f"- Goals completed: {goals_completed}",
+                "",
+            ],
+        )
+
+    # Emotional summary
+    affect_shifts = type_counts.get(EpisodeType.AFFECT_SHIFT, 0)
+    if affect_shifts:
+        lines.extend(
+            [
+                "## Emotional Journey",
+                "",
+                f"Experienced {affect_shifts} notable emotional shifts this week.",
+                "",
+            ],
+        )
+
+    return "\n".join(lines)
+
+
 # =============================================================================
 # Narrator Engine
 # =============================================================================
@@ -560,25 +1435,80 @@ class NarratorEngine:
         """
         self._kernel = experience_kernel
         self._workspace = workspace
-        self._config = config or NarratorConfig.from_identity()
+        self._config = config or get_config()
         self._db_path = db_path or ":memory:"
 
         # Subscription IDs for cleanup
         self._subscription_ids: list[str] = []
 
-        # Episode counter (for selection from templates)
-        self._episode_counter = 0
+        # Template rotation: one itertools.cycle per (episode type, tone) pool.
+        # next() on a cycle is a single C call, so concurrent workspace
+        # callbacks advance it without a lock or a shared RNG.
+        self._template_cycles = {
+            episode_type: tuple(itertools.cycle(pool) for pool in pools)
+            for episode_type, pools in _TEMPLATE_POOLS.items()
+        }
 
         # For in-memory databases, keep a persistent connection
         # since each connect(":memory:") creates a new database
         self._conn: sqlite3.Connection | None = None
         if self._db_path == ":memory:":
-            self._conn = sqlite3.connect(":memory:")
+            # Write-behind, async handlers and debouncing use the connection off-thread
+            shared = (
+                self._config.write_behind
+                or self._config.async_handlers
+                or self._config.event_debounce_ms > 0
+            )
+            self._conn = _apply_connect_pragmas(
+                sqlite3.connect(
+                    ":memory:",
+                    check_same_thread=not shared,
+                    isolation_level=None,
+                    cached_statements=STATEMENT_CACHE_SIZE,
+                ),
+            )
             self._conn.executescript(NARRATOR_SCHEMA)
+            try:
+                self._conn.executescript(EPISODE_FTS_SCHEMA)
+            except sqlite3.OperationalError:
+                pass  # FTS5 not available
         else:
             # Initialize database schema for file-based databases
             self._init_database()
 
+        # File databases reuse one connection per thread, so the statement
+        # cache and connect-time pragmas survive across calls
+        self._local = threading.local()
+        self._thread_conns: list[sqlite3.Connection] = []
+        self._thread_conns_lock = threading.Lock()
+
+        # Serializes writers in-process: the in-memory connection is shared
+        # across threads (a second BEGIN on it would fail), and for files it
+        # avoids threads spinning on SQLITE_BUSY for the WAL write lock
+        self._write_lock = threading.Lock()
+
+        # Optional write-behind batching for persist_episode()
+        self._writer: EpisodeWriter | None = None
+        if self._config.write_behind:
+            self._writer = EpisodeWriter(
+                self.save_episodes_batch,
+                batch_size=self._config.write_batch_size,
+                interval_ms=self._config.write_flush_interval_ms,
+            )
+
+        # Optional debouncing of bursty affect/attention streams, keyed by channel
+        self._coalescers: dict[str, EventCoalescer] = {}
+        if self._config.event_debounce_ms > 0:
+            self._coalescers["affect"] = EventCoalescer(
+                self._handle_affect_event,
+                self._config.event_debounce_ms,
+                merge=_merge_affect_events,
+            )
+            self._coalescers["attention"] = EventCoalescer(
+                self._handle_attention_event,
+                self._config.event_debounce_ms,
+            )
+
         # Auto-subscribe if configured
         if self._config.auto_subscribe and self._workspace:
             self.subscribe_to_workspace()
@@ -586,23 +1516,60 @@ class NarratorEngine:
     def _init_database(self) -> None:
         """Initialize database schema for episodic entries."""
         with sqlite3.connect(self._db_path) as conn:
+            # Larger pages mean shallower B-trees for reflection-range scans.
+            # Only takes effect on a fresh file (before any table or WAL
+            # switch); existing databases keep their page size.
+            conn.execute("PRAGMA page_size = 8192")
+            conn.execute("PRAGMA journal_mode = WAL")
+            migrated = _migrate_timestamps_to_micros(conn)
             conn.executescript(NARRATOR_SCHEMA)
+            # Cached markdown reflects the renderer that produced it; start
+            # each engine from an empty cache so format changes take effect
+            conn.execute("DELETE FROM reflection_cache")
+            fts_existed = (
+                conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type='table' AND name='episode_fts'",
+                ).fetchone()
+                is not None
+            )
             # Initialize FTS schema (silently skip if FTS5 not available)
             try:
                 conn.executescript(EPISODE_FTS_SCHEMA)
+                if migrated or not fts_existed:
+                    # Table rebuild reassigned rowids, or the index was just
+                    # created over existing rows; re-sync external content
+                    conn.execute(_REBUILD_EPISODE_FTS_SQL)
+                    conn.commit()
             except sqlite3.OperationalError:
                 pass  # FTS5 not available
 
     def _get_connection(self) -> sqlite3.Connection:
-        """Get a database connection."""
+        """Get a database connection (reused per thread for file databases)."""
         if self._conn is not None:
             return self._conn
-        return sqlite3.connect(self._db_path)
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Only ever used by this thread; check_same_thread=False lets
+            # close() shut it down from whichever thread stops the engine.
+            # Autocommit mode: single statements commit themselves, batches
+            # use explicit BEGIN IMMEDIATE/COMMIT (see _insert_episodes).
+            conn = _apply_connect_pragmas(
+                sqlite3.connect(
+                    self._db_path,
+                    check_same_thread=False,
+                    isolation_level=None,
+                    cached_statements=STATEMENT_CACHE_SIZE,
+                ),
+            )
+            self._local.conn = conn
+            with self._thread_conns_lock:
+                self._thread_conns.append(conn)
+        return conn
 
-    def _close_if_not_persistent(self, conn: sqlite3.Connection) -> None:
-        """Close connection if it's not the persistent one."""
-        if conn is not self._conn:
-            conn.close()
+    def _release_connection(self, conn: sqlite3.Connection) -> None:
+        """Roll back anything a failed call left open on a per-thread connection."""
+        if conn is not self._conn and conn.in_transaction:
+            conn.rollback()
 
     # =========================================================================
     # Workspace Subscription
@@ -613,26 +1580,27 @@ class NarratorEngine:
         if not self._workspace:
             return
 
-        # Subscribe to affect channel
-        sub_id = self._workspace.subscribe(
-            channel="affect",
-            callback=self._handle_affect_event,
-            source="narrator",
-        )
-        self._subscription_ids.append(sub_id)
-
-        # Subscribe to attention channel
-        sub_id = self._workspace.subscribe(
-            channel="attention",
-            callback=self._handle_attention_event,
-            source="narrator",
-        )
-        self._subscription_ids.append(sub_id)
+        # Subscribe to affect and attention channels. Debounced channels only
+        # hand the event to their coalescer, which is cheap enough to run
+        # inline from publish_async as well.
+        for channel, handler, build in (
+            ("affect", self._handle_affect_event, self._affect_episode_for),
+            ("attention", self._handle_attention_event, self._attention_episode_for),
+        ):
+            coalescer = self._coalescers.get(channel)
+            sub_id = self._workspace.subscribe(
+                channel=channel,
+                callback=coalescer.submit if coalescer else handler,
+                async_callback=None if coalescer else self._async_handler(build),
+                source="narrator",
+            )
+            self._subscription_ids.append(sub_id)
 
         # Subscribe to drives channel
         sub_id = self._workspace.subscribe(
             channel="drives",
             callback=self._handle_drive_event,
+            async_callback=self._async_handler(self._drive_episode_for),
             source="narrator",
         )
         self._subscription_ids.append(sub_id)
@@ -641,6 +1609,7 @@ class NarratorEngine:
         sub_id = self._workspace.subscribe(
             channel="goals",
             callback=self._handle_goal_event,
+            async_callback=self._async_handler(self._goal_episode_for),
             source="narrator",
         )
         self._subscription_ids.append(sub_id)
@@ -654,67 +1623,104 @@ class NarratorEngine:
             self._workspace.unsubscribe(sub_id)
         self._subscription_ids.clear()
 
+        # Episodes from the handlers may still be queued for write-behind
+        self.flush()
+
     # =========================================================================
     # Event Handlers
     # =========================================================================
 
     def _handle_affect_event(self, event: WorkspaceEvent) -> None:
         """Handle affect changed events."""
-        from bartholomew.kernel.global_workspace import EventType
+        episode = self._affect_episode_for(event)
+        if episode is not None:
+            self.persist_episode(episode)
+
+    def _handle_attention_event(self, event: WorkspaceEvent) -> None:
+        """Handle attention changed events."""
+        episode = self._attention_episode_for(event)
+        if episode is not None:
+            self.persist_episode(episode)
+
+    def _handle_drive_event(self, event: WorkspaceEvent) -> None:
+        """Handle drive events."""
+        episode = self._drive_episode_for(event)
+        if episode is not None:
+            self.persist_episode(episode)
+
+    def _handle_goal_event(self, event: WorkspaceEvent) -> None:
+        """Handle goal events."""
+        episode = self._goal_episode_for(event)
+        if episode is not None:
+            self.persist_episode(episode)
 
+    def _async_handler(
+        self,
+        build: Callable[[WorkspaceEvent], EpisodicEntry | None],
+    ) -> Callable[[WorkspaceEvent], Any] | None:
+        """
+        Wrap an episode builder as an async workspace callback.
+
+        Used by ``publish_async``: the episode is built inline (cheap) and
+        the SQLite write is handed to the write-behind queue or a worker
+        thread, so the event loop never blocks on a commit. Returns None
+        unless ``NarratorConfig.async_handlers`` is enabled.
+        """
+        if not self._config.async_handlers:
+            return None
+
+        async def handle(event: WorkspaceEvent) -> None:
+            episode = build(event)
+            if episode is None:
+                return
+            if self._writer is not None:
+                self._writer.enqueue(episode)
+            else:
+                await asyncio.to_thread(self.persist_episode, episode)
+
+        return handle
+
+    def _affect_episode_for(self, event: WorkspaceEvent) -> EpisodicEntry | None:
+        """Build an affect episode if the change is significant."""
         if event.event_type != EventType.AFFECT_CHANGED:
-            return
+            return None
 
-        # Check if change is significant enough
+        # Skip insignificant changes before any episode work: both deltas
+        # strictly inside (-threshold, threshold)
         payload = event.payload
-        previous = payload.get("previous", {})
+        previous = payload.get("previous")
         if previous:
-            valence_change = abs(payload.get("valence", 0) - previous.get("valence", 0))
-            arousal_change = abs(payload.get("arousal", 0) - previous.get("arousal", 0))
+            threshold = self._config.min_affect_change_threshold
             if (
-                valence_change < self._config.min_affect_change_threshold
-                and arousal_change < self._config.min_affect_change_threshold
+                -threshold < payload.get("valence", 0) - previous.get("valence", 0) < threshold
+                and -threshold < payload.get("arousal", 0) - previous.get("arousal", 0) < threshold
             ):
-                return
+                return None
 
-        episode = self.generate_affect_episode(event)
-        self.persist_episode(episode)
-
-    def _handle_attention_event(self, event: WorkspaceEvent) -> None:
-        """Handle attention changed events."""
-        from bartholomew.kernel.global_workspace import EventType
+        return self.generate_affect_episode(event)
 
+    def _attention_episode_for(self, event: WorkspaceEvent) -> EpisodicEntry | None:
+        """Build an attention episode for attention changes."""
         if event.event_type != EventType.ATTENTION_CHANGED:
-            return
+            return None
 
-        episode = self.generate_attention_episode(event)
-        self.persist_episode(episode)
-
-    def _handle_drive_event(self, event: WorkspaceEvent) -> None:
-        """Handle drive events."""
-        from bartholomew.kernel.global_workspace import EventType
+        return self.generate_attention_episode(event)
 
+    def _drive_episode_for(self, event: WorkspaceEvent) -> EpisodicEntry | None:
+        """Build a drive activated/satisfied episode."""
         if event.event_type == EventType.DRIVE_ACTIVATED:
-            episode = self.generate_drive_activated_episode(event)
-        elif event.event_type == EventType.DRIVE_SATISFIED:
-            episode = self.generate_drive_satisfied_episode(event)
-        else:
-            return
-
-        self.persist_episode(episode)
-
-    def _handle_goal_event(self, event: WorkspaceEvent) -> None:
-        """Handle goal events."""
-        from bartholomew.kernel.global_workspace import EventType
+            return self.generate_drive_activated_episode(event)
+        if event.event_type == EventType.DRIVE_SATISFIED:
+            return self.generate_drive_satisfied_episode(event)
+        return None
 
+    def _goal_episode_for(self, event: WorkspaceEvent) -> EpisodicEntry | None:
+        """Build a goal added/completed episode."""
         if event.event_type == EventType.GOAL_ADDED:
-            episode = self.generate_goal_added_episode(event)
-        elif event.event_type == EventType.GOAL_COMPLETED:
-            episode = self.generate_goal_completed_episode(event)
-        else:
-            return
-
-        self.persist_episode(episode)
+            return self.generate_goal_added_episode(event)
+        if event.event_type == EventType.GOAL_COMPLETED:
+            return self.generate_goal_completed_episode(event)
+        return None
 
     # =========================================================================
     # Tone Determination
@@ -736,20 +1742,22 @@ class NarratorEngine:
         if affect is None:
             return NarrativeTone.NEUTRAL
 
-        valence = affect.valence
-        arousal = affect.arousal
-
-        # Quadrant-based tone selection
-        if valence >= 0.3 and arousal >= 0.5:
-            return NarrativeTone.ENTHUSIASTIC
-        elif valence < -0.1 and arousal >= 0.5:
-            return NarrativeTone.CONCERNED
-        elif valence >= 0.1 and arousal < 0.4:
-            return NarrativeTone.CONTENT
-        elif valence < 0 and arousal < 0.4:
-            return NarrativeTone.SUBDUED
-        else:
-            return NarrativeTone.NEUTRAL
+        # Quadrant-based tone selection via the precomputed band table
+        return _TONE_LUT[
+            bisect.bisect_right(_VALENCE_CUTS, affect.valence) * _AROUSAL_BANDS
+            + bisect.bisect_right(_AROUSAL_CUTS, affect.arousal)
+        ]
+
+    def _tone_and_snapshot(
+        self,
+        affect: AffectState | None = None,
+    ) -> tuple[NarrativeTone, dict[str, Any] | None]:
+        """Derive tone and affect snapshot from a single kernel read."""
+        if affect is None and self._kernel:
+            affect = self._kernel.get_affect()
+        if affect is None:
+            return NarrativeTone.NEUTRAL, None
+        return self.determine_tone(affect), affect.to_dict()
 
     def get_affect_snapshot(self) -> dict[str, Any] | None:
         """Get current affect state as a dictionary."""
@@ -757,10 +1765,14 @@ class NarratorEngine:
             return self._kernel.get_affect().to_dict()
         return None
 
-    def _select_template(self, templates: list[str]) -> str:
-        """Select a template from the list, rotating through options."""
-        self._episode_counter += 1
-        return templates[self._episode_counter % len(templates)]
+    def _render_template(
+        self,
+        episode_type: EpisodeType,
+        tone: NarrativeTone,
+        **fields: str,
+    ) -> str:
+        """Render the next rotating template for an episode type and tone."""
+        return next(self._template_cycles[episode_type][_TONE_ORDINAL[tone]])(**fields)
 
     # =========================================================================
     # Episode Generation
@@ -770,6 +1782,7 @@ class NarratorEngine:
         self,
         event: WorkspaceEvent | None = None,
         emotion: str | None = None,
+        affect: AffectState | None = None,
     ) -> EpisodicEntry:
         """
         Generate an episode for an affect/emotional change.
@@ -777,12 +1790,12 @@ class NarratorEngine:
         Args:
             event: Source workspace event (if available)
             emotion: Emotion label to use in narrative
+            affect: Affect state to narrate from (fetched from kernel if None)
 
         Returns:
             EpisodicEntry with affect shift narrative
         """
-        tone = self.determine_tone()
-        affect_snapshot = self.get_affect_snapshot()
+        tone, affect_snapshot = self._tone_and_snapshot(affect)
 
         # Get emotion from event or affect state
         if emotion is None and event:
@@ -793,12 +1806,7 @@ class NarratorEngine:
             emotion = emotion or "different"
 
         # Select and format template
-        templates = NarrativeTemplates.AFFECT_SHIFT.get(
-            tone,
-            NarrativeTemplates.AFFECT_SHIFT[NarrativeTone.NEUTRAL],
-        )
-        template = self._select_template(templates)
-        narrative = template.format(emotion=emotion)
+        narrative = self._render_template(EpisodeType.AFFECT_SHIFT, tone, emotion=emotion)
 
         return EpisodicEntry.create(
             episode_type=EpisodeType.AFFECT_SHIFT,
@@ -815,6 +1823,7 @@ class NarratorEngine:
         self,
         event: WorkspaceEvent | None = None,
         target: str | None = None,
+        affect: AffectState | None = None,
     ) -> EpisodicEntry:
         """
         Generate an episode for an attention/focus change.
@@ -822,12 +1831,12 @@ class NarratorEngine:
         Args:
             event: Source workspace event (if available)
             target: Focus target to use in narrative
+            affect: Affect state to narrate from (fetched from kernel if None)
 
         Returns:
             EpisodicEntry with attention focus narrative
         """
-        tone = self.determine_tone()
-        affect_snapshot = self.get_affect_snapshot()
+        tone, affect_snapshot = self._tone_and_snapshot(affect)
 
         # Get target from event
         if target is None and event:
@@ -836,12 +1845,7 @@ class NarratorEngine:
             target = target or "a new focus"
 
         # Select and format template
-        templates = NarrativeTemplates.ATTENTION_FOCUS.get(
-            tone,
-            NarrativeTemplates.ATTENTION_FOCUS[NarrativeTone.NEUTRAL],
-        )
-        template = self._select_template(templates)
-        narrative = template.format(target=target)
+        narrative = self._render_template(EpisodeType.ATTENTION_FOCUS, tone, target=target)
 
         tags = ["attention", "focus"]
         if event:
@@ -862,6 +1866,7 @@ class NarratorEngine:
         self,
         event: WorkspaceEvent | None = None,
         drive_id: str | None = None,
+        affect: AffectState | None = None,
     ) -> EpisodicEntry:
         """
         Generate an episode for drive activation.
@@ -869,12 +1874,12 @@ class NarratorEngine:
         Args:
             event: Source workspace event (if available)
             drive_id: Drive identifier
+            affect: Affect state to narrate from (fetched from kernel if None)
 
         Returns:
             EpisodicEntry with drive activated narrative
         """
-        tone = self.determine_tone()
-        affect_snapshot = self.get_affect_snapshot()
+        tone, affect_snapshot = self._tone_and_snapshot(affect)
 
         # Get drive from event
         if drive_id is None and event:
@@ -886,12 +1891,7 @@ class NarratorEngine:
         drive_phrase = drive_id.replace("_", " ")
 
         # Select and format template
-        templates = NarrativeTemplates.DRIVE_ACTIVATED.get(
-            tone,
-            NarrativeTemplates.DRIVE_ACTIVATED[NarrativeTone.NEUTRAL],
-        )
-        template = self._select_template(templates)
-        narrative = template.format(drive=drive_phrase)
+        narrative = self._render_template(EpisodeType.DRIVE_ACTIVATED, tone, drive=drive_phrase)
 
         return EpisodicEntry.create(
             episode_type=EpisodeType.DRIVE_ACTIVATED,
@@ -908,6 +1908,7 @@ class NarratorEngine:
         self,
         event: WorkspaceEvent | None = None,
         drive_id: str | None = None,
+        affect: AffectState | None = None,
     ) -> EpisodicEntry:
         """
         Generate an episode for drive satisfaction.
@@ -915,12 +1916,12 @@ class NarratorEngine:
         Args:
             event: Source workspace event (if available)
             drive_id: Drive identifier
+            affect: Affect state to narrate from (fetched from kernel if None)
 
         Returns:
             EpisodicEntry with drive satisfied narrative
         """
-        tone = self.determine_tone()
-        affect_snapshot = self.get_affect_snapshot()
+        tone, affect_snapshot = self._tone_and_snapshot(affect)
 
         # Get drive from event
         if drive_id is None and event:
@@ -932,12 +1933,7 @@ class NarratorEngine:
         drive_phrase = drive_id.replace("_", " ")
 
         # Select and format template
-        templates = NarrativeTemplates.DRIVE_SATISFIED.get(
-            tone,
-            NarrativeTemplates.DRIVE_SATISFIED[NarrativeTone.NEUTRAL],
-        )
-        template = self._select_template(templates)
-        narrative = template.format(drive=drive_phrase)
+        narrative = self._render_template(EpisodeType.DRIVE_SATISFIED, tone, drive=drive_phrase)
 
         return EpisodicEntry.create(
             episode_type=EpisodeType.DRIVE_SATISFIED,
@@ -954,6 +1950,7 @@ class NarratorEngine:
         self,
         event: WorkspaceEvent | None = None,
         goal: str | None = None,
+        affect: AffectState | None = None,
     ) -> EpisodicEntry:
         """
         Generate an episode for a new goal.
@@ -961,12 +1958,12 @@ class NarratorEngine:
         Args:
             event: Source workspace event (if available)
             goal: Goal description
+            affect: Affect state to narrate from (fetched from kernel if None)
 
         Returns:
             EpisodicEntry with goal added narrative
         """
-        tone = self.determine_tone()
-        affect_snapshot = self.get_affect_snapshot()
+        tone, affect_snapshot = self._tone_and_snapshot(affect)
 
         # Get goal from event
         if goal is None and event:
@@ -975,12 +1972,7 @@ class NarratorEngine:
             goal = goal or "a new objective"
 
         # Select and format template
-        templates = NarrativeTemplates.GOAL_ADDED.get(
-            tone,
-            NarrativeTemplates.GOAL_ADDED[NarrativeTone.NEUTRAL],
-        )
-        template = self._select_template(templates)
-        narrative = template.format(goal=goal)
+        narrative = self._render_template(EpisodeType.GOAL_ADDED, tone, goal=goal)
 
         return EpisodicEntry.create(
             episode_type=EpisodeType.GOAL_ADDED,
@@ -997,6 +1989,7 @@ class NarratorEngine:
         self,
         event: WorkspaceEvent | None = None,
         goal: str | None = None,
+        affect: AffectState | None = None,
     ) -> EpisodicEntry:
         """
         Generate an episode for a completed goal.
@@ -1004,12 +1997,12 @@ class NarratorEngine:
         Args:
             event: Source workspace event (if available)
             goal: Goal description
+            affect: Affect state to narrate from (fetched from kernel if None)
 
         Returns:
             EpisodicEntry with goal completed narrative
         """
-        tone = self.determine_tone()
-        affect_snapshot = self.get_affect_snapshot()
+        tone, affect_snapshot = self._tone_and_snapshot(affect)
 
         # Get goal from event
         if goal is None and event:
@@ -1018,12 +2011,7 @@ class NarratorEngine:
             goal = goal or "my objective"
 
         # Select and format template
-        templates = NarrativeTemplates.GOAL_COMPLETED.get(
-            tone,
-            NarrativeTemplates.GOAL_COMPLETED[NarrativeTone.NEUTRAL],
-        )
-        template = self._select_template(templates)
-        narrative = template.format(goal=goal)
+        narrative = self._render_template(EpisodeType.GOAL_COMPLETED, tone, goal=goal)
 
         return EpisodicEntry.create(
             episode_type=EpisodeType.GOAL_COMPLETED,
@@ -1040,6 +2028,7 @@ class NarratorEngine:
         self,
         content: str,
         tags: list[str] | None = None,
+        affect: AffectState | None = None,
     ) -> EpisodicEntry:
         """
         Generate an observation episode (manual/general).
@@ -1047,20 +2036,15 @@ class NarratorEngine:
         Args:
             content: Observation content
             tags: Optional tags
+            affect: Affect state to narrate from (fetched from kernel if None)
 
         Returns:
             EpisodicEntry with observation narrative
         """
-        tone = self.determine_tone()
-        affect_snapshot = self.get_affect_snapshot()
+        tone, affect_snapshot = self._tone_and_snapshot(affect)
 
         # Select and format template
-        templates = NarrativeTemplates.OBSERVATION.get(
-            tone,
-            NarrativeTemplates.OBSERVATION[NarrativeTone.NEUTRAL],
-        )
-        template = self._select_template(templates)
-        narrative = template.format(content=content)
+        narrative = self._render_template(EpisodeType.OBSERVATION, tone, content=content)
 
         return EpisodicEntry.create(
             episode_type=EpisodeType.OBSERVATION,
@@ -1076,6 +2060,7 @@ class NarratorEngine:
         content: str,
         period: str = "daily",
         tags: list[str] | None = None,
+        affect: AffectState | None = None,
     ) -> EpisodicEntry:
         """
         Generate a reflection episode (daily/weekly).
@@ -1084,12 +2069,12 @@ class NarratorEngine:
             content: Reflection content
             period: 'daily' or 'weekly'
             tags: Optional tags
+            affect: Affect state to narrate from (fetched from kernel if None)
 
         Returns:
             EpisodicEntry with reflection narrative
         """
-        tone = self.determine_tone()
-        affect_snapshot = self.get_affect_snapshot()
+        tone, affect_snapshot = self._tone_and_snapshot(affect)
 
         return EpisodicEntry.create(
             episode_type=EpisodeType.REFLECTION,
@@ -1108,41 +2093,144 @@ class NarratorEngine:
         """
         Save an episode to the database.
 
+        With ``write_behind`` enabled the episode is queued and committed
+        with the next batch; call ``flush()`` before reading it back.
+
         Args:
             episode: Episode to persist
 
         Returns:
             The episode ID
         """
+        if self._writer is not None:
+            self._writer.enqueue(episode)
+            return episode.entry_id
+
+        params = _episode_params(episode)
         conn = self._get_connection()
         try:
-            conn.execute(
-                """
-                INSERT INTO episodic_entries
-                (id, timestamp, episode_type, narrative, tone,
-                 affect_snapshot_json, source_event_id, source_channel,
-                 tags_json, metadata_json)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    episode.entry_id,
-                    episode.timestamp.isoformat(),
-                    episode.episode_type.value,
-                    episode.narrative,
-                    episode.tone.value,
-                    json.dumps(episode.affect_snapshot) if episode.affect_snapshot else None,
-                    episode.source_event_id,
-                    episode.source_channel,
-                    json.dumps(episode.tags),
-                    json.dumps(episode.metadata),
-                ),
-            )
-            conn.commit()
+            # Autocommit: the INSERT (and its FTS/tag triggers) is its own transaction
+            with self._write_lock:
+                conn.execute(_INSERT_EPISODE_SQL, params)
         finally:
-            self._close_if_not_persistent(conn)
+            self._release_connection(conn)
 
         return episode.entry_id
 
+    def flush(self) -> None:
+        """Deliver debounced events and block until queued episodes are committed."""
+        for coalescer in self._coalescers.values():
+            coalescer.flush()
+        if self._writer is not None:
+            self._writer.flush()
+
+    def close(self) -> None:
+        """Commit queued episodes, stop the write-behind thread and close connections."""
+        for coalescer in self._coalescers.values():
+            coalescer.flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        with self._thread_conns_lock:
+            conns, self._thread_conns = self._thread_conns, []
+        self._local = threading.local()
+        for conn in conns:
+            conn.close()
+
+    def save_episodes_batch(self, entries: list[EpisodicEntry]) -> int:
+        """
+        Save many episodes in a single transaction.
+
+        Intended for imports and replays: one BEGIN/COMMIT avoids a commit
+        (and fsync) per episode, and full chunks of ``EPISODE_BATCH_ROWS``
+        are packed into a single multi-row INSERT to cut per-statement work.
+
+        Args:
+            entries: Episodes to persist
+
+        Returns:
+            Number of episodes written
+        """
+        if not entries:
+            return 0
+
+        conn = self._get_connection()
+        try:
+            with self._write_lock:
+                self._insert_episodes(conn, entries)
+        finally:
+            self._release_connection(conn)
+
+        return len(entries)
+
+    def bulk_ingest_episodes(self, entries: list[EpisodicEntry]) -> int:
+        """
+        Bulk-load episodes with FTS indexing deferred until the end.
+
+        The episode_fts triggers are dropped, the rows inserted, the index
+        rebuilt once and the triggers re-created from EPISODE_FTS_SCHEMA, all
+        inside one transaction, so a failed load (or rebuild) rolls the
+        triggers back into place.
+        Falls back to ``save_episodes_batch`` behaviour when FTS5 is absent.
+
+        Args:
+            entries: Episodes to persist
+
+        Returns:
+            Number of episodes written
+        """
+        if not entries:
+            return 0
+
+        conn = self._get_connection()
+        try:
+            has_fts = (
+                conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type='table' AND name='episode_fts'",
+                ).fetchone()
+                is not None
+            )
+            with self._write_lock:
+                self._insert_episodes(conn, entries, suspend_fts=has_fts)
+        finally:
+            self._release_connection(conn)
+
+        return len(entries)
+
+    def _insert_episodes(
+        self,
+        conn: sqlite3.Connection,
+        entries: list[EpisodicEntry],
+        suspend_fts: bool = False,
+    ) -> None:
+        """Insert episodes in one transaction, optionally deferring FTS to one rebuild."""
+        # IMMEDIATE takes the write lock up front instead of upgrading from
+        # a read lock mid-batch, which can fail with SQLITE_BUSY under WAL.
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if suspend_fts:
+                for trigger in _EPISODE_FTS_TRIGGERS:
+                    conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+            rows = [_episode_params(e) for e in entries]
+            full = len(rows) - len(rows) % EPISODE_BATCH_ROWS
+            conn.executemany(
+                _INSERT_EPISODE_MULTI_SQL,
+                [
+                    [value for row in rows[i : i + EPISODE_BATCH_ROWS] for value in row]
+                    for i in range(0, full, EPISODE_BATCH_ROWS)
+                ],
+            )
+            # Remainder goes through the single-row prepared statement
+            conn.executemany(_INSERT_EPISODE_SQL, rows[full:])
+            if suspend_fts:
+                conn.execute(_REBUILD_EPISODE_FTS_SQL)
+                for statement in _EPISODE_FTS_STATEMENTS:
+                    conn.execute(statement)
+        except Exception:
+            conn.rollback()
+            raise
+        conn.execute("COMMIT")
+
     def get_episode(self, entry_id: str) -> EpisodicEntry | None:
         """
         Retrieve a specific episode by ID.
@@ -1155,13 +2243,12 @@ class NarratorEngine:
         """
         conn = self._get_connection()
         try:
-            conn.row_factory = sqlite3.Row
             row = conn.execute(
-                "SELECT * FROM episodic_entries WHERE id = ?",
+                _SELECT_EPISODE_BY_ID_SQL,
                 (entry_id,),
             ).fetchone()
         finally:
-            self._close_if_not_persistent(conn)
+            self._release_connection(conn)
 
         if not row:
             return None
@@ -1185,31 +2272,21 @@ class NarratorEngine:
         """
         conn = self._get_connection()
         try:
-            conn.row_factory = sqlite3.Row
 
             if since:
                 rows = conn.execute(
-                    """
-                    SELECT * FROM episodic_entries
-                    WHERE timestamp >= ?
-                    ORDER BY timestamp DESC
-                    LIMIT ?
-                    """,
-                    (since.isoformat(), limit),
+                    _SELECT_RECENT_SINCE_SQL,
+                    (_to_epoch_micros(since), limit),
                 ).fetchall()
             else:
                 rows = conn.execute(
-                    """
-                    SELECT * FROM episodic_entries
-                    ORDER BY timestamp DESC
-                    LIMIT ?
-                    """,
+                    _SELECT_RECENT_SQL,
                     (limit,),
                 ).fetchall()
         finally:
-            self._close_if_not_persistent(conn)
+            self._release_connection(conn)
 
-        return [self._row_to_episode(row) for row in rows]
+        return self._rows_to_episodes(rows)
 
     def get_episodes_by_type(
         self,
@@ -1228,20 +2305,14 @@ class NarratorEngine:
         """
         conn = self._get_connection()
         try:
-            conn.row_factory = sqlite3.Row
             rows = conn.execute(
-                """
-                SELECT * FROM episodic_entries
-                WHERE episode_type = ?
-                ORDER BY timestamp DESC
-                LIMIT ?
-                """,
-                (episode_type.value, limit),
+                _SELECT_BY_TYPE_SQL,
+                (episode_type, limit),
             ).fetchall()
         finally:
-            self._close_if_not_persistent(conn)
+            self._release_connection(conn)
 
-        return [self._row_to_episode(row) for row in rows]
+        return self._rows_to_episodes(rows)
 
     def get_episodes_by_tag(
         self,
@@ -1260,30 +2331,22 @@ class NarratorEngine:
         """
         conn = self._get_connection()
         try:
-            conn.row_factory = sqlite3.Row
             rows = conn.execute(
-                """
-                SELECT * FROM episodic_entries
-                WHERE tags_json LIKE ?
-                ORDER BY timestamp DESC
-                LIMIT ?
-                """,
-                (f'%"{tag}"%', limit),
+                _SELECT_BY_TAG_SQL,
+                (tag, limit),
             ).fetchall()
         finally:
-            self._close_if_not_persistent(conn)
+            self._release_connection(conn)
 
-        return [self._row_to_episode(row) for row in rows]
+        return self._rows_to_episodes(rows)
 
     def get_episode_count(self) -> int:
         """Get total number of episodes."""
         conn = self._get_connection()
         try:
-            count = conn.execute(
-                "SELECT COUNT(*) FROM episodic_entries",
-            ).fetchone()[0]
+            count = conn.execute(_COUNT_EPISODES_SQL).fetchone()[0]
         finally:
-            self._close_if_not_persistent(conn)
+            self._release_connection(conn)
         return count
 
     # =========================================================================
@@ -1316,7 +2379,6 @@ class NarratorEngine:
         """
         conn = self._get_connection()
         try:
-            conn.row_factory = sqlite3.Row
 
             # Build filters
             filters = []
@@ -1324,15 +2386,15 @@ class NarratorEngine:
 
             if episode_type:
                 filters.append("e.episode_type = ?")
-                params.append(episode_type.value)
+                params.append(episode_type)
 
             if tone:
                 filters.append("e.tone = ?")
-                params.append(tone.value)
+                params.append(tone)
 
             if since:
                 filters.append("e.timestamp >= ?")
-                params.append(since.isoformat())
+                params.append(_to_epoch_micros(since))
 
             filter_clause = ""
             if filters:
@@ -1351,85 +2413,86 @@ class NarratorEngine:
                 LIMIT ?
             """
 
-            try:
-                rows = conn.execute(sql, params).fetchall()
-            except sqlite3.OperationalError:
-                # FTS not available, fall back to LIKE
-                like_pattern = f"%{query}%"
-                params_fallback: list[Any] = [like_pattern]
-
-                if episode_type:
-                    params_fallback.append(episode_type.value)
-                if tone:
-                    params_fallback.append(tone.value)
-                if since:
-                    params_fallback.append(since.isoformat())
-                params_fallback.append(limit)
-
-                filter_clause_fb = ""
-                if filters:
-                    filter_clause_fb = "AND " + " AND ".join(filters)
+            # Free text such as "self-check" is not valid MATCH syntax; retry
+            # it as a quoted phrase so it is still answered from the index
+            rows = None
+            for match in (query, _fts5_phrase(query)):
+                try:
+                    rows = conn.execute(sql, [match, *params[1:]]).fetchall()
+                    break
+                except sqlite3.OperationalError:
+                    continue
 
+            if rows is None:
+                # FTS not available, fall back to LIKE. Walks the timestamp
+                # (or type/tone) index newest-first and stops at LIMIT.
                 sql_fallback = f"""
                     SELECT *
                     FROM episodic_entries e
                     WHERE e.narrative LIKE ?
-                    {filter_clause_fb}
+                    {filter_clause}
                     ORDER BY timestamp DESC
                     LIMIT ?
                 """
-                rows = conn.execute(sql_fallback, params_fallback).fetchall()
+                rows = conn.execute(sql_fallback, [f"%{query}%", *params[1:]]).fetchall()
 
         finally:
-            self._close_if_not_persistent(conn)
+            self._release_connection(conn)
 
-        return [self._row_to_episode(row) for row in rows]
+        return self._rows_to_episodes(rows)
 
     def rebuild_episode_fts(self) -> int:
         """
         Rebuild the episode FTS index from existing entries.
 
+        The index is kept current by triggers, so this is only needed for
+        recovery (e.g. after rows were written with the triggers dropped).
+
         Returns:
             Number of episodes indexed
         """
         conn = self._get_connection()
         try:
-            # Delete existing FTS data
-            conn.execute("DELETE FROM episode_fts")
-
-            # Rebuild from episodic_entries
-            conn.execute(
-                """
-                INSERT INTO episode_fts(rowid, narrative)
-                SELECT rowid, narrative FROM episodic_entries
-            """,
-            )
-
-            count = conn.execute("SELECT COUNT(*) FROM episode_fts").fetchone()[0]
-            conn.commit()
-            return count
+            with self._write_lock:
+                conn.execute(_REBUILD_EPISODE_FTS_SQL)
+            return conn.execute(_COUNT_EPISODES_SQL).fetchone()[0]
         except sqlite3.OperationalError:
             # FTS not available
             return 0
         finally:
-            self._close_if_not_persistent(conn)
+            self._release_connection(conn)
 
     def _row_to_episode(self, row: sqlite3.Row) -> EpisodicEntry:
         """Convert a database row to EpisodicEntry."""
-        return EpisodicEntry(
-            entry_id=row["id"],
-            timestamp=datetime.fromisoformat(row["timestamp"]),
-            episode_type=EpisodeType(row["episode_type"]),
-            narrative=row["narrative"],
-            tone=NarrativeTone(row["tone"]),
-            affect_snapshot=(
-                json.loads(row["affect_snapshot_json"]) if row["affect_snapshot_json"] else None
-            ),
-            source_event_id=row["source_event_id"],
-            source_channel=row["source_channel"],
-            tags=json.loads(row["tags_json"]) if row["tags_json"] else [],
-            metadata=json.loads(row["metadata_json"]) if row["metadata_json"] else {},
-        )
+        return self._rows_to_episodes([row])[0]
+
+    def _rows_to_episodes(self, rows: list[sqlite3.Row]) -> list[EpisodicEntry]:
+        """Convert database rows to EpisodicEntry objects in one pass."""
+        # Hoisted to locals: this loop runs once per row of every read
+        entry = EpisodicEntry
+        epoch = _EPOCH
+        micros = timedelta
+        types = _EPISODE_TYPES
+        tones = _NARRATIVE_TONES
+        unpack = _unpack_column
+        loads = _loads_json
+        return [
+            entry(
+                entry_id=row["id"],
+                timestamp=epoch + micros(microseconds=row["timestamp"]),
+                episode_type=types[row["episode_type"]],
+                narrative=row["narrative"],
+                tone=tones[row["tone"]],
+                affect_snapshot=(
+                    unpack(row["affect_snapshot_json"]) if row["affect_snapshot_json"] else None
+                ),
+                source_event_id=row["source_event_id"],
+                source_channel=row["source_channel"],
+                tags=loads(row["tags_json"]) if row["tags_json"] else [],
+                metadata=unpack(row["metadata_json"]) if row["metadata_json"] else {},
+            )
+            for row in rows
+        ]
 
     # =========================================================================
     # Reflection Narrative Generation
@@ -1448,92 +2511,87 @@ class NarratorEngine:
         Returns:
             Markdown formatted daily reflection narrative
         """
+        now = datetime.now(timezone.utc)
         if date is None:
-            date = datetime.now(timezone.utc)
+            date = now
 
         # Get start of day
         start_of_day = date.replace(hour=0, minute=0, second=0, microsecond=0)
         end_of_day = start_of_day + timedelta(days=1)
 
-        # Get episodes for this day
+        date_str = date.strftime("%Y-%m-%d")
+        return self._cached_reflection(
+            "daily",
+            start_of_day,
+            end_of_day,
+            _SELECT_RANGE_NARRATIVES_SQL,
+            functools.partial(_render_daily_reflection, date_str),
+            now=now,
+        )
+
+    def _cached_reflection(
+        self,
+        kind: str,
+        start: datetime,
+        end: datetime,
+        sql: str,
+        render: Callable[[list[sqlite3.Row]], str],
+        *,
+        now: datetime,
+    ) -> str:
+        """
+        Render a reflection from ``sql`` over ``[start, end)``, caching closed ranges.
+
+        Ranges that ended before ``now`` are served from reflection_cache; the
+        episode triggers evict an entry when a write touches its range.
+        Ranges still open (today, this week) are always recomputed.
+        """
+        key = (kind, _to_epoch_micros(start), _to_epoch_micros(end))
+        closed = key[2] <= _to_epoch_micros(now)
         conn = self._get_connection()
         try:
-            conn.row_factory = sqlite3.Row
-            rows = conn.execute(
-                """
-                SELECT * FROM episodic_entries
-                WHERE timestamp >= ? AND timestamp < ?
-                ORDER BY timestamp ASC
-                """,
-                (start_of_day.isoformat(), end_of_day.isoformat()),
-            ).fetchall()
+            if not closed:
+                return render(conn.execute(sql, key[1:]).fetchall())
+            row = conn.execute(_SELECT_REFLECTION_CACHE_SQL, key).fetchone()
+            if row is not None:
+                return row[0]
+            # Query and store inside one write transaction, so an episode
+            # committed in between cannot leave a stale entry behind
+            with self._write_lock:
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    markdown = render(conn.execute(sql, key[1:]).fetchall())
+                    conn.execute(_STORE_REFLECTION_CACHE_SQL, (*key, markdown))
+                except Exception:
+                    conn.rollback()
+                    raise
+                conn.execute("COMMIT")
+            return markdown
         finally:
-            self._close_if_not_persistent(conn)
-
-        episodes = [self._row_to_episode(row) for row in rows]
-
-        if not episodes:
-            return f"# Daily Reflection - {date.strftime('%Y-%m-%d')}\n\nA quiet day. No notable episodes recorded."
+            self._release_connection(conn)
 
-        # Build narrative
-        lines = [
-            f"# Daily Reflection - {date.strftime('%Y-%m-%d')}",
-            "",
-            "## The Day's Journey",
-            "",
-        ]
+    def _type_rollup_between(
+        self,
+        start: datetime,
+        end: datetime,
+    ) -> list[tuple[EpisodeType, int, str]]:
+        """
+        Summarize episodes in ``[start, end)`` per type.
 
-        # Group by episode type
-        by_type: dict[EpisodeType, list[EpisodicEntry]] = {}
-        for ep in episodes:
-            by_type.setdefault(ep.episode_type, []).append(ep)
-
-        # Summarize each type
-        if EpisodeType.AFFECT_SHIFT in by_type:
-            lines.append("### Emotional Landscape")
-            for ep in by_type[EpisodeType.AFFECT_SHIFT]:
-                lines.append(f"- {ep.narrative}")
-            lines.append("")
-
-        if EpisodeType.ATTENTION_FOCUS in by_type:
-            lines.append("### Focus & Attention")
-            for ep in by_type[EpisodeType.ATTENTION_FOCUS]:
-                lines.append(f"- {ep.narrative}")
-            lines.append("")
-
-        if EpisodeType.DRIVE_ACTIVATED in by_type or EpisodeType.DRIVE_SATISFIED in by_type:
-            lines.append("### Motivations & Drives")
-            for ep in by_type.get(EpisodeType.DRIVE_ACTIVATED, []):
-                lines.append(f"- {ep.narrative}")
-            for ep in by_type.get(EpisodeType.DRIVE_SATISFIED, []):
-                lines.append(f"- {ep.narrative}")
-            lines.append("")
-
-        if EpisodeType.GOAL_ADDED in by_type or EpisodeType.GOAL_COMPLETED in by_type:
-            lines.append("### Goals & Achievements")
-            for ep in by_type.get(EpisodeType.GOAL_ADDED, []):
-                lines.append(f"- {ep.narrative}")
-            for ep in by_type.get(EpisodeType.GOAL_COMPLETED, []):
-                lines.append(f"- {ep.narrative}")
-            lines.append("")
-
-        if EpisodeType.OBSERVATION in by_type:
-            lines.append("### Observations")
-            for ep in by_type[EpisodeType.OBSERVATION]:
-                lines.append(f"- {ep.narrative}")
-            lines.append("")
-
-        # Summary stats
-        lines.extend(
-            [
-                "## Summary",
-                "",
-                f"- Total episodes: {len(episodes)}",
-                f"- Episode types: {', '.join(t.value for t in by_type.keys())}",
-            ],
-        )
+        Returns:
+            (episode type, count, first narrative) tuples, ordered by each
+            type's first appearance
+        """
+        conn = self._get_connection()
+        try:
+            rows = conn.execute(
+                _TYPE_ROLLUP_RANGE_SQL,
+                (_to_epoch_micros(start), _to_epoch_micros(end)),
+            ).fetchall()
+        finally:
+            self._release_connection(conn)
 
-        return "\n".join(lines)
+        return _type_rollup(rows)
 
     def generate_weekly_reflection_narrative(
         self,
@@ -1548,108 +2606,51 @@ class NarratorEngine:
         Returns:
             Markdown formatted weekly reflection narrative
         """
+        now = datetime.now(timezone.utc)
         if week_start is None:
-            today = datetime.now(timezone.utc)
             # Get Monday of current week
-            week_start = today - timedelta(days=today.weekday())
+            week_start = now - timedelta(days=now.weekday())
         week_start = week_start.replace(hour=0, minute=0, second=0, microsecond=0)
         week_end = week_start + timedelta(days=7)
 
-        # Get episodes for this week
-        conn = self._get_connection()
-        try:
-            conn.row_factory = sqlite3.Row
-            rows = conn.execute(
-                """
-                SELECT * FROM episodic_entries
-                WHERE timestamp >= ? AND timestamp < ?
-                ORDER BY timestamp ASC
-                """,
-                (week_start.isoformat(), week_end.isoformat()),
-            ).fetchall()
-        finally:
-            self._close_if_not_persistent(conn)
-
-        episodes = [self._row_to_episode(row) for row in rows]
-
-        week_num = week_start.isocalendar()[1]
-        year = week_start.year
-
-        if not episodes:
-            return f"# Weekly Reflection - Week {week_num}, {year}\n\nA quiet week. No notable episodes recorded."
-
-        # Build narrative
-        lines = [
-            f"# Weekly Reflection - Week {week_num}, {year}",
-            "",
-            "## Week Overview",
-            "",
-        ]
-
-        # Count by type
-        type_counts: dict[str, int] = {}
-        for ep in episodes:
-            type_counts[ep.episode_type.value] = type_counts.get(ep.episode_type.value, 0) + 1
-
-        lines.append(f"This week saw {len(episodes)} recorded moments across my experience:")
-        lines.append("")
-        for etype, count in sorted(type_counts.items()):
-            lines.append(f"- **{etype.replace('_', ' ').title()}**: {count} episodes")
-        lines.append("")
-
-        # Highlight key episodes
-        lines.extend(
-            [
-                "## Highlights",
-                "",
-            ],
+        # Per-type counts and first narratives, aggregated in SQL; the
+        # overview never needs the episodes themselves
+        return self._cached_reflection(
+            "weekly",
+            week_start,
+            week_end,
+            _TYPE_ROLLUP_RANGE_SQL,
+            functools.partial(_render_weekly_reflection, week_start),
+            now=now,
         )
 
-        # Get most significant episodes (first of each type)
-        seen_types: set[EpisodeType] = set()
-        for ep in episodes:
-            if ep.episode_type not in seen_types:
-                lines.append(f"- {ep.narrative}")
-                seen_types.add(ep.episode_type)
-                if len(seen_types) >= 5:
-                    break
-        lines.append("")
 
-        # Goals summary
-        goals_added = [ep for ep in episodes if ep.episode_type == EpisodeType.GOAL_ADDED]
-        goals_completed = [ep for ep in episodes if ep.episode_type == EpisodeType.GOAL_COMPLETED]
+# =============================================================================
+# Singleton Pattern
+# =============================================================================
 
-        if goals_added or goals_completed:
-            lines.extend(
-                [
-                    "## Goals Progress",
-                    "",
-                    f"- Goals set: {len(goals_added)}",
-                    f"- Goals completed: {len(goals_completed)}",
-                    "",
-                ],
-            )
+_narrator_instance: NarratorEngine | None = None
+_config: NarratorConfig | None = None
 
-        # Emotional summary
-        affect_shifts = [ep for ep in episodes if ep.episode_type == EpisodeType.AFFECT_SHIFT]
-        if affect_shifts:
-            lines.extend(
-                [
-                    "## Emotional Journey",
-                    "",
-                    f"Experienced {len(affect_shifts)} notable emotional shifts this week.",
-                    "",
-                ],
-            )
 
-        return "\n".join(lines)
+def get_config() -> NarratorConfig:
+    """
+    Get the shared NarratorConfig loaded from Identity.yaml.
 
+    The config is immutable, so one instance is loaded once and shared by
+    reference. Use ``reload_config()`` to pick up edits to Identity.yaml.
+    """
+    global _config
+    if _config is None:
+        _config = NarratorConfig.from_identity()
+    return _config
 
-# =============================================================================
-# Singleton Pattern
-# =============================================================================
 
-_narrator_instance: NarratorEngine | None = None
+def reload_config(identity_path: str | None = None) -> NarratorConfig:
+    """Re-read Identity.yaml and replace the shared NarratorConfig."""
+    global _config
+    _config = NarratorConfig.from_identity(identity_path)
+    return _config
 
 
 def get_narrator(
@@ -1,10 +1,39 @@
 from __future__ import annotations
 
+import os
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 import yaml
 
 
-def load_persona(path: str) -> dict[str, Any]:
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# path -> (mtime_ns, size, frozen persona); an edited file misses on its stat key
+_cache: dict[str, tuple[int, int, Mapping[str, Any]]] = {}
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def load_persona(path: str) -> Mapping[str, Any]:
+    """
+    Load a persona YAML file, reusing the parse while the file is unchanged.
+
+    The result is shared between callers, so it is returned deep-frozen.
+    """
+    st = os.stat(path)
+    cached = _cache.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
     with open(path, encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        persona = _freeze(yaml.load(f, Loader=_YAML_LOADER))
+    _cache[path] = (st.st_mtime_ns, st.st_size, persona)
+    return persona
@@ -10,11 +10,18 @@ Stage 3.5: Persona Pack System Implementation
 from __future__ import annotations
 
 import json
+import logging
+import os
+import queue
 import sqlite3
+import sys
+import tempfile
+import threading
+import time
 import uuid
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -22,11 +29,97 @@ from typing import TYPE_CHECKING, Any
 import yaml
 
 
+try:
+    import orjson  # Optional: faster JSON for switch-log columns
+except ImportError:  # pragma: no cover
+    orjson = None
+
 if TYPE_CHECKING:
     from bartholomew.kernel.experience_kernel import ExperienceKernel
     from bartholomew.kernel.global_workspace import GlobalWorkspace
 
 
+logger = logging.getLogger(__name__)
+
+# Prefer libyaml's C loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize to a JSON string, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass  # e.g. ints wider than 64 bits; stdlib json handles them
+    return json.dumps(obj)
+
+
+def _json_loads(data: str | bytes) -> Any:
+    """Parse a JSON string, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except ValueError:
+            pass  # e.g. NaN written by stdlib json
+    return json.loads(data)
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_epoch_micros(dt: datetime) -> int:
+    """Convert a datetime to integer microseconds since the Unix epoch (naive = UTC)."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH) // _ONE_MICROSECOND
+
+
+def _from_epoch_micros(micros: int) -> datetime:
+    """Convert integer microseconds since the Unix epoch to an aware UTC datetime."""
+    return _EPOCH + timedelta(microseconds=micros)
+
+
+def _read_pack_yaml(path: Path) -> Any:
+    """
+    Parse a pack YAML file, via a JSON sidecar (``<name>.yaml.json``) when fresh.
+
+    The sidecar records the source's mtime and size and is only trusted
+    while both still match. A missing or stale sidecar is rewritten
+    atomically after the YAML parse; unwritable directories and data that
+    is not plain JSON (e.g. YAML timestamps) just skip the sidecar.
+    """
+    st = path.stat()
+    sidecar = path.with_name(path.name + ".json")
+    try:
+        cached = _json_loads(sidecar.read_bytes())
+        if cached["source_mtime_ns"] == st.st_mtime_ns and cached["source_size"] == st.st_size:
+            return cached["data"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass  # no usable sidecar; fall back to the YAML
+
+    with open(path, encoding="utf-8") as f:
+        data = yaml.load(f, Loader=_YAML_LOADER)
+
+    try:
+        # stdlib json is strict: anything it cannot encode stays YAML-only
+        payload = json.dumps(
+            {"source_mtime_ns": st.st_mtime_ns, "source_size": st.st_size, "data": data},
+        )
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp, sidecar)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except (OSError, TypeError, ValueError):
+        pass
+    return data
+
+
 # =============================================================================
 # Style Configuration
 # =============================================================================
@@ -50,7 +143,20 @@ class Formality(Enum):
     FORMAL = "formal"  # Highly structured
 
 
-@dataclass
+# Plain value -> member dicts; Enum.__call__ is slow on the pack-loading path
+_BREVITY_BY_VALUE = {member.value: member for member in Brevity}
+_FORMALITY_BY_VALUE = {member.value: member for member in Formality}
+
+
+def _enum_by_value(table: dict[str, Enum], enum_cls: type[Enum], value: Any) -> Any:
+    """Look up an enum member by value, raising ValueError like ``enum_cls(value)``."""
+    try:
+        return table[value]
+    except (KeyError, TypeError):
+        raise ValueError(f"{value!r} is not a valid {enum_cls.__name__}") from None
+
+
+@dataclass(slots=True)
 class StyleConfig:
     """
     Configuration for communication style within a persona pack.
@@ -93,8 +199,12 @@ class StyleConfig:
     def from_dict(cls, data: dict[str, Any]) -> StyleConfig:
         """Deserialize from dictionary."""
         return cls(
-            brevity=Brevity(data.get("brevity", "balanced")),
-            formality=Formality(data.get("formality", "conversational")),
+            brevity=_enum_by_value(_BREVITY_BY_VALUE, Brevity, data.get("brevity", "balanced")),
+            formality=_enum_by_value(
+                _FORMALITY_BY_VALUE,
+                Formality,
+                data.get("formality", "conversational"),
+            ),
             humor_allowed=data.get("humor_allowed", True),
             emoji_allowed=data.get("emoji_allowed", False),
             technical_depth=data.get("technical_depth", 0.5),
@@ -108,13 +218,15 @@ class StyleConfig:
 # =============================================================================
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PersonaPack:
     """
     A complete persona configuration that can be loaded and switched at runtime.
 
     Persona packs define how Bartholomew presents itself, including voice,
-    drive priorities, and narrative templates.
+    drive priorities, and narrative templates. Packs are immutable: keyword
+    lists are stored as tuples, and those keywords and the drive IDs are
+    interned since the same few strings recur across every loaded pack.
     """
 
     pack_id: str
@@ -127,7 +239,7 @@ class PersonaPack:
     """Brief description of this persona"""
 
     # Voice & Style
-    tone: list[str] = field(default_factory=lambda: ["warm", "helpful"])
+    tone: tuple[str, ...] = ("warm", "helpful")
     """Tone keywords, e.g., ['precise', 'urgent', 'supportive']"""
 
     style: StyleConfig = field(default_factory=StyleConfig)
@@ -142,14 +254,14 @@ class PersonaPack:
     """Override narrator templates: {episode_type: {tone: [templates]}}"""
 
     # Trigger Conditions
-    auto_activate_on: list[str] = field(default_factory=list)
+    auto_activate_on: tuple[str, ...] = ()
     """Context tags that auto-activate this persona, e.g., ['gaming', 'crisis']"""
 
     # Archetype references
     archetype: str = "companion"
     """Primary archetype: 'companion', 'tactical', 'caregiver', 'mentor'"""
 
-    inspirations: list[str] = field(default_factory=list)
+    inspirations: tuple[str, ...] = ()
     """Character inspirations, e.g., ['Baymax', 'JARVIS', 'Cortana']"""
 
     # Metadata
@@ -165,19 +277,33 @@ class PersonaPack:
     is_default: bool = False
     """Whether this is the default pack"""
 
+    def __post_init__(self) -> None:
+        """Store keyword lists as tuples of interned strings and intern drive IDs."""
+        for name in ("tone", "auto_activate_on", "inspirations"):
+            object.__setattr__(
+                self,
+                name,
+                tuple(sys.intern(word) for word in getattr(self, name)),
+            )
+        object.__setattr__(
+            self,
+            "drive_boosts",
+            {sys.intern(drive_id): boost for drive_id, boost in self.drive_boosts.items()},
+        )
+
     def to_dict(self) -> dict[str, Any]:
         """Serialize to dictionary for YAML/JSON storage."""
         return {
             "pack_id": self.pack_id,
             "name": self.name,
             "description": self.description,
-            "tone": self.tone,
+            "tone": list(self.tone),
             "style": self.style.to_dict(),
             "drive_boosts": self.drive_boosts,
             "narrative_overrides": self.narrative_overrides,
-            "auto_activate_on": self.auto_activate_on,
+            "auto_activate_on": list(self.auto_activate_on),
             "archetype": self.archetype,
-            "inspirations": self.inspirations,
+            "inspirations": list(self.inspirations),
             "created_at": self.created_at.isoformat(),
             "author": self.author,
             "version": self.version,
@@ -187,12 +313,12 @@ class PersonaPack:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> PersonaPack:
         """Deserialize from dictionary."""
-        created_at = datetime.now(timezone.utc)
-        if data.get("created_at"):
-            if isinstance(data["created_at"], str):
-                created_at = datetime.fromisoformat(data["created_at"])
-            elif isinstance(data["created_at"], datetime):
-                created_at = data["created_at"]
+        # Only stamp "now" when the pack carries no usable created_at
+        created_at = data.get("created_at")
+        if isinstance(created_at, str) and created_at:
+            created_at = datetime.fromisoformat(created_at)
+        elif not isinstance(created_at, datetime):
+            created_at = datetime.now(timezone.utc)
 
         style = StyleConfig()
         if data.get("style"):
@@ -202,13 +328,13 @@ class PersonaPack:
             pack_id=data["pack_id"],
             name=data.get("name", data["pack_id"]),
             description=data.get("description", ""),
-            tone=data.get("tone", ["warm", "helpful"]),
+            tone=data.get("tone", ("warm", "helpful")),
             style=style,
             drive_boosts=data.get("drive_boosts", {}),
             narrative_overrides=data.get("narrative_overrides", {}),
-            auto_activate_on=data.get("auto_activate_on", []),
+            auto_activate_on=data.get("auto_activate_on", ()),
             archetype=data.get("archetype", "companion"),
-            inspirations=data.get("inspirations", []),
+            inspirations=data.get("inspirations", ()),
             created_at=created_at,
             author=data.get("author", "system"),
             version=data.get("version", "1.0.0"),
@@ -220,7 +346,7 @@ class PersonaPack:
         """Load a persona pack from a YAML file."""
         path = Path(path)
         with open(path, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YAML_LOADER)
         return cls.from_dict(data)
 
     def save_to_yaml(self, path: str | Path) -> None:
@@ -236,7 +362,7 @@ class PersonaPack:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class PersonaSwitchRecord:
     """
     Record of a persona switch for audit purposes.
@@ -296,7 +422,7 @@ class PersonaSwitchRecord:
 PERSONA_PACK_SCHEMA = """
 CREATE TABLE IF NOT EXISTS persona_switch_log (
     id TEXT PRIMARY KEY,
-    timestamp TEXT NOT NULL,
+    timestamp INTEGER NOT NULL,  -- microseconds since Unix epoch (UTC)
     from_pack_id TEXT,
     to_pack_id TEXT NOT NULL,
     trigger TEXT NOT NULL,
@@ -312,11 +438,89 @@ CREATE INDEX IF NOT EXISTS idx_persona_switch_to_pack
 ON persona_switch_log(to_pack_id);
 """
 
+# Statement text kept at module level so sqlite3's per-connection
+# statement cache sees identical strings on every call
+_INSERT_SWITCH_SQL = (
+    "INSERT INTO persona_switch_log "
+    "(id, timestamp, from_pack_id, to_pack_id, trigger, context_tags_json, metadata_json) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+_SELECT_SWITCH_HISTORY_SQL = (
+    "SELECT id, timestamp, from_pack_id, to_pack_id, trigger, context_tags_json, metadata_json "
+    "FROM persona_switch_log ORDER BY timestamp DESC LIMIT ?"
+)
+_COUNT_SWITCHES_SQL = "SELECT COUNT(*) FROM persona_switch_log"
+
+# Per-connection tuning; journal_mode=WAL persists in the file (_init_database)
+_CONNECT_PRAGMAS = (
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+)
+
+
+# Background switch-log writer: most records per transaction, and how long
+# to keep gathering after the first record arrives
+_LOG_WRITER_MAX_BATCH = 100
+_LOG_WRITER_MAX_WAIT = 0.2
+
+# Queued to the background writer to make it exit
+_LOG_WRITER_STOP = object()
+
+
+def _configure_connection(conn: sqlite3.Connection) -> sqlite3.Connection:
+    """Apply the Row factory and per-connection PRAGMAs to a fresh connection."""
+    conn.row_factory = sqlite3.Row
+    for pragma in _CONNECT_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def _migrate_switch_timestamps_to_micros(conn: sqlite3.Connection) -> bool:
+    """
+    Rebuild a legacy persona_switch_log whose timestamp column is TEXT.
+
+    Earlier schemas stored ISO-8601 strings. TEXT affinity would coerce the
+    integer micros back to strings, so the table is recreated and its rows
+    copied across with converted timestamps.
+
+    Returns:
+        True if a migration ran
+    """
+    columns = conn.execute("PRAGMA table_info(persona_switch_log)").fetchall()
+    if not any(col[1] == "timestamp" and col[2].upper() == "TEXT" for col in columns):
+        return False
+
+    conn.create_function(
+        "iso_to_epoch_micros",
+        1,
+        lambda value: _to_epoch_micros(datetime.fromisoformat(value)),
+        deterministic=True,
+    )
+    conn.executescript(
+        f"""
+        BEGIN;
+        ALTER TABLE persona_switch_log RENAME TO persona_switch_log_legacy;
+        DROP INDEX IF EXISTS idx_persona_switch_timestamp;
+        DROP INDEX IF EXISTS idx_persona_switch_to_pack;
+        {PERSONA_PACK_SCHEMA}
+        INSERT INTO persona_switch_log
+        SELECT id, iso_to_epoch_micros(timestamp), from_pack_id, to_pack_id, trigger,
+               context_tags_json, metadata_json, created_at
+        FROM persona_switch_log_legacy;
+        DROP TABLE persona_switch_log_legacy;
+        COMMIT;
+        """,
+    )
+    return True
+
 
 # =============================================================================
 # Persona Pack Manager
 # =============================================================================
 
+# Called as callback(from_pack, to_pack) after each switch
+_SwitchCallback = Callable[[PersonaPack | None, PersonaPack], None]
+
 
 class PersonaPackManager:
     """
@@ -336,6 +540,9 @@ class PersonaPackManager:
         experience_kernel: ExperienceKernel | None = None,
         workspace: GlobalWorkspace | None = None,
         db_path: str | None = None,
+        *,
+        switch_log_batch_size: int = 1,
+        switch_log_async: bool = False,
     ):
         """
         Initialize the Persona Pack Manager.
@@ -345,44 +552,120 @@ class PersonaPackManager:
             experience_kernel: ExperienceKernel for drive boost application
             workspace: GlobalWorkspace for event emission
             db_path: Path to SQLite DB for switch logging
+            switch_log_batch_size: Buffer this many switch records before
+                writing them in one transaction (1 writes every switch
+                immediately). Buffered records are written by ``flush()``,
+                ``close()`` and before switch history is read.
+            switch_log_async: Hand switch records to a background writer
+                thread so ``switch_pack`` does not wait on the disk. The
+                writer commits up to 100 records per transaction, at most
+                200 ms after the first arrives. Ignored for in-memory
+                databases, which always log synchronously.
         """
         self._packs_dir = Path(packs_dir) if packs_dir else Path(self.DEFAULT_PACKS_DIR)
         self._kernel = experience_kernel
         self._workspace = workspace
         self._db_path = db_path or ":memory:"
 
+        # Optional buffering of switch-log writes
+        self._switch_log_batch_size = switch_log_batch_size
+        self._pending_switches: list[PersonaSwitchRecord] = []
+        self._pending_lock = threading.Lock()
+
         # Pack registry
         self._packs: dict[str, PersonaPack] = {}
         self._active_pack_id: str | None = None
 
+        # Reverse index: auto-activate tag -> pack IDs, in registration order
+        self._auto_activate_index: dict[str, list[str]] = {}
+
         # Switch callbacks
-        self._on_switch_callbacks: list[Callable[[PersonaPack | None, PersonaPack], None]] = []
+        # Rebuilt as a new tuple on (un)registration so switch_pack iterates
+        # a stable snapshot even if a callback unregisters itself
+        self._on_switch_callbacks: tuple[_SwitchCallback, ...] = ()
 
         # For in-memory databases, keep a persistent connection
         self._conn: sqlite3.Connection | None = None
+
+        # File databases reuse one connection per thread instead of opening
+        # one per call; tracked so close() can shut them all down
+        self._local = threading.local()
+        self._thread_conns: list[sqlite3.Connection] = []
+        self._thread_conns_lock = threading.Lock()
+
         if self._db_path == ":memory:":
-            self._conn = sqlite3.connect(":memory:")
+            self._conn = _configure_connection(sqlite3.connect(":memory:"))
             self._conn.executescript(PERSONA_PACK_SCHEMA)
         else:
             self._init_database()
 
+        # Optional background writer for switch records
+        self._log_queue: queue.SimpleQueue[Any] | None = None
+        self._log_writer: threading.Thread | None = None
+        if switch_log_async and self._conn is None:
+            self._log_queue = queue.SimpleQueue()
+            self._log_writer = threading.Thread(
+                target=self._log_worker,
+                name="persona-switch-log",
+                daemon=True,
+            )
+            self._log_writer.start()
+
         # Auto-load packs from directory
         self._load_packs_from_directory()
 
     def _init_database(self) -> None:
         """Initialize database schema for switch logging."""
-        with sqlite3.connect(self._db_path) as conn:
-            conn.executescript(PERSONA_PACK_SCHEMA)
+        conn = self._get_connection()
+        conn.execute("PRAGMA journal_mode = WAL")
+        _migrate_switch_timestamps_to_micros(conn)
+        conn.executescript(PERSONA_PACK_SCHEMA)
 
     def _get_connection(self) -> sqlite3.Connection:
-        """Get a database connection."""
+        """Get a database connection (reused per thread for file databases)."""
         if self._conn is not None:
             return self._conn
-        return sqlite3.connect(self._db_path)
-
-    def _close_if_not_persistent(self, conn: sqlite3.Connection) -> None:
-        """Close connection if it's not the persistent one."""
-        if conn is not self._conn:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Only ever used by this thread; check_same_thread=False lets
+            # close() shut it down from whichever thread stops the manager
+            conn = _configure_connection(sqlite3.connect(self._db_path, check_same_thread=False))
+            self._local.conn = conn
+            with self._thread_conns_lock:
+                self._thread_conns.append(conn)
+        return conn
+
+    def _release_connection(self, conn: sqlite3.Connection) -> None:
+        """Roll back anything a failed call left open on a per-thread connection."""
+        if conn is not self._conn and conn.in_transaction:
+            conn.rollback()
+
+    def close(self) -> None:
+        """Write buffered switch records and close the switch-log database connections."""
+        self.flush()
+        writer, self._log_writer = self._log_writer, None
+        log_queue, self._log_queue = self._log_queue, None
+        if writer is not None:
+            # Later switches now take the synchronous path; anything a racing
+            # switch queued behind the stop marker is written here
+            log_queue.put(_LOG_WRITER_STOP)
+            writer.join()
+            leftovers: list[PersonaSwitchRecord] = []
+            while True:
+                try:
+                    item = log_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if isinstance(item, threading.Event):
+                    item.set()
+                else:
+                    leftovers.append(item)
+            if leftovers:
+                self.flush_switch_records(leftovers)
+        with self._thread_conns_lock:
+            conns, self._thread_conns = self._thread_conns, []
+        self._local = threading.local()
+        for conn in conns:
             conn.close()
 
     def _load_packs_from_directory(self) -> None:
@@ -392,7 +675,7 @@ class PersonaPackManager:
 
         for yaml_file in self._packs_dir.glob("*.yaml"):
             try:
-                pack = PersonaPack.load_from_yaml(yaml_file)
+                pack = PersonaPack.from_dict(_read_pack_yaml(yaml_file))
                 self._packs[pack.pack_id] = pack
 
                 # Auto-activate default pack
@@ -402,6 +685,16 @@ class PersonaPackManager:
                 # Skip invalid pack files
                 pass
 
+        self._rebuild_auto_activate_index()
+
+    def _rebuild_auto_activate_index(self) -> None:
+        """Rebuild the tag -> pack IDs index after the registry changes."""
+        index: dict[str, list[str]] = {}
+        for pack in self._packs.values():
+            for trigger_tag in pack.auto_activate_on:
+                index.setdefault(trigger_tag, []).append(pack.pack_id)
+        self._auto_activate_index = index
+
     # =========================================================================
     # Pack Registration
     # =========================================================================
@@ -414,6 +707,7 @@ class PersonaPackManager:
             pack: PersonaPack to register
         """
         self._packs[pack.pack_id] = pack
+        self._rebuild_auto_activate_index()
 
         # Auto-activate if default and no active pack
         if pack.is_default and self._active_pack_id is None:
@@ -437,6 +731,7 @@ class PersonaPackManager:
             return False
 
         del self._packs[pack_id]
+        self._rebuild_auto_activate_index()
         return True
 
     def get_pack(self, pack_id: str) -> PersonaPack | None:
@@ -560,28 +855,95 @@ class PersonaPackManager:
                 pass  # Unknown drive, skip
 
     def _log_switch(self, record: PersonaSwitchRecord) -> None:
-        """Log a persona switch to the database."""
+        """Log a persona switch to the database, or hand it to the writer or buffer."""
+        log_queue = self._log_queue
+        if log_queue is not None:
+            log_queue.put(record)
+            return
+        if self._switch_log_batch_size <= 1:
+            self.flush_switch_records([record])
+            return
+        with self._pending_lock:
+            self._pending_switches.append(record)
+            full = len(self._pending_switches) >= self._switch_log_batch_size
+        if full:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write any buffered switch records, waiting for the background writer."""
+        with self._pending_lock:
+            pending, self._pending_switches = self._pending_switches, []
+        if pending:
+            self.flush_switch_records(pending)
+        log_queue = self._log_queue
+        if log_queue is not None and self._log_writer is not None:
+            # The writer commits everything queued ahead of the marker first
+            done = threading.Event()
+            log_queue.put(done)
+            done.wait()
+
+    def _log_worker(self) -> None:
+        """Background writer: gather queued switch records and commit them in batches."""
+        log_queue = self._log_queue
+        while True:
+            item = log_queue.get()
+            batch: list[PersonaSwitchRecord] = []
+            waiters: list[threading.Event] = []
+            deadline = time.monotonic() + _LOG_WRITER_MAX_WAIT
+            while item is not _LOG_WRITER_STOP:
+                if isinstance(item, threading.Event):
+                    # Someone is waiting on a flush; write what we have now
+                    waiters.append(item)
+                    break
+                batch.append(item)
+                remaining = deadline - time.monotonic()
+                if len(batch) >= _LOG_WRITER_MAX_BATCH or remaining <= 0:
+                    break
+                try:
+                    item = log_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            try:
+                self.flush_switch_records(batch)
+            except Exception:
+                # Keep the writer alive; a dead writer would hang flush()
+                logger.exception("Failed to write %d persona switch records", len(batch))
+            for waiter in waiters:
+                waiter.set()
+            if item is _LOG_WRITER_STOP:
+                return
+
+    def flush_switch_records(self, records: list[PersonaSwitchRecord]) -> int:
+        """
+        Write a batch of switch records in a single transaction.
+
+        Args:
+            records: Switch records to append to the log
+
+        Returns:
+            Number of records written
+        """
+        if not records:
+            return 0
+        params = [
+            (
+                record.record_id,
+                _to_epoch_micros(record.timestamp),
+                record.from_pack_id,
+                record.to_pack_id,
+                record.trigger,
+                _json_dumps(record.context_tags),
+                _json_dumps(record.metadata),
+            )
+            for record in records
+        ]
         conn = self._get_connection()
         try:
-            conn.execute(
-                """
-                INSERT INTO persona_switch_log
-                (id, timestamp, from_pack_id, to_pack_id, trigger, context_tags_json, metadata_json)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    record.record_id,
-                    record.timestamp.isoformat(),
-                    record.from_pack_id,
-                    record.to_pack_id,
-                    record.trigger,
-                    json.dumps(record.context_tags),
-                    json.dumps(record.metadata),
-                ),
-            )
-            conn.commit()
+            with conn:
+                conn.executemany(_INSERT_SWITCH_SQL, params)
         finally:
-            self._close_if_not_persistent(conn)
+            self._release_connection(conn)
+        return len(params)
 
     # =========================================================================
     # Auto-Activation
@@ -597,16 +959,16 @@ class PersonaPackManager:
         Returns:
             Pack ID that should be activated, or None
         """
-        for pack in self._packs.values():
-            if not pack.auto_activate_on:
-                continue
+        index = self._auto_activate_index
+        if not index:
+            return None
 
-            # Check if any auto-activate tag matches
-            for trigger_tag in pack.auto_activate_on:
-                if trigger_tag in context_tags:
-                    return pack.pack_id
+        matched = {pack_id for tag in set(context_tags) for pack_id in index.get(tag, ())}
+        if len(matched) <= 1:
+            return matched.pop() if matched else None
 
-        return None
+        # Several packs match: the earliest registered wins
+        return next(pack_id for pack_id in self._packs if pack_id in matched)
 
     def auto_activate_if_needed(self, context_tags: list[str]) -> bool:
         """
@@ -631,29 +993,28 @@ class PersonaPackManager:
     # Callbacks
     # =========================================================================
 
-    def on_switch(self, callback: Callable[[PersonaPack | None, PersonaPack], None]) -> None:
+    def on_switch(self, callback: _SwitchCallback) -> None:
         """
         Register a callback to be called when persona is switched.
 
         Args:
             callback: Function(from_pack, to_pack) to call
         """
-        self._on_switch_callbacks.append(callback)
+        self._on_switch_callbacks += (callback,)
 
-    def remove_switch_callback(
-        self,
-        callback: Callable[[PersonaPack | None, PersonaPack], None],
-    ) -> bool:
+    def remove_switch_callback(self, callback: _SwitchCallback) -> bool:
         """
         Remove a switch callback.
 
         Returns:
             True if callback was found and removed
         """
-        if callback in self._on_switch_callbacks:
-            self._on_switch_callbacks.remove(callback)
-            return True
-        return False
+        callbacks = self._on_switch_callbacks
+        if callback not in callbacks:
+            return False
+        index = callbacks.index(callback)
+        self._on_switch_callbacks = callbacks[:index] + callbacks[index + 1 :]
+        return True
 
     # =========================================================================
     # Switch History
@@ -669,42 +1030,47 @@ class PersonaPackManager:
         Returns:
             List of switch records, most recent first
         """
+        return list(self.iter_switch_history(limit))
+
+    def iter_switch_history(self, limit: int = 20) -> Iterator[PersonaSwitchRecord]:
+        """
+        Iterate recent persona switch history, most recent first.
+
+        Records are built as rows are stepped from the cursor, so a caller
+        that stops early never decodes the rest.
+
+        Args:
+            limit: Maximum number of records to yield
+        """
+        self.flush()
         conn = self._get_connection()
+        cur = conn.cursor()
+        # Plain tuples; the columns are listed in _SELECT_SWITCH_HISTORY_SQL
+        cur.row_factory = None
         try:
-            conn.row_factory = sqlite3.Row
-            rows = conn.execute(
-                """
-                SELECT * FROM persona_switch_log
-                ORDER BY timestamp DESC
-                LIMIT ?
-                """,
-                (limit,),
-            ).fetchall()
+            cur.execute(_SELECT_SWITCH_HISTORY_SQL, (limit,))
+            for record_id, timestamp, from_id, to_id, trigger, tags_json, meta_json in cur:
+                yield PersonaSwitchRecord(
+                    record_id=record_id,
+                    timestamp=_from_epoch_micros(timestamp),
+                    from_pack_id=from_id,
+                    to_pack_id=to_id,
+                    trigger=trigger,
+                    context_tags=_json_loads(tags_json) if tags_json else [],
+                    metadata=_json_loads(meta_json) if meta_json else {},
+                )
         finally:
-            self._close_if_not_persistent(conn)
-
-        return [
-            PersonaSwitchRecord(
-                record_id=row["id"],
-                timestamp=datetime.fromisoformat(row["timestamp"]),
-                from_pack_id=row["from_pack_id"],
-                to_pack_id=row["to_pack_id"],
-                trigger=row["trigger"],
-                context_tags=(
-                    json.loads(row["context_tags_json"]) if row["context_tags_json"] else []
-                ),
-                metadata=json.loads(row["metadata_json"]) if row["metadata_json"] else {},
-            )
-            for row in rows
-        ]
+            cur.close()
+            self._release_connection(conn)
 
     def get_switch_count(self) -> int:
         """Get total number of persona switches."""
+        self.flush()
         conn = self._get_connection()
         try:
-            count = conn.execute("SELECT COUNT(*) FROM persona_switch_log").fetchone()[0]
+            count = conn.execute(_COUNT_SWITCHES_SQL).fetchone()[0]
         finally:
-            self._close_if_not_persistent(conn)
+            self._release_connection(conn)
         return count
 
     # =========================================================================
@@ -747,7 +1113,7 @@ class PersonaPackManager:
         """Get the tone keywords for the active pack."""
         pack = self.get_active_pack()
         if pack:
-            return pack.tone
+            return list(pack.tone)
         return ["warm", "helpful"]
 
 
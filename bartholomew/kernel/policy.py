@@ -9,35 +9,82 @@ import yaml
 
 logger = logging.getLogger(__name__)
 
-# Cache for policy to avoid repeated file reads
+# Prefer libyaml's C loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_DEFAULT_POLICY_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "config", "policy.yaml")
+
+# Active policy consulted by can_index(). Tests and embedders may assign a
+# dict here directly; such a policy is used as-is and never reloaded.
 _policy_cache: dict[str, Any] | None = None
 
+# (path, policy) that load_policy() itself installed into _policy_cache, so a
+# directly assigned policy can be told apart from one backed by a file
+_policy_source: tuple[str, dict[str, Any]] | None = None
+
+# abspath -> ((mtime_ns, size) or None if unreadable, parsed policy)
+_policy_files: dict[str, tuple[tuple[int, int] | None, dict[str, Any]]] = {}
+
+# (policy the flag was read from, indexing.disallow_strong_only)
+_strong_only: tuple[dict[str, Any], bool] | None = None
+
+
+def _read_policy(path: str) -> dict[str, Any]:
+    """Parse a policy file, reusing the last parse while its mtime and size match."""
+    key = os.path.abspath(path)
+    try:
+        st = os.stat(key)
+        stamp: tuple[int, int] | None = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        stamp = None
+
+    cached = _policy_files.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    try:
+        with open(key, encoding="utf-8") as f:
+            policy = yaml.load(f, Loader=_YAML_LOADER) or {}
+    except Exception as e:
+        logger.warning(f"Failed to load policy.yaml: {e}, using empty policy")
+        policy = {}
+
+    _policy_files[key] = (stamp, policy)
+    return policy
+
 
 def load_policy(path: str = None) -> dict[str, Any]:
     """
     Load policy from YAML file with caching.
 
+    Parses are cached per file and reused until the file's mtime or size
+    changes, so edits take effect without a restart. The first policy
+    loaded becomes the active policy used by ``can_index``.
+
     Args:
-        path: Path to policy.yaml. If None, uses default location.
+        path: Path to policy.yaml. If None, returns the active policy
+            (loading the default location if none is active yet).
 
     Returns:
         Policy dictionary
     """
-    global _policy_cache
+    global _policy_cache, _policy_source
 
     if path is None:
-        # Default location
-        path = os.path.join(os.path.dirname(__file__), "..", "..", "config", "policy.yaml")
-
-    if _policy_cache is None:
-        try:
-            with open(path, encoding="utf-8") as f:
-                _policy_cache = yaml.safe_load(f) or {}
-        except Exception as e:
-            logger.warning(f"Failed to load policy.yaml: {e}, using empty policy")
-            _policy_cache = {}
-
-    return _policy_cache
+        active = _policy_cache
+        if active is not None and (_policy_source is None or _policy_source[1] is not active):
+            return active
+        path = _policy_source[0] if active is not None else _DEFAULT_POLICY_PATH
+
+    policy = _read_policy(path)
+    if _policy_cache is None or (
+        _policy_source is not None
+        and _policy_source[1] is _policy_cache
+        and _policy_source[0] == path
+    ):
+        _policy_cache = policy
+        _policy_source = (path, policy)
+    return policy
 
 
 def can_index(evaluated_meta: dict[str, Any]) -> bool:
@@ -55,12 +102,20 @@ def can_index(evaluated_meta: dict[str, Any]) -> bool:
     Returns:
         True if indexing is allowed, False if blocked by policy
     """
+    global _strong_only
+
     policy = load_policy()
 
-    # Check if stricter indexing policy is enabled
-    disallow_strong = policy.get("indexing", {}).get("disallow_strong_only", False)
+    # Check if stricter indexing policy is enabled; re-read only when the
+    # active policy object changes
+    flag = _strong_only
+    if flag is None or flag[0] is not policy:
+        flag = _strong_only = (
+            policy,
+            bool(policy.get("indexing", {}).get("disallow_strong_only", False)),
+        )
 
-    if not disallow_strong:
+    if not flag[1]:
         # Policy not enabled, indexing allowed
         return True
 
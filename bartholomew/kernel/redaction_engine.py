@@ -5,12 +5,41 @@ Implements rule-based content redaction with multiple strategies
 
 import logging
 import re
+from functools import lru_cache
 from typing import Any
 
 
+try:
+    import re2  # google-re2: linear-time matching, no backtracking
+except ImportError:
+    re2 = None
+
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _compile(pattern: str) -> re.Pattern[str] | None:
+    """
+    Compile a redaction pattern case-insensitively, once per pattern
+
+    Invalid patterns are logged on first sight and cached as None, so a bad
+    rule applied to every memory row neither re-parses nor re-logs.
+    """
+    try:
+        return re.compile(pattern, re.IGNORECASE)
+    except re.error as e:
+        logger.error(f"Invalid regex pattern '{pattern}': {e}")
+        return None
+
+
+def _substitute(text: str, pattern: str, replacement: str) -> str:
+    """Replace matches of pattern, returning text unchanged if it is invalid"""
+    compiled = _compile(pattern)
+    if compiled is None:
+        return text
+    return compiled.sub(replacement, text)
+
+
 def mask_sensitive(text: str, pattern: str) -> str:
     """
     Mask sensitive content by replacing matches with asterisks
@@ -22,11 +51,7 @@ def mask_sensitive(text: str, pattern: str) -> str:
     Returns:
         Text with matches replaced by ****
     """
-    try:
-        return re.sub(pattern, "****", text, flags=re.IGNORECASE)
-    except re.error as e:
-        logger.error(f"Invalid regex pattern '{pattern}': {e}")
-        return text
+    return _substitute(text, pattern, "****")
 
 
 def remove_sensitive(text: str, pattern: str) -> str:
@@ -40,11 +65,7 @@ def remove_sensitive(text: str, pattern: str) -> str:
     Returns:
         Text with matches removed
     """
-    try:
-        return re.sub(pattern, "", text, flags=re.IGNORECASE)
-    except re.error as e:
-        logger.error(f"Invalid regex pattern '{pattern}': {e}")
-        return text
+    return _substitute(text, pattern, "")
 
 
 def replace_sensitive(text: str, pattern: str, replacement: str) -> str:
@@ -59,11 +80,7 @@ def replace_sensitive(text: str, pattern: str, replacement: str) -> str:
     Returns:
         Text with matches replaced by replacement string
     """
-    try:
-        return re.sub(pattern, replacement, text, flags=re.IGNORECASE)
-    except re.error as e:
-        logger.error(f"Invalid regex pattern '{pattern}': {e}")
-        return text
+    return _substitute(text, pattern, replacement)
 
 
 def apply_redaction(text: str, rule: dict[str, Any]) -> str:
@@ -99,18 +116,100 @@ def apply_redaction(text: str, rule: dict[str, Any]) -> str:
         # No pattern specified, return original text
         return text
 
-    strategy = rule.get("redact_strategy", "mask")
+    replacement = _replacement_for(rule.get("redact_strategy", "mask"))
+    if replacement is None:
+        return text
+
+    return _substitute(text, pattern, replacement)
 
+
+def _replacement_for(strategy: str) -> str | None:
+    """Map a redact_strategy to its replacement text, or None if unknown"""
     if strategy == "mask":
-        return mask_sensitive(text, pattern)
-    elif strategy == "remove":
-        return remove_sensitive(text, pattern)
-    elif strategy.startswith("replace:"):
+        return "****"
+    if strategy == "remove":
+        return ""
+    if strategy.startswith("replace:"):
         # Extract replacement text after "replace:" prefix
-        parts = strategy.split("replace:", 1)
-        replacement = parts[1] if len(parts) > 1 else ""
-        return replace_sensitive(text, pattern, replacement)
-    else:
-        # Unknown strategy - log warning and return original
-        logger.warning(f"Unknown redaction strategy '{strategy}', returning original text")
+        return strategy[len("replace:") :]
+    # Unknown strategy - log warning and return original
+    logger.warning(f"Unknown redaction strategy '{strategy}', returning original text")
+    return None
+
+
+class RedactionRuleset:
+    """
+    Several redaction rules compiled into one alternation
+
+    Each usable rule becomes a named group ``(?P<rN>pattern)`` in a single
+    case-insensitive pattern, so ``apply`` scans the text once however many
+    rules there are, looking up each match's replacement by group name.
+    Compiled with google-re2 when it is installed and accepts the pattern,
+    otherwise with ``re``.
+
+    Where rules overlap, the earliest-listed rule wins at a given position
+    rather than later rules seeing earlier rules' output. Rules relying on
+    numbered backreferences should be applied one at a time with
+    ``apply_redaction``. If the patterns cannot be combined (for example two
+    rules define the same group name) they are applied one at a time.
+
+    Library-only: the memory write path applies the single strategy merged
+    from the matched rules with ``apply_redaction``.
+    """
+
+    def __init__(self, rules: list[dict[str, Any]]) -> None:
+        """
+        Compile rules into a single pattern
+
+        Args:
+            rules: Rule dicts as accepted by ``apply_redaction``; rules with
+                no pattern, an invalid pattern, or an unknown strategy are
+                skipped
+        """
+        self.replacements: dict[str, str] = {}
+        self._fallback: list[tuple[re.Pattern[str], str]] = []
+        parts: list[str] = []
+        for rule in rules:
+            pattern = rule.get("content")
+            compiled = _compile(pattern) if pattern else None
+            if compiled is None:
+                continue
+            replacement = _replacement_for(rule.get("redact_strategy", "mask"))
+            if replacement is None:
+                continue
+            group = f"r{len(parts)}"
+            self.replacements[group] = replacement
+            self._fallback.append((compiled, replacement))
+            parts.append(f"(?P<{group}>{pattern})")
+
+        self.pattern: Any = None
+        if parts:
+            self.pattern = self._compile_union("(?i)" + "|".join(parts))
+        if self.pattern is not None:
+            self._fallback = []
+
+    @staticmethod
+    def _compile_union(union: str) -> Any:
+        """Compile the alternation, preferring re2's DFA over backtracking re"""
+        if re2 is not None:
+            try:
+                return re2.compile(union)
+            except Exception:
+                pass  # e.g. lookarounds re2 does not support
+        try:
+            return re.compile(union)
+        except re.error as e:
+            # Rules valid alone can still clash, e.g. duplicate group names
+            logger.warning(f"Applying redaction rules one at a time: {e}")
+            return None
+
+    def _replace(self, match: Any) -> str:
+        return self.replacements[match.lastgroup]
+
+    def apply(self, text: str) -> str:
+        """Redact every rule's matches, in a single pass when they combined"""
+        if self.pattern is not None:
+            return self.pattern.sub(self._replace, text)
+        for compiled, replacement in self._fallback:
+            text = compiled.sub(replacement, text)
         return text
@@ -5,8 +5,11 @@ Implements automatic summarization for longer memory content
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import re
+import threading
+from collections import OrderedDict
 
 
 logger = logging.getLogger(__name__)
@@ -15,6 +18,7 @@ logger = logging.getLogger(__name__)
 LENGTH_THRESHOLD = 1000  # Characters
 TARGET_SUMMARY_LENGTH = 900  # Characters (~100-150 words)
 DEFAULT_MODE = "summary_also"
+SUMMARY_CACHE_SIZE = 1024  # Summaries memoized per engine, keyed by content hash
 
 # Auto-summarize these kinds when content is long
 AUTO_SUMMARIZE_KINDS = {
@@ -50,6 +54,8 @@ class SummarizationEngine:
         """
         self.length_threshold = length_threshold
         self.target_length = target_length
+        self._cache: OrderedDict[tuple[bytes, int], str] = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def should_summarize(self, meta: dict, value: str, kind: str) -> bool:
         """
@@ -119,6 +125,26 @@ class SummarizationEngine:
 
         target = target_length or self.target_length
 
+        # Memoize on a content digest so repeated content (re-upserts,
+        # re-embeds) doesn't pay for summarization again
+        digest = hashlib.blake2b(value.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        key = (digest, target)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+
+        result = self._summarize_uncached(value, target)
+
+        with self._cache_lock:
+            self._cache[key] = result
+            if len(self._cache) > SUMMARY_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return result
+
+    def _summarize_uncached(self, value: str, target: int) -> str:
+        """Extractive summary of ``value`` limited to ``target`` characters."""
         # Split into sentences using regex
         # Matches ., !, ? followed by space or end of string
         sentences = re.split(r"(?<=[.!?])\s+", value)
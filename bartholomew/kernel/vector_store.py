@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import logging
 import sqlite3
+from collections.abc import Iterator
 
 import numpy as np
 
@@ -15,6 +16,41 @@ from bartholomew.kernel.db_ctx import set_wal_pragmas
 
 logger = logging.getLogger(__name__)
 
+# On-disk encodings accepted for memory_embeddings.vec
+STORAGE_DTYPES = {"float32": np.float32, "float16": np.float16}
+
+
+def _decode_vec(vec_blob: bytes, dim: int) -> np.ndarray:
+    """
+    Decode a stored vector BLOB to float32
+
+    The element width is inferred from the BLOB length, so float32 and
+    float16 rows can coexist in the same table.
+    """
+    if len(vec_blob) == dim * 2:
+        return np.frombuffer(vec_blob, dtype=np.float16).astype(np.float32)
+    return np.frombuffer(vec_blob, dtype=np.float32)
+
+
+def iter_vss_rows(conn: sqlite3.Connection, dim: int = 384) -> Iterator[tuple[int, bytes]]:
+    """
+    Yield (embedding_id, float32 BLOB) for every `dim`-wide embedding
+
+    vss0 only accepts float32 vectors, so float16 rows written while
+    sqlite-vss was not loaded are re-encoded; rows of any other width
+    are skipped.
+    """
+    cursor = conn.execute(
+        "SELECT embedding_id, vec FROM memory_embeddings "
+        "WHERE dim = ? AND length(vec) IN (dim * 4, dim * 2)",
+        (dim,),
+    )
+    for embedding_id, vec_blob in cursor:
+        if len(vec_blob) == dim * 4:
+            yield embedding_id, vec_blob
+        else:
+            yield embedding_id, _decode_vec(vec_blob, dim).tobytes()
+
 
 # Schema for vector embeddings table
 VECTOR_SCHEMA = """
@@ -155,7 +191,7 @@ class VectorStore:
                 """
                 CREATE TRIGGER IF NOT EXISTS trg_mememb_insert
                 AFTER INSERT ON memory_embeddings
-                WHEN NEW.dim = 384
+                WHEN NEW.dim = 384 AND length(NEW.vec) = NEW.dim * 4
                 BEGIN
                     INSERT INTO memory_embeddings_vss(rowid, vec)
                     VALUES (NEW.embedding_id, NEW.vec);
@@ -175,7 +211,7 @@ class VectorStore:
 
                     INSERT INTO memory_embeddings_vss(rowid, vec)
                     SELECT NEW.embedding_id, NEW.vec
-                    WHERE NEW.dim = 384;
+                    WHERE NEW.dim = 384 AND length(NEW.vec) = NEW.dim * 4;
                 END
             """,
             )
@@ -205,6 +241,8 @@ class VectorStore:
         source: str,
         provider: str,
         model: str,
+        *,
+        dtype: str = "float32",
     ) -> None:
         """
         Insert or update an embedding
@@ -215,6 +253,9 @@ class VectorStore:
             source: 'summary' or 'full'
             provider: Provider name (e.g., 'local-sbert')
             model: Model identifier
+            dtype: Storage encoding, 'float32' (default) or 'float16'.
+                   float16 halves row size; sqlite-vss mirroring needs
+                   float32, so it is used whenever VSS is available.
         """
         # Validate inputs
         if vec.ndim != 1:
@@ -226,11 +267,17 @@ class VectorStore:
         if source not in ("summary", "full"):
             raise ValueError(f"source must be 'summary' or 'full', got {source}")
 
+        if dtype not in STORAGE_DTYPES:
+            raise ValueError(f"dtype must be one of {sorted(STORAGE_DTYPES)}, got {dtype}")
+
+        if self.vss_available:
+            dtype = "float32"
+
         # Compute norm
         norm = float(np.linalg.norm(vec))
 
         # Encode vector as BLOB
-        vec_blob = vec.tobytes()
+        vec_blob = vec.astype(STORAGE_DTYPES[dtype], copy=False).tobytes()
         dim = len(vec)
 
         with sqlite3.connect(self.db_path) as conn:
@@ -432,7 +479,7 @@ class VectorStore:
                 continue
 
             # Decode vector from BLOB
-            vec = np.frombuffer(vec_blob, dtype=np.float32)
+            vec = _decode_vec(vec_blob, vec_dim)
 
             # Compute cosine similarity (dot product of normalized vectors)
             score = float(np.dot(qvec, vec))
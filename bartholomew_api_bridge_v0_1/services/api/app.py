@@ -221,7 +221,7 @@ async def health():
         }
         # Get pending nudges count
         try:
-            pending = await _kernel.mem.list_pending_nudges(limit=1000)
+            pending = await _kernel.mem.list_pending_nudges(limit=1000, parse_actions=False)
             kernel_info["nudges_pending_count"] = len(pending)
         except Exception:
             kernel_info["nudges_pending_count"] = 0
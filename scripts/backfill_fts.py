@@ -171,7 +171,7 @@ def backfill_memory(
         # Step 5: Choose index text using EXACT same rule as ingestion
         # index_text = summary if (summary and fts_index_mode ==  # noqa
         #              "summary_preferred") else redacted_value
-        fts_index_mode = evaluated.get("fts_index_mode", _load_fts_index_mode())
+        fts_index_mode = evaluated.get("fts_index_mode") or _load_fts_index_mode()
 
         index_text = None
         if plaintext_summary and fts_index_mode == "summary_preferred":
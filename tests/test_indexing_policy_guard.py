@@ -106,6 +106,41 @@ def test_can_index_case_insensitive():
     policy._policy_cache = None
 
 
+def test_load_policy_reloads_edited_file(temp_policy_file):
+    """Test the active policy follows edits to its file without a restart."""
+    from bartholomew.kernel import policy
+
+    policy._policy_cache = None
+
+    with open(temp_policy_file, "w") as f:
+        yaml.dump({"indexing": {"disallow_strong_only": False}}, f)
+    loaded = load_policy(temp_policy_file)
+    assert load_policy() is loaded
+    assert load_policy(temp_policy_file) is loaded
+    assert can_index({"encrypt": "strong"}) is True
+
+    with open(temp_policy_file, "w") as f:
+        yaml.dump({"indexing": {"disallow_strong_only": True}, "version": 2}, f)
+    st = os.stat(temp_policy_file)
+    os.utime(temp_policy_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert load_policy()["version"] == 2
+    assert can_index({"encrypt": "strong"}) is False
+
+    # Other files load independently of the active policy
+    other = temp_policy_file + ".other.yaml"
+    with open(other, "w") as f:
+        yaml.dump({"version": 3}, f)
+    try:
+        assert load_policy(other) == {"version": 3}
+        assert load_policy()["version"] == 2
+    finally:
+        os.unlink(other)
+
+    # Reset cache
+    policy._policy_cache = None
+
+
 @pytest.mark.asyncio
 async def test_memory_store_respects_indexing_policy():
     """Test that MemoryStore respects the indexing policy."""
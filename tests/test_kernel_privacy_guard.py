@@ -45,5 +45,37 @@ async def run_test():
         print(f"✗ ERROR: Found {count} row(s) for that key; expected 0 after 'no'.")
 
 
+async def test_upsert_awaits_permission_prompt_on_running_loop(tmp_path, monkeypatch):
+    """The consent prompt is awaited in-loop; a 'no' answer skips storage."""
+    from bartholomew.kernel import memory_store as memory_store_module
+
+    prompts = []
+
+    async def deny(text: str) -> bool:
+        prompts.append(text)
+        return False
+
+    monkeypatch.setattr(memory_store_module, "is_sensitive", lambda text: True)
+    monkeypatch.setattr(memory_store_module, "request_permission_to_store", deny)
+
+    db_path = str(tmp_path / "privacy.db")
+    store = MemoryStore(db_path)
+    await store.init()
+
+    result = await store.upsert_memory(
+        kind="preference",
+        key="tea",
+        value="I like green tea",
+        ts="2025-11-01T08:00:00Z",
+    )
+
+    assert result.stored is False
+    assert prompts == ["I like green tea"]
+
+    async with aiosqlite.connect(db_path) as db:
+        cur = await db.execute("SELECT COUNT(*) FROM memories")
+        assert (await cur.fetchone())[0] == 0
+
+
 if __name__ == "__main__":
     asyncio.run(run_test())
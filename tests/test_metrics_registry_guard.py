@@ -63,6 +63,17 @@ def test_metrics_registry_reset():
     assert registry1 is not registry2, "Reset should create new registry"
 
 
+def test_metrics_registry_read_is_lock_free():
+    """Test that reads never wait on the reset lock."""
+    from bartholomew.kernel import metrics_registry
+
+    with metrics_registry._reset_lock:
+        # Would deadlock if the read path still acquired the lock
+        registry = metrics_registry.get_metrics_registry()
+
+    assert registry is metrics_registry.get_metrics_registry()
+
+
 def test_no_duplicate_collectors_on_double_init():
     """Test that initializing metrics twice doesn't cause duplicates."""
     from bartholomew.kernel.metrics_registry import get_metrics_registry, reset_metrics_registry
@@ -15,12 +15,18 @@ Comprehensive tests covering:
 
 from __future__ import annotations
 
+import os
 import sqlite3
 import tempfile
-from datetime import datetime, timezone
+import threading
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+import pytest
+
 from bartholomew.kernel.narrator import (
+    EPISODE_FTS_SCHEMA,
+    NARRATOR_SCHEMA,
     EpisodeType,
     EpisodicEntry,
     NarrativeTemplates,
@@ -135,6 +141,50 @@ class TestEpisodicEntry:
         assert "emotion" in entry.tags
         assert entry.metadata["trigger"] == "user_message"
 
+    def test_entry_ids_are_unique_uuid4(self):
+        """Test pooled entry IDs are unique, valid UUID4 strings."""
+        import uuid
+
+        ids = {
+            EpisodicEntry.create(EpisodeType.OBSERVATION, "I noted: id").entry_id
+            for _ in range(5000)
+        }
+
+        assert len(ids) == 5000
+        for entry_id in ids:
+            parsed = uuid.UUID(entry_id)
+            assert parsed.version == 4
+            assert str(parsed) == entry_id
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_forked_child_draws_fresh_entry_ids(self):
+        """Test a forked child does not reuse the parent's pooled ID bytes."""
+        EpisodicEntry.create(EpisodeType.OBSERVATION, "I noted: warm the pool")
+
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - child process
+            os.close(read_fd)
+            child_id = EpisodicEntry.create(EpisodeType.OBSERVATION, "child").entry_id
+            os.write(write_fd, child_id.encode())
+            os._exit(0)
+
+        os.close(write_fd)
+        with os.fdopen(read_fd, "rb") as pipe:
+            child_id = pipe.read().decode()
+        os.waitpid(pid, 0)
+
+        parent_id = EpisodicEntry.create(EpisodeType.OBSERVATION, "parent").entry_id
+        assert child_id
+        assert child_id != parent_id
+
+    def test_entry_is_slotted(self):
+        """Test EpisodicEntry carries no per-instance __dict__."""
+        entry = EpisodicEntry.create(EpisodeType.OBSERVATION, "I noted: slots")
+
+        assert not hasattr(entry, "__dict__")
+        assert not hasattr(NarratorConfig(), "__dict__")
+
     def test_entry_to_dict(self):
         """Test serializing entry to dictionary."""
         entry = EpisodicEntry.create(
@@ -174,6 +224,51 @@ class TestEpisodicEntry:
         assert entry.tone == NarrativeTone.ENTHUSIASTIC
         assert entry.affect_snapshot["valence"] == 0.8
 
+    def test_entry_to_json_bytes_matches_to_dict(self):
+        """Test JSON export bytes decode to the to_dict() shape."""
+        import json
+
+        from bartholomew.kernel.narrator import episodes_to_json_bytes
+
+        entry = EpisodicEntry.create(
+            episode_type=EpisodeType.OBSERVATION,
+            narrative="I noted: export",
+            tone=NarrativeTone.CONTENT,
+            affect_snapshot={"valence": 0.5},
+            tags=["export"],
+        )
+
+        assert json.loads(entry.to_json_bytes()) == entry.to_dict()
+        assert json.loads(episodes_to_json_bytes([entry, entry])) == [entry.to_dict()] * 2
+        assert episodes_to_json_bytes([]) == b"[]"
+
+    def test_entry_to_json_bytes_handles_non_str_keys(self):
+        """Test int-keyed metadata and wide ints export like stdlib json."""
+        import json
+
+        from bartholomew.kernel.narrator import episodes_to_json_bytes
+
+        plain = EpisodicEntry.create(
+            episode_type=EpisodeType.OBSERVATION,
+            narrative="I noted: plain",
+        )
+        keyed = EpisodicEntry.create(
+            episode_type=EpisodeType.OBSERVATION,
+            narrative="I noted: keyed",
+            affect_snapshot={2: 0.5},
+            metadata={1: "a"},
+        )
+        wide = EpisodicEntry.create(
+            episode_type=EpisodeType.OBSERVATION,
+            narrative="I noted: wide",
+            metadata={"big": 2**70},
+        )
+
+        for entry in (keyed, wide):
+            assert json.loads(entry.to_json_bytes()) == json.loads(json.dumps(entry.to_dict()))
+        exported = json.loads(episodes_to_json_bytes([plain, keyed, wide]))
+        assert [item["metadata"] for item in exported] == [{}, {"1": "a"}, {"big": 2**70}]
+
     def test_entry_roundtrip(self):
         """Test serialization roundtrip."""
         original = EpisodicEntry.create(
@@ -244,6 +339,45 @@ identity:
 
             Path(f.name).unlink()
 
+    def test_config_from_identity_reloads_after_edit(self, tmp_path):
+        """Test cached identity config is invalidated when the file changes."""
+        import os
+
+        identity = tmp_path / "Identity.yaml"
+        body = "identity:\n  self_model:\n    narrator_episodic_layer:\n      style: {}\n"
+        identity.write_text(body.format("first"), encoding="utf-8")
+
+        assert NarratorConfig.from_identity(str(identity)).style == "first"
+        assert NarratorConfig.from_identity(str(identity)).style == "first"
+
+        identity.write_text(body.format("second"), encoding="utf-8")
+        stat = identity.stat()
+        os.utime(identity, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert NarratorConfig.from_identity(str(identity)).style == "second"
+
+    def test_config_is_frozen_and_shared(self, tmp_path):
+        """Test get_config() shares one immutable config until reloaded."""
+        import dataclasses
+
+        from bartholomew.kernel.narrator import get_config, reload_config
+
+        config = get_config()
+        assert get_config() is config
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.enabled = False
+
+        identity = tmp_path / "Identity.yaml"
+        identity.write_text(
+            "identity:\n  self_model:\n    narrator_episodic_layer:\n      style: reloaded\n",
+            encoding="utf-8",
+        )
+        try:
+            assert reload_config(str(identity)).style == "reloaded"
+            assert get_config().style == "reloaded"
+        finally:
+            reload_config()
+
 
 # =============================================================================
 # Test NarrativeTemplates
@@ -287,6 +421,32 @@ class TestNarrativeTemplates:
         for template in NarrativeTemplates.DRIVE_ACTIVATED[NarrativeTone.NEUTRAL]:
             assert "{drive}" in template
 
+    def test_compiled_templates_match_str_format(self):
+        """Verify pre-parsed templates render exactly like str.format."""
+        from bartholomew.kernel.narrator import _compile_template
+
+        fields = {
+            "emotion": "calm {x}",
+            "target": "the task",
+            "drive": "be helpful",
+            "goal": "ship it",
+            "content": "100%",
+        }
+        for table in (
+            NarrativeTemplates.AFFECT_SHIFT,
+            NarrativeTemplates.ATTENTION_FOCUS,
+            NarrativeTemplates.DRIVE_ACTIVATED,
+            NarrativeTemplates.DRIVE_SATISFIED,
+            NarrativeTemplates.GOAL_ADDED,
+            NarrativeTemplates.GOAL_COMPLETED,
+            NarrativeTemplates.OBSERVATION,
+        ):
+            for templates in table.values():
+                for template in templates:
+                    assert _compile_template(template)(**fields) == template.format(**fields)
+
+        assert _compile_template("{{literal}} {a} and {b}")(a=1, b=2) == "{literal} 1 and 2"
+
 
 # =============================================================================
 # Test NarratorEngine Initialization
@@ -355,6 +515,271 @@ class TestNarratorEngineInit:
             except PermissionError:
                 pass  # Windows file locking
 
+    def test_file_database_uses_wal_and_write_pragmas(self, tmp_path):
+        """Test file-backed narrators open tuned WAL connections."""
+        narrator = NarratorEngine(db_path=str(tmp_path / "narrator.db"))
+
+        conn = narrator._get_connection()
+        try:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+            assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+            assert conn.execute("PRAGMA page_size").fetchone()[0] == 8192
+            assert conn.execute("PRAGMA mmap_size").fetchone()[0] == 268435456
+        finally:
+            conn.close()
+
+    def test_file_connection_autocommits_single_writes(self, tmp_path):
+        """Test persist_episode commits without an open implicit transaction."""
+        db_path = str(tmp_path / "narrator.db")
+        narrator = NarratorEngine(db_path=db_path)
+        narrator.persist_episode(narrator.generate_observation_episode("Committed"))
+
+        conn = narrator._get_connection()
+        assert conn.isolation_level is None
+        assert not conn.in_transaction
+        with sqlite3.connect(db_path) as reader:
+            assert reader.execute("SELECT COUNT(*) FROM episodic_entries").fetchone()[0] == 1
+        reader.close()
+        narrator.close()
+
+    def test_concurrent_writers_share_memory_connection(self):
+        """Test writes from several threads serialize on the shared connection."""
+        narrator = NarratorEngine(config=NarratorConfig(async_handlers=True))
+
+        def write(worker):
+            for batch in range(5):
+                narrator.save_episodes_batch(
+                    [
+                        narrator.generate_observation_episode(f"{worker}-{batch}-{i}")
+                        for i in range(7)
+                    ],
+                )
+                narrator.persist_episode(narrator.generate_observation_episode(f"{worker}"))
+
+        threads = [threading.Thread(target=write, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert narrator.get_episode_count() == 4 * 5 * 8
+
+    def test_file_connection_reused_per_thread(self, tmp_path):
+        """Test file-backed narrators keep one connection per thread until close()."""
+        narrator = NarratorEngine(db_path=str(tmp_path / "narrator.db"))
+        episode = narrator.generate_observation_episode("Once")
+        narrator.persist_episode(episode)
+
+        conn = narrator._get_connection()
+        assert narrator._get_connection() is conn
+
+        # A failed write leaves no open transaction behind on the reused connection
+        with pytest.raises(sqlite3.IntegrityError):
+            narrator.persist_episode(episode)
+        assert not conn.in_transaction
+        assert narrator.get_episode_count() == 1
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(narrator._get_connection()))
+        thread.start()
+        thread.join()
+        assert other[0] is not conn
+
+        narrator.close()
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+        assert narrator.get_episode_count() == 1
+
+
+class TestEpisodeIndexes:
+    """Tests for episodic_entries index layout."""
+
+    def test_type_queries_use_composite_index(self):
+        """Test type filter + recency order is served by one index."""
+        narrator = NarratorEngine()
+
+        indexes = {
+            row[0]
+            for row in narrator._conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='index' "
+                "AND tbl_name='episodic_entries' AND name LIKE 'idx_%'",
+            )
+        }
+        assert indexes == {
+            "idx_episodic_entries_timestamp",
+            "idx_episodic_entries_type_ts",
+            "idx_episodic_entries_tone_ts",
+        }
+
+        plan = narrator._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM episodic_entries "
+            "WHERE episode_type = ? ORDER BY timestamp DESC LIMIT 5",
+            ("observation",),
+        ).fetchall()
+        details = " ".join(row["detail"] for row in plan)
+        assert "idx_episodic_entries_type_ts" in details
+        assert "TEMP B-TREE" not in details
+
+        plan = narrator._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM episodic_entries "
+            "WHERE tone = ? ORDER BY timestamp DESC LIMIT 5",
+            ("curious",),
+        ).fetchall()
+        details = " ".join(row["detail"] for row in plan)
+        assert "idx_episodic_entries_tone_ts" in details
+        assert "TEMP B-TREE" not in details
+
+    def test_reflection_range_uses_timestamp_index(self):
+        """Test the daily/weekly reflection range scan needs no sort or table scan."""
+        from bartholomew.kernel.narrator import _SELECT_RANGE_NARRATIVES_SQL
+
+        narrator = NarratorEngine()
+        plan = narrator._conn.execute(
+            f"EXPLAIN QUERY PLAN {_SELECT_RANGE_NARRATIVES_SQL}",
+            (0, 1),
+        ).fetchall()
+
+        details = " ".join(row["detail"] for row in plan)
+        assert "SEARCH episodic_entries USING INDEX idx_episodic_entries_timestamp" in details
+        assert "TEMP B-TREE" not in details
+
+    def test_weekly_rollup_counts_from_covering_type_index(self):
+        """Test the weekly per-type rollup aggregates without touching table rows."""
+        from bartholomew.kernel.narrator import _TYPE_ROLLUP_RANGE_SQL
+
+        narrator = NarratorEngine()
+        plan = narrator._conn.execute(
+            f"EXPLAIN QUERY PLAN {_TYPE_ROLLUP_RANGE_SQL}",
+            (0, 1),
+        ).fetchall()
+
+        details = [row["detail"] for row in plan]
+        assert any(
+            detail.startswith(
+                "SEARCH episodic_entries USING COVERING INDEX idx_episodic_entries_type_ts",
+            )
+            for detail in details
+        )
+        assert "USE TEMP B-TREE FOR GROUP BY" not in details
+
+
+class TestTimestampStorage:
+    """Tests for integer epoch-microsecond timestamp storage."""
+
+    def test_timestamp_stored_as_epoch_micros(self):
+        """Test episodes store timestamps as integers and round-trip exactly."""
+        narrator = NarratorEngine()
+        episode = narrator.generate_observation_episode("Timed")
+        narrator.persist_episode(episode)
+
+        raw = narrator._conn.execute(
+            "SELECT timestamp, typeof(timestamp) FROM episodic_entries",
+        ).fetchone()
+        assert raw[1] == "integer"
+
+        restored = narrator.get_episode(episode.entry_id)
+        assert restored.timestamp == episode.timestamp
+
+    def test_from_dict_accepts_epoch_micros(self):
+        """Test from_dict accepts integer epoch microseconds."""
+        entry = EpisodicEntry.from_dict(
+            {
+                "entry_id": "micros-1",
+                "timestamp": 1_768_903_200_000_000,
+                "episode_type": "observation",
+                "narrative": "I noted: micros",
+            },
+        )
+
+        assert entry.timestamp == datetime(2026, 1, 20, 10, 0, tzinfo=timezone.utc)
+
+    def test_dict_columns_roundtrip(self):
+        """Test affect snapshot, tags and metadata survive storage encoding."""
+        narrator = NarratorEngine()
+        episode = EpisodicEntry.create(
+            episode_type=EpisodeType.OBSERVATION,
+            narrative="I noted: encoding",
+            affect_snapshot={"valence": 0.25, "emotion": "calm"},
+            tags=["encoding"],
+            metadata={"nested": {"values": [1, 2, 3]}},
+        )
+        narrator.persist_episode(episode)
+
+        restored = narrator.get_episode(episode.entry_id)
+        assert restored.affect_snapshot == episode.affect_snapshot
+        assert restored.metadata == episode.metadata
+        assert [e.entry_id for e in narrator.get_episodes_by_tag("encoding")] == [
+            episode.entry_id,
+        ]
+
+    def test_json_columns_match_stdlib_edge_cases(self):
+        """Test tag/metadata encoding accepts what stdlib json accepts."""
+        narrator = NarratorEngine()
+        episode = EpisodicEntry.create(
+            episode_type=EpisodeType.OBSERVATION,
+            narrative="I noted: edge cases",
+            tags=["caf\u00e9"],
+            metadata={"big": 2**70, 7: "int key"},
+        )
+        narrator.persist_episode(episode)
+
+        restored = narrator.get_episode(episode.entry_id)
+        assert restored.tags == ["caf\u00e9"]
+        assert restored.metadata == {"big": 2**70, "7": "int key"}
+        assert len(narrator.get_episodes_by_tag("caf\u00e9")) == 1
+
+    def test_msgpack_columns_decode_int_keys(self):
+        """Test msgpack columns store JSON-style keys and read legacy int-keyed rows."""
+        msgpack = pytest.importorskip("msgpack")
+        narrator = NarratorEngine()
+        episode = EpisodicEntry.create(
+            episode_type=EpisodeType.OBSERVATION,
+            narrative="I noted: packed",
+            affect_snapshot={"valence": 0.5, 3: {None: True}},
+            metadata={1: "a", "nested": [{2: "b"}]},
+        )
+        narrator.persist_episode(episode)
+
+        restored = narrator.get_episode(episode.entry_id)
+        assert restored.affect_snapshot == {"valence": 0.5, "3": {"null": True}}
+        assert restored.metadata == {"1": "a", "nested": [{"2": "b"}]}
+
+        with narrator._write_lock:
+            conn = narrator._get_connection()
+            with conn:
+                conn.execute(
+                    "UPDATE episodic_entries SET metadata_json = ? WHERE id = ?",
+                    (msgpack.packb({1: "a"}, use_bin_type=True), episode.entry_id),
+                )
+        assert narrator.get_episode(episode.entry_id).metadata == {1: "a"}
+
+    def test_legacy_text_timestamps_migrated(self, tmp_path):
+        """Test a pre-existing ISO-timestamp table is migrated on open."""
+        db_path = str(tmp_path / "legacy.db")
+        legacy_schema = NARRATOR_SCHEMA.replace(
+            "timestamp INTEGER NOT NULL,",
+            "timestamp TEXT NOT NULL,",
+        )
+        with sqlite3.connect(db_path) as conn:
+            conn.executescript(legacy_schema)
+            conn.executescript(EPISODE_FTS_SCHEMA)
+            conn.execute(
+                "INSERT INTO episodic_entries (id, timestamp, episode_type, narrative, tone) "
+                "VALUES (?, ?, ?, ?, ?)",
+                ("legacy-1", "2026-01-20T10:00:00+00:00", "observation", "Old robot", "neutral"),
+            )
+        conn.close()
+
+        narrator = NarratorEngine(db_path=db_path)
+
+        episode = narrator.get_episode("legacy-1")
+        assert episode.timestamp == datetime(2026, 1, 20, 10, 0, tzinfo=timezone.utc)
+        assert [e.entry_id for e in narrator.search_episodes("robot")] == ["legacy-1"]
+
+        narrator.persist_episode(narrator.generate_observation_episode("New robot"))
+        assert len(narrator.search_episodes("robot")) == 2
+
 
 # =============================================================================
 # Test Tone Determination
@@ -426,6 +851,26 @@ class TestToneDetermination:
 
         assert tone == NarrativeTone.NEUTRAL
 
+    @pytest.mark.parametrize("valence", [-1.0, -0.1, -0.05, 0.0, 0.1, 0.2, 0.3, 1.0])
+    @pytest.mark.parametrize("arousal", [0.0, 0.39, 0.4, 0.45, 0.5, 1.0])
+    def test_determine_tone_boundaries(self, valence, arousal):
+        """Test the band lookup matches the quadrant thresholds at the edges."""
+        from bartholomew.kernel.experience_kernel import AffectState
+
+        narrator = NarratorEngine()
+        tone = narrator.determine_tone(AffectState(valence=valence, arousal=arousal))
+
+        if valence >= 0.3 and arousal >= 0.5:
+            assert tone == NarrativeTone.ENTHUSIASTIC
+        elif valence < -0.1 and arousal >= 0.5:
+            assert tone == NarrativeTone.CONCERNED
+        elif valence >= 0.1 and arousal < 0.4:
+            assert tone == NarrativeTone.CONTENT
+        elif valence < 0 and arousal < 0.4:
+            assert tone == NarrativeTone.SUBDUED
+        else:
+            assert tone == NarrativeTone.NEUTRAL
+
 
 # =============================================================================
 # Test Episode Generation
@@ -561,6 +1006,25 @@ class TestEpisodeGenerationWithKernel:
         assert "arousal" in episode.affect_snapshot
         assert "energy" in episode.affect_snapshot
 
+    def test_affect_read_once_per_episode(self, monkeypatch):
+        """Test tone and snapshot share one kernel read, or a passed-in state."""
+        from bartholomew.kernel.experience_kernel import AffectState, ExperienceKernel
+
+        kernel = ExperienceKernel()
+        calls = []
+        original = kernel.get_affect
+        monkeypatch.setattr(kernel, "get_affect", lambda: calls.append(1) or original())
+        narrator = NarratorEngine(experience_kernel=kernel)
+
+        narrator.generate_goal_added_episode(goal="learn")
+        assert len(calls) == 1
+
+        affect = AffectState(valence=-0.5, arousal=0.8, dominant_emotion="worried")
+        episode = narrator.generate_affect_episode(affect=affect)
+        assert len(calls) == 1
+        assert episode.tone == NarrativeTone.CONCERNED
+        assert episode.affect_snapshot["dominant_emotion"] == "worried"
+
 
 # =============================================================================
 # Test Persistence
@@ -650,6 +1114,16 @@ class TestPersistence:
         for ep in affect_episodes:
             assert ep.episode_type == EpisodeType.AFFECT_SHIFT
 
+    def test_episode_enums_bind_as_values(self):
+        """Test enums are stored as their string values via sqlite3 adapters."""
+        narrator = NarratorEngine()
+        narrator.persist_episode(narrator.generate_observation_episode("Adapter"))
+
+        row = narrator._conn.execute("SELECT episode_type, tone FROM episodic_entries").fetchone()
+
+        assert tuple(row) == ("observation", "neutral")
+        assert len(narrator.get_episodes_by_type(EpisodeType.OBSERVATION)) == 1
+
     def test_get_episodes_by_tag(self):
         """Test filtering episodes by tag."""
         narrator = NarratorEngine()
@@ -666,6 +1140,53 @@ class TestPersistence:
 
         assert len(important) == 2
 
+    def test_get_episodes_by_tag_uses_tag_index(self):
+        """Test tag lookups go through the normalized episode_tags table."""
+        narrator = NarratorEngine()
+        narrator.persist_episode(
+            narrator.generate_observation_episode("Tagged", tags=["Important", "x"]),
+        )
+        narrator.persist_episode(narrator.generate_observation_episode("Other", tags=["y"]))
+
+        assert len(narrator.get_episodes_by_tag("important")) == 1
+        assert narrator.get_episodes_by_tag("missing") == []
+
+        plan = " ".join(
+            row["detail"]
+            for row in narrator._conn.execute(
+                "EXPLAIN QUERY PLAN SELECT e.* FROM episode_tags t JOIN episodic_entries e "
+                "ON e.id = t.episode_id WHERE t.tag = ? ORDER BY e.timestamp DESC LIMIT ?",
+                ("x", 5),
+            )
+        )
+        assert "SCAN" not in plan.replace("SCAN CONSTANT", "")
+
+    def test_episode_tags_backfilled_and_cleaned_up(self, tmp_path):
+        """Test existing tags are backfilled and deletes cascade to episode_tags."""
+        db_path = str(tmp_path / "tags.db")
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(
+                "CREATE TABLE episodic_entries (id TEXT PRIMARY KEY, timestamp INTEGER NOT NULL, "
+                "episode_type TEXT NOT NULL, narrative TEXT NOT NULL, tone TEXT NOT NULL, "
+                "affect_snapshot_json TEXT, source_event_id TEXT, source_channel TEXT, "
+                "tags_json TEXT, metadata_json TEXT, created_at TEXT DEFAULT CURRENT_TIMESTAMP)",
+            )
+            conn.executescript(EPISODE_FTS_SCHEMA)
+            conn.execute(
+                "INSERT INTO episodic_entries (id, timestamp, episode_type, narrative, tone, "
+                "tags_json) VALUES ('old-1', 1, 'observation', 'Old', 'neutral', '[\"legacy\"]')",
+            )
+        conn.close()
+
+        narrator = NarratorEngine(db_path=db_path)
+        assert [e.entry_id for e in narrator.get_episodes_by_tag("legacy")] == ["old-1"]
+
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("DELETE FROM episodic_entries WHERE id = 'old-1'")
+            remaining = conn.execute("SELECT COUNT(*) FROM episode_tags").fetchone()[0]
+        conn.close()
+        assert remaining == 0
+
     def test_get_episode_count(self):
         """Test getting total episode count."""
         narrator = NarratorEngine()
@@ -677,6 +1198,150 @@ class TestPersistence:
 
         assert narrator.get_episode_count() == 3
 
+    def test_save_episodes_batch(self):
+        """Test persisting many episodes in one transaction."""
+        narrator = NarratorEngine()
+        episodes = [narrator.generate_observation_episode(f"Batch {i}") for i in range(4)]
+
+        assert narrator.save_episodes_batch(episodes) == 4
+        assert narrator.save_episodes_batch([]) == 0
+        assert narrator.get_episode_count() == 4
+
+        retrieved = narrator.get_episode(episodes[2].entry_id)
+        assert retrieved is not None
+        assert retrieved.narrative == episodes[2].narrative
+
+    def test_save_episodes_batch_packs_full_chunks_and_tail(self):
+        """Test batches larger than one multi-row INSERT keep every row."""
+        from bartholomew.kernel.narrator import EPISODE_BATCH_ROWS
+
+        narrator = NarratorEngine()
+        total = EPISODE_BATCH_ROWS * 2 + 3
+        episodes = [narrator.generate_observation_episode(f"Bulk {i}") for i in range(total)]
+
+        assert narrator.save_episodes_batch(episodes) == total
+        assert narrator.get_episode_count() == total
+        last = narrator.get_episode(episodes[-1].entry_id)
+        assert last is not None
+        assert last.narrative == episodes[-1].narrative
+
+    def test_save_episodes_batch_rolls_back_on_error(self):
+        """Test a failing batch leaves no partial rows behind."""
+        narrator = NarratorEngine()
+        episode = narrator.generate_observation_episode("Duplicate")
+
+        with pytest.raises(sqlite3.IntegrityError):
+            narrator.save_episodes_batch([episode, episode])
+
+        assert narrator.get_episode_count() == 0
+
+
+class TestWriteBehind:
+    """Tests for the opt-in write-behind episode writer."""
+
+    def test_write_behind_disabled_by_default(self):
+        """Test persist_episode writes synchronously unless configured."""
+        narrator = NarratorEngine(config=NarratorConfig(auto_subscribe=False))
+
+        assert narrator._writer is None
+
+    def test_write_behind_batches_and_flushes(self, tmp_path):
+        """Test queued episodes are committed in batches on flush."""
+        config = NarratorConfig(write_behind=True, write_batch_size=4, write_flush_interval_ms=50)
+        narrator = NarratorEngine(config=config, db_path=str(tmp_path / "wb.db"))
+        try:
+            episodes = [narrator.generate_observation_episode(f"Queued {i}") for i in range(10)]
+            for episode in episodes:
+                assert narrator.persist_episode(episode) == episode.entry_id
+
+            narrator.flush()
+
+            assert narrator.get_episode_count() == 10
+            assert narrator.get_episode(episodes[-1].entry_id) is not None
+        finally:
+            narrator.close()
+
+    def test_unsubscribe_flushes_pending_episodes(self, tmp_path):
+        """Test unsubscribing commits episodes queued by event handlers."""
+        from bartholomew.kernel.global_workspace import GlobalWorkspace
+
+        workspace = GlobalWorkspace()
+        config = NarratorConfig(write_behind=True, write_flush_interval_ms=5000)
+        narrator = NarratorEngine(
+            workspace=workspace,
+            config=config,
+            db_path=str(tmp_path / "unsub.db"),
+        )
+        try:
+            narrator.persist_episode(narrator.generate_observation_episode("Queued"))
+            narrator.unsubscribe_all()
+
+            assert narrator.get_episode_count() == 1
+        finally:
+            narrator.close()
+
+    def test_close_commits_pending_in_memory(self):
+        """Test close() drains the queue for the shared in-memory connection."""
+        config = NarratorConfig(write_behind=True, write_flush_interval_ms=1000)
+        narrator = NarratorEngine(config=config)
+
+        narrator.persist_episode(narrator.generate_observation_episode("Pending"))
+        narrator.close()
+
+        assert narrator.get_episode_count() == 1
+        # After close, writes fall back to the synchronous path
+        narrator.persist_episode(narrator.generate_observation_episode("Direct"))
+        assert narrator.get_episode_count() == 2
+
+
+class TestEventDebounce:
+    """Tests for opt-in coalescing of bursty affect/attention events."""
+
+    def _engine(self, window_ms):
+        from bartholomew.kernel.experience_kernel import ExperienceKernel
+        from bartholomew.kernel.global_workspace import GlobalWorkspace
+
+        workspace = GlobalWorkspace()
+        kernel = ExperienceKernel(workspace=workspace)
+        narrator = NarratorEngine(
+            experience_kernel=kernel,
+            workspace=workspace,
+            config=NarratorConfig(event_debounce_ms=window_ms),
+        )
+        return kernel, narrator
+
+    def test_burst_collapses_to_final_state(self):
+        """Test a burst of small affect ticks yields one episode for the whole move."""
+        kernel, narrator = self._engine(window_ms=10_000)
+        kernel.update_affect(valence=0.0, arousal=0.3, emotion="calm")
+        narrator.flush()
+        before = len(narrator.get_episodes_by_type(EpisodeType.AFFECT_SHIFT))
+
+        # Each tick is below the threshold, the burst as a whole is not
+        for step in range(1, 6):
+            kernel.update_affect(valence=0.1 * step, emotion=f"step-{step}")
+            kernel.set_attention(f"target-{step}", "task")
+        assert len(narrator.get_episodes_by_type(EpisodeType.AFFECT_SHIFT)) == before
+
+        narrator.flush()
+        affect = narrator.get_episodes_by_type(EpisodeType.AFFECT_SHIFT)
+        attention = narrator.get_episodes_by_type(EpisodeType.ATTENTION_FOCUS)
+        assert len(affect) == before + 1
+        assert affect[0].metadata["emotion"] == "step-5"
+        assert [e.metadata["target"] for e in attention] == ["target-5"]
+
+    def test_window_delivers_without_flush(self):
+        """Test the pending event is delivered when its window closes."""
+        kernel, narrator = self._engine(window_ms=20)
+        kernel.set_attention("timer target", "task")
+
+        timer = narrator._coalescers["attention"]._timer
+        if timer is not None:  # None if the window already closed
+            timer.join(timeout=5)
+
+        episodes = narrator.get_episodes_by_type(EpisodeType.ATTENTION_FOCUS)
+        assert [e.metadata["target"] for e in episodes] == ["timer target"]
+
 
 # =============================================================================
 # Test GlobalWorkspace Integration
@@ -744,6 +1409,39 @@ class TestWorkspaceIntegration:
         episodes = narrator.get_episodes_by_type(EpisodeType.AFFECT_SHIFT)
         assert len(episodes) >= 1
 
+    async def test_async_handlers_persist_off_loop(self, tmp_path):
+        """Test publish_async routes through async handlers when enabled."""
+        from bartholomew.kernel.global_workspace import EventType, GlobalWorkspace
+
+        workspace = GlobalWorkspace()
+        narrator = NarratorEngine(
+            workspace=workspace,
+            config=NarratorConfig(async_handlers=True),
+            db_path=str(tmp_path / "async.db"),
+        )
+
+        await workspace.publish_async(
+            channel="goals",
+            event_type=EventType.GOAL_ADDED,
+            source="test",
+            payload={"goal": "Write async tests"},
+        )
+
+        episodes = narrator.get_episodes_by_type(EpisodeType.GOAL_ADDED)
+        assert len(episodes) == 1
+        assert "Write async tests" in episodes[0].narrative
+
+    def test_async_handlers_disabled_by_default(self):
+        """Test narrator registers only sync callbacks by default."""
+        from bartholomew.kernel.global_workspace import GlobalWorkspace
+
+        workspace = GlobalWorkspace()
+        NarratorEngine(workspace=workspace)
+
+        subs = [sub for subs in workspace._subscriptions.values() for sub in subs]
+        assert subs
+        assert all(sub.async_callback is None for sub in subs)
+
     def test_attention_event_creates_episode(self):
         """Test that attention events auto-create episodes."""
         from bartholomew.kernel.experience_kernel import ExperienceKernel
@@ -824,6 +1522,33 @@ class TestWorkspaceIntegration:
         # Count should not have increased significantly
         assert final_count <= initial_count + 1
 
+    @pytest.mark.parametrize(
+        ("valence", "arousal", "expected"),
+        [
+            (0.30, 0.30, False),  # no change
+            (0.44, 0.16, False),  # both deltas inside the threshold
+            (0.46, 0.30, True),  # valence moved by at least the threshold
+            (0.30, 0.10, True),  # arousal dropped by at least the threshold
+        ],
+    )
+    def test_affect_threshold_per_axis(self, valence, arousal, expected):
+        """Test an affect episode needs either axis to move by the threshold."""
+        from bartholomew.kernel.global_workspace import EventType, WorkspaceEvent
+
+        narrator = NarratorEngine(config=NarratorConfig(min_affect_change_threshold=0.15))
+        event = WorkspaceEvent.create(
+            EventType.AFFECT_CHANGED,
+            channel="affect",
+            source="test",
+            payload={
+                "valence": valence,
+                "arousal": arousal,
+                "previous": {"valence": 0.30, "arousal": 0.30},
+            },
+        )
+
+        assert (narrator._affect_episode_for(event) is not None) is expected
+
 
 # =============================================================================
 # Test Reflection Narrative Generation
@@ -906,6 +1631,65 @@ class TestReflectionNarratives:
         assert "Goals set: 2" in narrative
         assert "Goals completed: 1" in narrative
 
+    def test_weekly_rollup_counts_and_first_narratives(self):
+        """Test the SQL rollup returns per-type counts and each type's first episode."""
+        narrator = NarratorEngine()
+        week_start = datetime(2026, 1, 5, tzinfo=timezone.utc)
+        specs = [
+            (3, narrator.generate_observation_episode("third")),
+            (1, narrator.generate_goal_added_episode(goal="first goal")),
+            (2, narrator.generate_observation_episode("second")),
+            (4, narrator.generate_goal_added_episode(goal="later goal")),
+            (9, narrator.generate_observation_episode("next week")),
+        ]
+        for day, episode in specs:
+            episode.timestamp = week_start + timedelta(days=day)
+        narrator.save_episodes_batch([episode for _, episode in specs])
+
+        rollup = narrator._type_rollup_between(week_start, week_start + timedelta(days=7))
+
+        assert [(t, n) for t, n, _ in rollup] == [
+            (EpisodeType.GOAL_ADDED, 2),
+            (EpisodeType.OBSERVATION, 2),
+        ]
+        assert "first goal" in rollup[0][2]
+        assert "second" in rollup[1][2]
+
+    def test_closed_range_reflections_cached_until_range_written(self):
+        """Test past reflections are cached and evicted when an episode lands in range."""
+        narrator = NarratorEngine()
+        day = datetime(2026, 1, 6, 12, 0, tzinfo=timezone.utc)
+        episode = narrator.generate_observation_episode("before")
+        episode.timestamp = day
+        narrator.persist_episode(episode)
+
+        daily = narrator.generate_daily_reflection_narrative(day)
+        week_start = datetime(2026, 1, 5, tzinfo=timezone.utc)
+        weekly = narrator.generate_weekly_reflection_narrative(week_start)
+        cached = narrator._conn.execute(
+            "SELECT kind, markdown FROM reflection_cache ORDER BY kind",
+        ).fetchall()
+        assert [tuple(row) for row in cached] == [("daily", daily), ("weekly", weekly)]
+        assert narrator.generate_daily_reflection_narrative(day) == daily
+
+        late = narrator.generate_observation_episode("late arrival")
+        late.timestamp = day + timedelta(hours=1)
+        narrator.persist_episode(late)
+
+        assert narrator._conn.execute("SELECT COUNT(*) FROM reflection_cache").fetchone()[0] == 0
+        assert "late arrival" in narrator.generate_daily_reflection_narrative(day)
+        assert "Total episodes: 2" in narrator.generate_daily_reflection_narrative(day)
+
+    def test_open_range_reflections_not_cached(self):
+        """Test today's and this week's reflections are always recomputed."""
+        narrator = NarratorEngine()
+        narrator.persist_episode(narrator.generate_observation_episode("now"))
+
+        narrator.generate_daily_reflection_narrative()
+        narrator.generate_weekly_reflection_narrative()
+
+        assert narrator._conn.execute("SELECT COUNT(*) FROM reflection_cache").fetchone()[0] == 0
+
 
 # =============================================================================
 # Test Singleton Pattern
@@ -1203,6 +1987,110 @@ class TestEpisodeFTSSearch:
         # (may be 0 if FTS not available)
         assert count >= 0
 
+    def test_fts_index_created_for_memory_and_existing_databases(self, tmp_path):
+        """Test the trigger-maintained index covers in-memory and pre-FTS databases."""
+        narrator = NarratorEngine()
+        narrator.persist_episode(narrator.generate_observation_episode("A robot in memory"))
+        assert narrator._conn.execute(
+            "SELECT COUNT(*) FROM episode_fts WHERE episode_fts MATCH 'robot'",
+        ).fetchone()[0] == 1
+
+        # A database populated before the FTS table existed is synced on open
+        db_path = str(tmp_path / "pre_fts.db")
+        with sqlite3.connect(db_path) as conn:
+            conn.executescript(NARRATOR_SCHEMA)
+            conn.execute(
+                "INSERT INTO episodic_entries (id, timestamp, episode_type, narrative, tone) "
+                "VALUES ('old-1', 0, 'observation', 'An old robot memory', 'neutral')",
+            )
+        conn.close()
+
+        narrator = NarratorEngine(db_path=db_path)
+        assert [e.entry_id for e in narrator.search_episodes("robot")] == ["old-1"]
+        assert narrator.rebuild_episode_fts() == 1
+
+    def test_bulk_ingest_rebuilds_fts_and_restores_triggers(self, tmp_path):
+        """Test bulk ingest defers FTS indexing but leaves search working."""
+        narrator = NarratorEngine(db_path=str(tmp_path / "bulk.db"))
+        episodes = [
+            narrator.generate_observation_episode(f"Imported robot memory {i}") for i in range(5)
+        ]
+
+        assert narrator.bulk_ingest_episodes(episodes) == 5
+        assert len(narrator.search_episodes("robot")) == 5
+
+        # Triggers are back, so regular inserts are indexed again
+        narrator.persist_episode(narrator.generate_observation_episode("A robot arrives"))
+        assert len(narrator.search_episodes("arrives")) == 1
+
+    def test_bulk_ingest_failed_rebuild_keeps_triggers(self, tmp_path, monkeypatch):
+        """Test a failing FTS rebuild rolls back the load and the trigger drop."""
+        from bartholomew.kernel import narrator as narrator_module
+
+        db_path = str(tmp_path / "bulk_fail.db")
+        narrator = NarratorEngine(db_path=db_path)
+        episodes = [narrator.generate_observation_episode("Imported robot memory")]
+
+        monkeypatch.setattr(
+            narrator_module,
+            "_REBUILD_EPISODE_FTS_SQL",
+            "INSERT INTO episode_fts(episode_fts) VALUES('no-such-command')",
+        )
+        with pytest.raises(sqlite3.OperationalError):
+            narrator.bulk_ingest_episodes(episodes)
+
+        with sqlite3.connect(db_path) as conn:
+            triggers = {
+                row[0]
+                for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type='trigger' AND name LIKE 'episode_fts_%'",
+                )
+            }
+            assert conn.execute("SELECT COUNT(*) FROM episodic_entries").fetchone()[0] == 0
+        conn.close()
+        assert triggers == {"episode_fts_insert", "episode_fts_update", "episode_fts_delete"}
+
+    def test_fts_update_trigger_only_tracks_narrative(self, tmp_path):
+        """Test non-narrative updates skip the FTS trigger; narrative edits reindex."""
+        db_path = str(tmp_path / "fts_update.db")
+        narrator = NarratorEngine(db_path=db_path)
+        episode = narrator.generate_observation_episode("Original robot text")
+        narrator.persist_episode(episode)
+
+        with sqlite3.connect(db_path) as conn:
+            sql = conn.execute(
+                "SELECT sql FROM sqlite_master WHERE name='episode_fts_update'",
+            ).fetchone()[0]
+            assert "UPDATE OF narrative" in sql
+
+            conn.execute(
+                "UPDATE episodic_entries SET narrative=? WHERE id=?",
+                ("Rewritten android text", episode.entry_id),
+            )
+        conn.close()
+
+        assert narrator.search_episodes("android")[0].entry_id == episode.entry_id
+
+    def test_search_episodes_free_text_uses_index(self):
+        """Test punctuation that is invalid MATCH syntax is searched as a phrase."""
+        narrator = NarratorEngine()
+        narrator.persist_episode(narrator.generate_observation_episode("a self-check passed"))
+        narrator.persist_episode(narrator.generate_observation_episode("a check of self"))
+
+        results = narrator.search_episodes("self-check")
+        assert [e.metadata["content"] for e in results] == ["a self-check passed"]
+
+        # Without the FTS table, the LIKE fallback still answers
+        narrator._conn.executescript(
+            "DROP TRIGGER episode_fts_insert; DROP TRIGGER episode_fts_update; "
+            "DROP TRIGGER episode_fts_delete; DROP TABLE episode_fts;",
+        )
+        results = narrator.search_episodes("self")
+        assert {e.metadata["content"] for e in results} == {
+            "a check of self",
+            "a self-check passed",
+        }
+
     def test_search_episodes_fts_unavailable_fallback(self):
         """Test that search falls back to LIKE when FTS unavailable."""
         # This test verifies the fallback works; FTS might not be
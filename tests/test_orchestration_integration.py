@@ -19,9 +19,9 @@ from identity_interpreter.orchestrator import (
 
 
 @pytest.fixture
-def orchestrator():
+def orchestrator(tmp_path):
     """Create a test orchestrator instance."""
-    return Orchestrator(log_dir="logs/orchestrator")
+    return Orchestrator(log_dir=str(tmp_path / "orchestrator"))
 
 
 @pytest.fixture
@@ -0,0 +1,49 @@
+"""
+Tests for the persona YAML loader cache.
+"""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from bartholomew.kernel import persona
+from bartholomew.kernel.persona import load_persona
+
+
+def test_load_persona_reuses_parse_until_file_changes(tmp_path, monkeypatch):
+    """Test unchanged files are parsed once and edits are picked up."""
+    path = tmp_path / "persona.yaml"
+    path.write_text("name: Bartholomew\ntraits: [kind, curious]\n", encoding="utf-8")
+    calls = []
+    real_load = persona.yaml.load
+    monkeypatch.setattr(
+        persona.yaml,
+        "load",
+        lambda *args, **kwargs: calls.append(1) or real_load(*args, **kwargs),
+    )
+
+    first = load_persona(str(path))
+    assert load_persona(str(path)) is first
+    assert len(calls) == 1
+
+    path.write_text("name: Barty\ntraits: [kind]\n", encoding="utf-8")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert load_persona(str(path))["name"] == "Barty"
+    assert len(calls) == 2
+
+
+def test_load_persona_result_is_read_only(tmp_path):
+    """Test the shared persona cannot be mutated by one caller."""
+    path = tmp_path / "persona.yaml"
+    path.write_text("style:\n  tone: warm\ntraits: [kind]\n", encoding="utf-8")
+
+    loaded = load_persona(str(path))
+
+    assert loaded["style"]["tone"] == "warm"
+    assert loaded["traits"] == ("kind",)
+    with pytest.raises(TypeError):
+        loaded["style"]["tone"] = "cold"
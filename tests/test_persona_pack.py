@@ -6,6 +6,13 @@ Stage 3.5: Persona Pack System Implementation
 
 from __future__ import annotations
 
+import math
+import os
+import sqlite3
+import sys
+import threading
+import time
+from dataclasses import replace
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -135,6 +142,20 @@ class TestEnums:
         assert Formality.PROFESSIONAL.value == "professional"
         assert Formality.FORMAL.value == "formal"
 
+    @pytest.mark.parametrize("brevity", list(Brevity))
+    def test_style_from_dict_resolves_every_member(self, brevity):
+        """from_dict maps each stored value back to the same enum member."""
+        style = StyleConfig.from_dict({"brevity": brevity.value, "formality": "formal"})
+        assert style.brevity is brevity
+        assert style.formality is Formality.FORMAL
+
+    def test_style_from_dict_rejects_unknown_values(self):
+        """Unknown enum values still raise ValueError."""
+        with pytest.raises(ValueError, match="Brevity"):
+            StyleConfig.from_dict({"brevity": "verbose"})
+        with pytest.raises(ValueError, match="Formality"):
+            StyleConfig.from_dict({"formality": ["casual"]})
+
 
 # =============================================================================
 # PersonaPack Tests
@@ -154,10 +175,17 @@ class TestPersonaPack:
         assert pack.pack_id == "test_pack"
         assert pack.name == "Test Pack"
         assert pack.description == "A test persona pack"
-        assert pack.tone == ["warm", "helpful"]  # Default
+        assert pack.tone == ("warm", "helpful")  # Default
         assert pack.archetype == "companion"  # Default
         assert pack.is_default is False  # Default
 
+    def test_persona_dataclasses_use_slots(self):
+        """Test persona dataclasses carry no per-instance __dict__."""
+        pack = PersonaPack(pack_id="slotted", name="Slotted", description="")
+
+        assert not hasattr(pack, "__dict__")
+        assert not hasattr(pack.style, "__dict__")
+
     def test_persona_pack_with_all_fields(self):
         """Test persona pack with all fields specified."""
         pack = PersonaPack(
@@ -175,11 +203,11 @@ class TestPersonaPack:
             version="2.0.0",
             is_default=False,
         )
-        assert pack.tone == ["precise", "urgent"]
+        assert pack.tone == ("precise", "urgent")
         assert pack.style.brevity == Brevity.CONCISE
         assert pack.drive_boosts["protect_user_wellbeing"] == 0.3
         assert "affect_shift" in pack.narrative_overrides
-        assert pack.auto_activate_on == ["gaming", "crisis"]
+        assert pack.auto_activate_on == ("gaming", "crisis")
         assert pack.archetype == "tactical"
         assert "Cortana" in pack.inspirations
         assert pack.author == "test_author"
@@ -219,11 +247,11 @@ class TestPersonaPack:
         }
         pack = PersonaPack.from_dict(data)
         assert pack.pack_id == "deser_pack"
-        assert pack.tone == ["patient", "soothing"]
+        assert pack.tone == ("patient", "soothing")
         assert pack.style.brevity == Brevity.EXPANDED
         assert pack.style.warmth == 0.95
         assert pack.drive_boosts["protect_user_wellbeing"] == 0.3
-        assert pack.auto_activate_on == ["wellness"]
+        assert pack.auto_activate_on == ("wellness",)
         assert pack.is_default is True
 
     def test_persona_pack_roundtrip(self):
@@ -243,6 +271,43 @@ class TestPersonaPack:
         assert restored.tone == original.tone
         assert restored.style.warmth == original.style.warmth
 
+    def test_persona_pack_is_frozen_with_interned_keywords(self, tmp_path):
+        """Packs are immutable, keyword lists become tuples, shared strings are interned."""
+        drive_id = "".join(["express_", "curiosity"])
+        pack = PersonaPack(
+            pack_id="frozen",
+            name="Frozen",
+            description="Immutable pack",
+            tone=["".join(["cur", "ious"])],
+            drive_boosts={drive_id: 0.2},
+            auto_activate_on=["gaming"],
+        )
+
+        assert pack.tone[0] is sys.intern("curious")
+        assert next(iter(pack.drive_boosts)) is sys.intern("express_curiosity")
+        with pytest.raises(AttributeError):
+            pack.is_default = True
+
+        path = tmp_path / "frozen.yaml"
+        pack.save_to_yaml(path)
+        restored = PersonaPack.load_from_yaml(path)
+        assert restored.tone == ("curious",)
+        assert restored.auto_activate_on == ("gaming",)
+
+    @pytest.mark.parametrize(
+        "raw",
+        ["2026-01-21T10:00:00+00:00", datetime(2026, 1, 21, 10, 0, tzinfo=timezone.utc)],
+    )
+    def test_from_dict_keeps_supplied_created_at(self, raw):
+        """Stored created_at values are kept; only missing ones are stamped now."""
+        pack = PersonaPack.from_dict({"pack_id": "dated", "created_at": raw})
+        assert pack.created_at == datetime(2026, 1, 21, 10, 0, tzinfo=timezone.utc)
+
+        before = datetime.now(timezone.utc)
+        for created_at in (None, ""):
+            stamped = PersonaPack.from_dict({"pack_id": "undated", "created_at": created_at})
+            assert stamped.created_at >= before
+
 
 class TestPersonaPackYAML:
     """Tests for PersonaPack YAML file operations."""
@@ -409,6 +474,42 @@ class TestPersonaPackManagerInit:
         # Default pack should be auto-activated
         assert manager.get_active_pack_id() == "test_auto_load"
 
+    def test_manager_reuses_json_sidecar_until_yaml_changes(self, tmp_path, monkeypatch):
+        """Test pack YAML is parsed once and re-read from its JSON sidecar."""
+        import yaml
+
+        from bartholomew.kernel import persona_pack
+
+        pack_file = tmp_path / "sidecar.yaml"
+        pack_file.write_text("pack_id: sidecar\nname: First\n", encoding="utf-8")
+        calls = []
+        real_load = persona_pack.yaml.load
+        monkeypatch.setattr(
+            persona_pack.yaml,
+            "load",
+            lambda *args, **kwargs: calls.append(1) or real_load(*args, **kwargs),
+        )
+
+        PersonaPackManager(packs_dir=tmp_path)
+        assert (tmp_path / "sidecar.yaml.json").exists()
+        assert PersonaPackManager(packs_dir=tmp_path).get_pack("sidecar").name == "First"
+        assert len(calls) == 1
+
+        pack_file.write_text("pack_id: sidecar\nname: Second\n", encoding="utf-8")
+        st = pack_file.stat()
+        os.utime(pack_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert PersonaPackManager(packs_dir=tmp_path).get_pack("sidecar").name == "Second"
+        assert len(calls) == 2
+
+        # YAML timestamps are not plain JSON, so such packs skip the sidecar
+        dated = tmp_path / "dated.yaml"
+        dated.write_text(
+            yaml.dump({"pack_id": "dated", "created_at": datetime(2026, 1, 1)}),
+            encoding="utf-8",
+        )
+        assert "dated" in PersonaPackManager(packs_dir=tmp_path).list_packs()
+        assert not (tmp_path / "dated.yaml.json").exists()
+
 
 class TestPersonaPackManagerRegistration:
     """Tests for PersonaPackManager pack registration."""
@@ -529,6 +630,11 @@ class TestPersonaPackManagerSwitching:
         assert "competitive" in history[0].context_tags
 
 
+def _trigger_pack(pack_id: str, tags: list[str]) -> PersonaPack:
+    """Minimal pack that auto-activates on ``tags``."""
+    return PersonaPack(pack_id=pack_id, name=pack_id, description="", auto_activate_on=tags)
+
+
 class TestPersonaPackManagerAutoActivation:
     """Tests for PersonaPackManager auto-activation."""
 
@@ -575,6 +681,24 @@ class TestPersonaPackManagerAutoActivation:
         switched = manager.auto_activate_if_needed(["gaming"])
         assert switched is False  # Already on tactical
 
+    def test_check_auto_activation_follows_registry_changes(self, tmp_path):
+        """Test the earliest registered match wins and unregistered packs drop out."""
+        manager = PersonaPackManager(packs_dir=tmp_path)
+        manager.register_pack(create_default_pack())
+        manager.register_pack(_trigger_pack("first", ["x"]))
+        manager.register_pack(_trigger_pack("second", ["y", "x"]))
+
+        assert manager.check_auto_activation(["y", "x"]) == "first"
+        assert manager.check_auto_activation(["y"]) == "second"
+
+        assert manager.unregister_pack("first") is True
+        assert manager.check_auto_activation(["x"]) == "second"
+
+        # Re-registering replaces the pack's triggers
+        manager.register_pack(_trigger_pack("second", ["z"]))
+        assert manager.check_auto_activation(["x", "y"]) is None
+        assert manager.check_auto_activation(["z"]) == "second"
+
 
 class TestPersonaPackManagerCallbacks:
     """Tests for PersonaPackManager callbacks."""
@@ -635,6 +759,29 @@ class TestPersonaPackManagerCallbacks:
         manager.switch_pack("tactical")
         assert len(calls) == 0  # Callback was removed
 
+    def test_callback_removing_itself_does_not_skip_others(self, tmp_path):
+        """A callback that unregisters during a switch doesn't skip the next one."""
+        manager = PersonaPackManager(packs_dir=tmp_path)
+        manager.register_pack(create_default_pack())
+        manager.register_pack(create_tactical_pack())
+
+        calls = []
+
+        def once(f, t):
+            calls.append("once")
+            manager.remove_switch_callback(once)
+
+        def always(f, t):
+            calls.append("always")
+
+        manager.on_switch(once)
+        manager.on_switch(always)
+
+        manager.switch_pack("tactical")
+        manager.switch_pack("default")
+        assert calls == ["once", "always", "always"]
+        assert manager.remove_switch_callback(once) is False
+
     def test_callback_error_doesnt_break_switch(self, tmp_path):
         """Test that callback errors don't break the switch."""
         manager = PersonaPackManager(packs_dir=tmp_path)
@@ -686,6 +833,149 @@ class TestPersonaPackManagerHistory:
         history = manager.get_switch_history(limit=2)
         assert len(history) == 2
 
+    def test_switch_log_file_database_uses_wal(self, tmp_path):
+        """File-backed switch logs run in WAL mode and read back history."""
+        db_path = tmp_path / "switches.db"
+        manager = PersonaPackManager(packs_dir=tmp_path, db_path=str(db_path))
+        manager.register_pack(create_default_pack())
+        manager.register_pack(create_tactical_pack())
+
+        manager.switch_pack("tactical")
+        manager.switch_pack("default")
+
+        with sqlite3.connect(db_path) as conn:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+        assert manager.get_switch_count() == 2
+        assert [r.to_pack_id for r in manager.get_switch_history()] == ["default", "tactical"]
+
+    def test_switch_log_connection_reused_per_thread(self, tmp_path):
+        """File-backed switch logs keep one connection per thread until close()."""
+        manager = PersonaPackManager(packs_dir=tmp_path, db_path=str(tmp_path / "log.db"))
+        manager.register_pack(create_default_pack())
+        manager.register_pack(create_tactical_pack())
+        manager.switch_pack("tactical")
+
+        conn = manager._get_connection()
+        assert manager._get_connection() is conn
+        assert manager.get_switch_count() == 1
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(manager._get_connection()))
+        thread.start()
+        thread.join()
+        assert other[0] is not conn
+
+        manager.close()
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+        assert manager.get_switch_history()[0].to_pack_id == "tactical"
+
+    def test_flush_switch_records_batches_in_one_transaction(self, tmp_path):
+        """Batched switch records land together, or not at all on conflict."""
+        manager = PersonaPackManager(packs_dir=tmp_path, db_path=str(tmp_path / "log.db"))
+        records = [
+            PersonaSwitchRecord(
+                record_id=f"rec-{i}",
+                timestamp=datetime(2026, 1, 21, 10, i, tzinfo=timezone.utc),
+                from_pack_id="default",
+                to_pack_id="tactical",
+                trigger="auto",
+                context_tags=["gaming"],
+                metadata={"n": i},
+            )
+            for i in range(5)
+        ]
+
+        assert manager.flush_switch_records([]) == 0
+        assert manager.flush_switch_records(records) == 5
+        assert manager.get_switch_count() == 5
+        assert manager.get_switch_history(limit=1)[0].metadata == {"n": 4}
+
+        with pytest.raises(sqlite3.IntegrityError):
+            manager.flush_switch_records([replace(records[0], record_id="rec-new"), records[1]])
+        assert manager.get_switch_count() == 5
+
+    def test_switch_log_batching_buffers_until_full_or_read(self, tmp_path):
+        """Batched switch logging writes full batches, and reads see buffered switches."""
+        db_path = tmp_path / "log.db"
+        manager = PersonaPackManager(
+            packs_dir=tmp_path,
+            db_path=str(db_path),
+            switch_log_batch_size=3,
+        )
+        manager.register_pack(create_default_pack())
+        manager.register_pack(create_tactical_pack())
+
+        def stored() -> int:
+            with sqlite3.connect(db_path) as conn:
+                return conn.execute("SELECT COUNT(*) FROM persona_switch_log").fetchone()[0]
+
+        manager.switch_pack("tactical")
+        manager.switch_pack("default")
+        assert stored() == 0
+
+        manager.switch_pack("tactical")
+        assert stored() == 3
+
+        manager.switch_pack("default")
+        assert manager.get_switch_count() == 4
+        assert stored() == 4
+
+        manager.switch_pack("tactical")
+        manager.close()
+        assert stored() == 5
+
+    def test_switch_log_async_writes_in_background(self, tmp_path):
+        """Async switch logging commits off-thread; reads and close() wait for it."""
+        db_path = tmp_path / "log.db"
+        manager = PersonaPackManager(
+            packs_dir=tmp_path,
+            db_path=str(db_path),
+            switch_log_async=True,
+        )
+        manager.register_pack(create_default_pack())
+        manager.register_pack(create_tactical_pack())
+
+        def stored() -> int:
+            with sqlite3.connect(db_path) as conn:
+                count = conn.execute("SELECT COUNT(*) FROM persona_switch_log").fetchone()[0]
+            conn.close()
+            return count
+
+        manager.switch_pack("tactical")
+        deadline = time.monotonic() + 5
+        while stored() == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert stored() == 1
+
+        manager.switch_pack("default")
+        manager.switch_pack("tactical")
+        assert [r.to_pack_id for r in manager.get_switch_history()] == [
+            "tactical",
+            "default",
+            "tactical",
+        ]
+
+        manager.switch_pack("default")
+        writer = manager._log_writer
+        join = writer.join
+
+        def join_then_switch(*args, **kwargs):
+            # A switch racing close() after the writer has stopped
+            join(*args, **kwargs)
+            manager.switch_pack("tactical")
+
+        writer.join = join_then_switch
+        manager.close()
+        assert not writer.is_alive()
+        assert stored() == 5
+
+    def test_switch_log_async_ignored_for_memory_db(self, tmp_path):
+        """In-memory switch logs stay synchronous."""
+        manager = PersonaPackManager(packs_dir=tmp_path, switch_log_async=True)
+        assert manager._log_writer is None
+
     def test_get_switch_count(self, tmp_path):
         """Test getting total switch count."""
         manager = PersonaPackManager(packs_dir=tmp_path)
@@ -700,6 +990,101 @@ class TestPersonaPackManagerHistory:
         manager.switch_pack("default")
         assert manager.get_switch_count() == 2
 
+    def test_iter_switch_history_streams_most_recent_first(self, tmp_path):
+        """Iterating history yields the same records as the list, lazily."""
+        manager = PersonaPackManager(packs_dir=tmp_path, db_path=str(tmp_path / "log.db"))
+        manager.register_pack(create_default_pack())
+        manager.register_pack(create_tactical_pack())
+        for _ in range(3):
+            manager.switch_pack("tactical")
+            manager.switch_pack("default")
+
+        records = manager.iter_switch_history(limit=10)
+        newest = next(records)
+        assert newest.to_pack_id == "default"
+        records.close()
+
+        history = manager.get_switch_history(limit=10)
+        assert [r.record_id for r in history] == [
+            r.record_id for r in manager.iter_switch_history(limit=10)
+        ]
+        assert history[0].record_id == newest.record_id
+        assert len(history) == 6
+
+    def test_switch_history_query_walks_timestamp_index(self, tmp_path):
+        """The history query reads the timestamp index instead of sorting."""
+        from bartholomew.kernel import persona_pack
+
+        db_path = tmp_path / "log.db"
+        PersonaPackManager(packs_dir=tmp_path, db_path=str(db_path)).close()
+
+        with sqlite3.connect(db_path) as conn:
+            plan = " ".join(
+                row[-1]
+                for row in conn.execute(
+                    "EXPLAIN QUERY PLAN " + persona_pack._SELECT_SWITCH_HISTORY_SQL,
+                    (20,),
+                )
+            )
+        assert "idx_persona_switch_timestamp" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_legacy_iso_switch_timestamps_migrated_to_micros(self, tmp_path):
+        """A switch log with TEXT timestamps is rebuilt with epoch micros."""
+        db_path = tmp_path / "log.db"
+        with sqlite3.connect(db_path) as conn:
+            conn.executescript(
+                """
+                CREATE TABLE persona_switch_log (
+                    id TEXT PRIMARY KEY,
+                    timestamp TEXT NOT NULL,
+                    from_pack_id TEXT,
+                    to_pack_id TEXT NOT NULL,
+                    trigger TEXT NOT NULL,
+                    context_tags_json TEXT,
+                    metadata_json TEXT,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                );
+                CREATE INDEX idx_persona_switch_timestamp
+                ON persona_switch_log(timestamp DESC);
+                INSERT INTO persona_switch_log
+                    (id, timestamp, from_pack_id, to_pack_id, trigger)
+                VALUES ('old', '2024-05-01T12:30:00.250000+00:00', NULL, 'default', 'manual');
+                """,
+            )
+        conn.close()
+
+        manager = PersonaPackManager(packs_dir=tmp_path, db_path=str(db_path))
+        manager.register_pack(create_default_pack())
+        manager.register_pack(create_tactical_pack())
+        manager.switch_pack("tactical")
+
+        history = manager.get_switch_history()
+        assert [r.to_pack_id for r in history] == ["tactical", "default"]
+        assert history[1].timestamp == datetime(2024, 5, 1, 12, 30, 0, 250000, tzinfo=timezone.utc)
+        manager.close()
+
+        with sqlite3.connect(db_path) as conn:
+            types = {
+                row[0] for row in conn.execute("SELECT typeof(timestamp) FROM persona_switch_log")
+            }
+        conn.close()
+        assert types == {"integer"}
+
+    def test_switch_metadata_round_trips_like_stdlib_json(self, tmp_path):
+        """Metadata stdlib json accepts (int keys, huge ints, NaN) survives the log."""
+        db_path = tmp_path / "log.db"
+        manager = PersonaPackManager(packs_dir=tmp_path, db_path=str(db_path))
+        manager.register_pack(create_default_pack())
+        manager.register_pack(create_tactical_pack())
+
+        manager.switch_pack("tactical", metadata={1: "one", "big": 2**70})
+        assert manager.get_switch_history()[0].metadata == {"1": "one", "big": 2**70}
+
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("UPDATE persona_switch_log SET metadata_json = '{\"score\": NaN}'")
+        assert math.isnan(manager.get_switch_history()[0].metadata["score"])
+
 
 class TestPersonaPackManagerNarrativeIntegration:
     """Tests for PersonaPackManager narrative integration."""
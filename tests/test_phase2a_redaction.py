@@ -2,10 +2,14 @@
 Tests for Phase 2a: Redaction, Encryption Routing, and Summarization
 """
 
+import logging
+
 import pytest
 
+from bartholomew.kernel import redaction_engine
 from bartholomew.kernel.memory_rules import MemoryRulesEngine
 from bartholomew.kernel.redaction_engine import (
+    RedactionRuleset,
     apply_redaction,
     mask_sensitive,
     remove_sensitive,
@@ -93,6 +97,55 @@ class TestRedactionEngine:
         result = apply_redaction(text, rule)
         assert result == text
 
+    def test_invalid_regex_logged_once(self, caplog):
+        """Test a bad pattern is compiled and reported only once"""
+        rule = {"content": r"(unclosed-once", "redact_strategy": "remove"}
+        with caplog.at_level(logging.ERROR, logger="bartholomew.kernel.redaction_engine"):
+            for _ in range(3):
+                assert apply_redaction("keep me", rule) == "keep me"
+        assert len(caplog.records) == 1
+
+    def test_compiled_pattern_shared_across_strategies(self):
+        """Test mask, remove and replace reuse one compiled pattern"""
+        redaction_engine._compile.cache_clear()
+        pattern = r"secret-\d+"
+        assert mask_sensitive("a secret-1", pattern) == "a ****"
+        assert remove_sensitive("a SECRET-2", pattern) == "a "
+        assert replace_sensitive("a secret-3", pattern, "[X]") == "a [X]"
+        info = redaction_engine._compile.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+
+    def test_ruleset_applies_all_strategies_in_one_pass(self):
+        """Test a combined ruleset matches applying each rule in turn"""
+        rules = [
+            {"content": r"\d{3}-\d{2}-\d{4}", "redact_strategy": "mask"},
+            {"content": r"token=\w+", "redact_strategy": "remove"},
+            {"content": r"password", "redact_strategy": "replace:[REDACTED]"},
+            {"content": r"[invalid(regex", "redact_strategy": "mask"},
+            {"content": r"ignored", "redact_strategy": "bogus"},
+        ]
+        text = "SSN 123-45-6789, Password ok, token=abc123 ignored"
+
+        expected = text
+        for rule in rules:
+            expected = apply_redaction(expected, rule)
+
+        ruleset = RedactionRuleset(rules)
+        assert ruleset.pattern is not None
+        assert ruleset.apply(text) == expected == "SSN ****, [REDACTED] ok,  ignored"
+
+    def test_ruleset_falls_back_when_patterns_clash(self):
+        """Test rules that cannot share one pattern still all apply"""
+        ruleset = RedactionRuleset(
+            [
+                {"content": r"(?P<id>a+)", "redact_strategy": "mask"},
+                {"content": r"(?P<id>b+)", "redact_strategy": "remove"},
+            ],
+        )
+        assert ruleset.pattern is None
+        assert ruleset.apply("aab-c") == "****-c"
+        assert RedactionRuleset([]).apply("untouched") == "untouched"
+
 
 class TestMemoryRulesEnrichment:
     """Test memory rules engine enrichment with Phase 2a fields"""
@@ -98,6 +98,29 @@ class TestSummarizationEngine:
         assert len(summary) <= 53  # 50 + "..."
         assert summary.endswith("...")
 
+    def test_summarize_memoizes_repeated_content(self, monkeypatch):
+        """Repeated content is summarized once and served from the cache"""
+        engine = SummarizationEngine()
+        calls = []
+        original = engine._summarize_uncached
+
+        def counting(value, target):
+            calls.append(value)
+            return original(value, target)
+
+        monkeypatch.setattr(engine, "_summarize_uncached", counting)
+
+        value = "This is a sentence in a long document. " * 30
+        first = engine.summarize(value)
+        second = engine.summarize(value)
+
+        assert first == second
+        assert len(calls) == 1
+
+        # A different target length is a different summary
+        engine.summarize(value, target_length=200)
+        assert len(calls) == 2
+
 
 class TestMemoryStoreIntegration:
     """Integration tests with kernel memory store"""
@@ -367,6 +390,148 @@ class TestMemoryStoreIntegration:
 
         assert "summary" in column_names
 
+    @pytest.mark.asyncio
+    async def test_failed_summary_migration_is_retried(self, tmp_path, monkeypatch):
+        """A failing ALTER propagates and leaves user_version unbumped"""
+        import sqlite3
+
+        import aiosqlite
+
+        from bartholomew.kernel.memory_store import SCHEMA_VERSION, MemoryStore
+
+        db_path = str(tmp_path / "test.db")
+        async with aiosqlite.connect(db_path) as db:
+            await db.execute(
+                "CREATE TABLE memories (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "kind TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, ts TEXT NOT NULL)",
+            )
+            await db.commit()
+
+        real_execute = aiosqlite.Connection.execute
+
+        def locked_alter(self, sql, *args, **kwargs):
+            if "ADD COLUMN summary" in sql:
+                raise sqlite3.OperationalError("database is locked")
+            return real_execute(self, sql, *args, **kwargs)
+
+        store = MemoryStore(db_path)
+        monkeypatch.setattr(aiosqlite.Connection, "execute", locked_alter)
+        with pytest.raises(sqlite3.OperationalError):
+            await store.init()
+        monkeypatch.setattr(aiosqlite.Connection, "execute", real_execute)
+
+        await store.init()
+        async with aiosqlite.connect(db_path) as db:
+            cursor = await db.execute("PRAGMA table_info(memories)")
+            column_names = [col[1] for col in await cursor.fetchall()]
+            cursor = await db.execute("PRAGMA user_version")
+            version = (await cursor.fetchone())[0]
+
+        assert "summary" in column_names
+        assert version == SCHEMA_VERSION
+
+    @pytest.mark.asyncio
+    async def test_schema_version_recorded_after_init(self, tmp_path):
+        """init() stamps PRAGMA user_version so later starts skip migrations"""
+        import aiosqlite
+
+        from bartholomew.kernel.memory_store import SCHEMA_VERSION, MemoryStore
+
+        db_path = str(tmp_path / "test.db")
+        store = MemoryStore(db_path)
+        await store.init()
+        # Second init on an up-to-date database must be a no-op
+        await store.init()
+
+        async with aiosqlite.connect(db_path) as db:
+            cursor = await db.execute("PRAGMA user_version")
+            version = (await cursor.fetchone())[0]
+
+        assert version == SCHEMA_VERSION
+
+    @pytest.mark.asyncio
+    async def test_consent_table_migrated_to_without_rowid(self, tmp_path):
+        """Legacy rowid memory_consent tables are rebuilt and keep their rows"""
+        import sqlite3
+
+        from bartholomew.kernel.memory_store import MemoryStore
+
+        db_path = str(tmp_path / "legacy.db")
+        conn = sqlite3.connect(db_path)
+        conn.executescript(
+            """
+            CREATE TABLE memories (
+              id INTEGER PRIMARY KEY AUTOINCREMENT,
+              kind TEXT NOT NULL, key TEXT NOT NULL,
+              value TEXT NOT NULL, summary TEXT, ts TEXT NOT NULL
+            );
+            CREATE TABLE memory_consent (
+              memory_id INTEGER PRIMARY KEY,
+              consent_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+              source TEXT,
+              FOREIGN KEY(memory_id) REFERENCES memories(id) ON DELETE CASCADE
+            );
+            INSERT INTO memories(kind, key, value, ts) VALUES ('fact', 'k', 'v', 't');
+            INSERT INTO memory_consent(memory_id, source) VALUES (1, 'legacy');
+            """,
+        )
+        conn.close()
+
+        await MemoryStore(db_path).init()
+
+        conn = sqlite3.connect(db_path)
+        sql = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name='memory_consent'",
+        ).fetchone()[0]
+        rows = conn.execute("SELECT memory_id, source FROM memory_consent").fetchall()
+        conn.close()
+
+        assert "WITHOUT ROWID" in sql
+        assert rows == [(1, "legacy")]
+
+    @pytest.mark.asyncio
+    async def test_batch_upsert_matches_single_upsert(self, tmp_path):
+        """upsert_memories stores and summarizes every item in one call"""
+        import aiosqlite
+
+        from bartholomew.kernel.memory_store import MemoryStore
+
+        db_path = str(tmp_path / "test.db")
+        store = MemoryStore(db_path)
+        await store.init()
+
+        long_value = "This is a very long conversation transcript. " * 30
+        results = await store.upsert_memories(
+            [
+                {
+                    "kind": "conversation.transcript",
+                    "key": "chat_a",
+                    "value": long_value,
+                    "ts": "2024-01-01T00:00:00Z",
+                },
+                {
+                    "kind": "conversation.transcript",
+                    "key": "chat_b",
+                    "value": "Brief chat message",
+                    "ts": "2024-01-01T00:00:01Z",
+                },
+            ],
+        )
+
+        assert [r.stored for r in results] == [True, True]
+        assert results[0].memory_id != results[1].memory_id
+
+        async with aiosqlite.connect(db_path) as db:
+            cursor = await db.execute(
+                "SELECT key, value, summary FROM memories ORDER BY key",
+            )
+            rows = await cursor.fetchall()
+
+        assert [row[0] for row in rows] == ["chat_a", "chat_b"]
+        assert rows[0][1] == long_value
+        assert rows[0][2] is not None
+        assert rows[1][2] is None
+
 
 class TestYAMLRulesIntegration:
     """Test summarization rules from YAML configuration"""
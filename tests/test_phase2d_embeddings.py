@@ -152,6 +152,85 @@ class TestVectorStore:
         assert len(results) == 1
         assert results[0][0] == mem1_id
 
+    def test_float16_storage_roundtrip(self, tmp_path):
+        """float16 rows take half the space and still rank correctly"""
+        import sqlite3
+
+        from tests.helpers import connect_test_db, create_minimal_memories_table, insert_test_memory
+
+        db_path = str(tmp_path / "test.db")
+
+        conn = connect_test_db(db_path)
+        create_minimal_memories_table(conn)
+        mem1_id = insert_test_memory(conn, kind="test", key="key1")
+        mem2_id = insert_test_memory(conn, kind="test", key="key2")
+        conn.close()
+
+        store = VectorStore(db_path)
+
+        vec1 = np.random.randn(384).astype(np.float32)
+        vec1 = vec1 / np.linalg.norm(vec1)
+        vec2 = np.random.randn(384).astype(np.float32)
+        vec2 = vec2 / np.linalg.norm(vec2)
+
+        store.upsert(mem1_id, vec1, "summary", "local-sbert", "test", dtype="float16")
+        store.upsert(mem2_id, vec2, "summary", "local-sbert", "test")
+
+        with sqlite3.connect(db_path) as conn:
+            sizes = dict(
+                conn.execute("SELECT memory_id, length(vec) FROM memory_embeddings").fetchall(),
+            )
+        assert sizes[mem1_id] == 384 * 2
+        assert sizes[mem2_id] == 384 * 4
+
+        results = store.search(vec1, top_k=2, apply_consent_gate=False)
+        assert results[0][0] == mem1_id
+        assert results[0][1] > 0.99
+
+    def test_vss_rows_reencode_float16(self, tmp_path):
+        """rebuild-vss selects float16 rows as float32 BLOBs for vss0"""
+        import sqlite3
+
+        from bartholomew.kernel.vector_store import iter_vss_rows
+        from tests.helpers import connect_test_db, create_minimal_memories_table, insert_test_memory
+
+        db_path = str(tmp_path / "test.db")
+
+        conn = connect_test_db(db_path)
+        create_minimal_memories_table(conn)
+        mem1_id = insert_test_memory(conn, kind="test", key="key1")
+        mem2_id = insert_test_memory(conn, kind="test", key="key2")
+        conn.close()
+
+        store = VectorStore(db_path)
+
+        vec1 = np.random.randn(384).astype(np.float32)
+        vec1 = vec1 / np.linalg.norm(vec1)
+        vec2 = np.random.randn(384).astype(np.float32)
+        vec2 = vec2 / np.linalg.norm(vec2)
+
+        store.upsert(mem1_id, vec1, "summary", "local-sbert", "test", dtype="float16")
+        store.upsert(mem2_id, vec2, "summary", "local-sbert", "test")
+
+        with sqlite3.connect(db_path) as conn:
+            ids = dict(conn.execute("SELECT memory_id, embedding_id FROM memory_embeddings"))
+            rows = dict(iter_vss_rows(conn, 384))
+
+        assert len(rows) == 2
+        assert all(len(blob) == 384 * 4 for blob in rows.values())
+        np.testing.assert_allclose(
+            np.frombuffer(rows[ids[mem1_id]], dtype=np.float32), vec1, atol=1e-3
+        )
+        assert rows[ids[mem2_id]] == vec2.tobytes()
+
+    def test_upsert_rejects_unknown_dtype(self, tmp_path):
+        """Only float32 and float16 storage are supported"""
+        store = VectorStore(str(tmp_path / "test.db"))
+        vec = np.ones(4, dtype=np.float32)
+
+        with pytest.raises(ValueError):
+            store.upsert(1, vec, "summary", "local-sbert", "test", dtype="int8")
+
 
 class TestMemoryStoreIntegration:
     """Integration with kernel memory store"""
@@ -467,6 +546,99 @@ class TestLifecycleMethods:
             memory_rules._rules_engine.evaluate = original_evaluate
             monkeypatch.delenv("BARTHO_EMBED_ENABLED", raising=False)
 
+    @pytest.mark.asyncio
+    async def test_persist_embeddings_batch(self, tmp_path, monkeypatch):
+        """Batch promotion persists embeddings for every memory"""
+        from bartholomew.kernel import memory_rules
+        from bartholomew.kernel.memory_store import MemoryStore
+        from bartholomew.kernel.vector_store import VectorStore
+
+        monkeypatch.setenv("BARTHO_EMBED_ENABLED", "1")
+
+        embed_store = {"value": False}
+
+        def mock_evaluate(memory_dict):
+            return {
+                "allow_store": True,
+                "embed": "summary",
+                "embed_store": embed_store["value"],
+                "kind": memory_dict.get("kind"),
+                "key": memory_dict.get("key"),
+                "content": memory_dict.get("value"),
+                "matched_categories": [],
+                "matched_rules": [],
+            }
+
+        monkeypatch.setattr(memory_rules._rules_engine, "evaluate", mock_evaluate)
+
+        db_path = str(tmp_path / "test.db")
+        store = MemoryStore(db_path)
+        await store.init()
+
+        memory_ids = []
+        for i in range(3):
+            result = await store.upsert_memory(
+                kind="test",
+                key=f"batch{i}",
+                value=f"Batch content {i}. " * 20,
+                ts="2024-01-01T00:00:00Z",
+            )
+            memory_ids.append(result.memory_id)
+
+        vec_store = VectorStore(db_path)
+        assert vec_store.count() == 0
+
+        embed_store["value"] = True
+        count = await store.persist_embeddings_batch(memory_ids, max_concurrent=2)
+
+        assert count == 3
+        assert vec_store.count() == 3
+
+    @pytest.mark.asyncio
+    async def test_persist_embeddings_batch_concurrent_writers(self, tmp_path, monkeypatch):
+        """Overlapping consent commits and vector writes don't lock each other out"""
+        from bartholomew.kernel import memory_rules
+        from bartholomew.kernel.memory_store import MemoryStore
+        from bartholomew.kernel.vector_store import VectorStore
+
+        monkeypatch.setenv("BARTHO_EMBED_ENABLED", "1")
+
+        embed_store = {"value": False}
+
+        def mock_evaluate(memory_dict):
+            return {
+                "allow_store": True,
+                "embed": "summary",
+                "embed_store": embed_store["value"],
+                "kind": memory_dict.get("kind"),
+                "key": memory_dict.get("key"),
+                "content": memory_dict.get("value"),
+                "matched_categories": [],
+                "matched_rules": [],
+            }
+
+        monkeypatch.setattr(memory_rules._rules_engine, "evaluate", mock_evaluate)
+
+        db_path = str(tmp_path / "test.db")
+        store = MemoryStore(db_path)
+        await store.init()
+
+        memory_ids = []
+        for i in range(20):
+            result = await store.upsert_memory(
+                kind="test",
+                key=f"sweep{i}",
+                value=f"Sweep content {i}. " * 20,
+                ts="2024-01-01T00:00:00Z",
+            )
+            memory_ids.append(result.memory_id)
+
+        embed_store["value"] = True
+        count = await store.persist_embeddings_batch(memory_ids, max_concurrent=8)
+
+        assert count == 20
+        assert VectorStore(db_path).count() == 20
+
     @pytest.mark.asyncio
     async def test_reembed_memory_replaces_vectors(self, tmp_path, monkeypatch):
         """Re-embed replaces existing vectors"""